@@ -1,22 +1,116 @@
 import random
 import math
+import numpy as np
 import pygame
 
+from snapshot import WorldSnapshot
+
 
 class SimpleAI:
-    def __init__(self, player, obstacles, power_ups, screen_width=800, screen_height=600):
+    # Constantes de réglage, remplaçables par paramètre (params=...) ; voir tournament.py
+    PARAMETERS = {
+        "immediate_window": 1.0,  # danger immédiat : collision dans moins de ... s
+        "near_window": 3.0,  # danger proche sur la trajectoire
+        "side_window": 4.0,  # danger proche à côté de la trajectoire
+        "look_ahead": 100,  # largeur (px) testée par is_side_clear
+        "trajectory_margin": 20,  # marge (px) de is_near_trajectory
+        "power_up_values": {"shield": 5, "speed": 3, "points": 1},
+        "power_up_min_value": 2,  # valeur minimale pour aller chercher un power-up
+        "shield_need": 2.0,  # multiplicateur quand le bouclier va manquer
+        "speed_need": 1.5,  # multiplicateur quand la vitesse va manquer
+    }
+
+    def __init__(
+        self,
+        player,
+        obstacles,
+        power_ups,
+        screen_width=800,
+        screen_height=600,
+        step_scale=1,
+        rng=random,
+        decision_rate=None,
+        params=None,
+    ):
+        unknown = set(params or ()) - set(self.PARAMETERS)
+        if unknown:
+            raise ValueError(f"paramètres IA inconnus : {', '.join(sorted(unknown))}")
+        for name, value in {**self.PARAMETERS, **(params or {})}.items():
+            setattr(self, name, value)
         self.player = player
         self.obstacles = obstacles
         self.power_ups = power_ups
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.step_scale = step_scale  # fraction d'une frame à 60 Hz simulée par tick
+        self.decision_rate = decision_rate  # décisions par seconde (None : à chaque tick)
+        self.rng = rng  # random.Random propre à la partie pour rejouer les décisions
         self.last_direction = None
         self.escape_attempts = 0
         self.debug_line = None  # kept for compatibility with game.py drawing
-
-    def make_decision(self):
-        # Mettre à jour la position du joueur pour l'IA
-        player_rect = self.player.get_rect()
+        self.snapshot = None  # WorldSnapshot du tick, partagé par Game.update
+        self.state = player  # joueur lu par les décisions (PlayerState figé hors du thread principal)
+        self.action = None  # action choisie par la dernière décision
+        self._pinned = None
+        self._scan_key = None
+        self._scan = None
+        # rectangles de travail réutilisés d'une décision à l'autre
+        self._check_rect = pygame.Rect(0, 0, 0, 0)
+        self._path_rect = pygame.Rect(0, 0, 0, 0)
+
+    def reset(self, rng=None):
+        """Nouvelle partie : oublie l'état des décisions (les listes du jeu sont gardées)."""
+        if rng is not None:
+            self.rng = rng
+        self.last_direction = None
+        self.escape_attempts = 0
+        self.debug_line = None
+        self.snapshot = None
+        self.state = self.player
+        self.action = None
+        self._scan_key = None
+        self._scan = None
+
+    def make_decision(self, snapshot=None):
+        # snapshot : instantané du monde partagé par toutes les IA pour ce tick
+        self.apply(self.decide(snapshot))
+
+    def decide(self, snapshot=None, state=None):
+        """Choisit l'action du tick sans déplacer le joueur.
+
+        Avec state (PlayerState) et un instantané copié, la décision ne lit
+        rien de l'état vivant du jeu et peut tourner sur un autre thread.
+        """
+        if snapshot is not None:
+            self.snapshot = snapshot
+        self._pinned = snapshot
+        self.state = state if state is not None else self.player
+        self.action = None
+        try:
+            self._choose()
+        finally:
+            self._pinned = None
+        return self.action
+
+    def apply(self, action):
+        """Applique au joueur une action rendue par decide()."""
+        if action is None:
+            return
+        if action in ("left", "right"):
+            step = self.player.speed * self.step_scale
+        else:
+            step = 2 * self.step_scale
+        if action in ("left", "small_left"):
+            if self.player.x > step:
+                self.player.x -= step
+                if action == "left":
+                    self.last_direction = "left"
+        elif self.player.x < self.screen_width - self.player.width - step:
+            self.player.x += step
+            if action == "right":
+                self.last_direction = "right"
+
+    def _choose(self):
         self.debug_line = None
 
         # 1. Détection des dangers IMMÉDIATS
@@ -51,65 +145,100 @@ class SimpleAI:
 
     def find_immediate_dangers(self):
         """Trouve les obstacles qui vont collisionner dans moins de 1 seconde"""
-        immediate_dangers = []
-        player_rect = self.player.get_rect()
-
-        for obstacle in self.obstacles:
-            # Calculer le temps avant collision
-            time_to_collision = self.calculate_time_to_collision(obstacle)
-
-            # Vérifier si collision imminente
-            will_collide = self.will_collide(obstacle, player_rect)
+        player_rect = self.state.get_rect()
+        danger = self._danger_map()
+        if danger is not None and not danger.approaching(player_rect.x, player_rect.right):
+            return []  # rien au-dessus du joueur dans sa colonne
+        times, colliding, _ = self._scan_obstacles()
+        if not times.size:
+            return []
 
-            if will_collide and time_to_collision < 1.0:  # Moins de 1 seconde
-                immediate_dangers.append(
-                    {
-                        "obstacle": obstacle,
-                        "time": time_to_collision,
-                        "danger_level": 10 - time_to_collision,  # Plus c'est proche, plus c'est dangereux
-                    }
-                )
+        # Collision imminente : moins de 1 seconde
+        selected = colliding & (times < self.immediate_window)
 
-        # Trier par niveau de danger
-        immediate_dangers.sort(key=lambda x: x["danger_level"], reverse=True)
-        return immediate_dangers
+        # Plus c'est proche, plus c'est dangereux
+        return self._sorted_dangers(np.flatnonzero(selected), times[selected], 10 - times[selected])
 
     def find_near_dangers(self):
         """Trouve les obstacles qui sont proches et sur une trajectoire dangereuse"""
-        near_dangers = []
-        player_rect = self.player.get_rect()
-
-        for obstacle in self.obstacles:
-            time_to_collision = self.calculate_time_to_collision(obstacle)
-            will_collide = self.will_collide(obstacle, player_rect)
-
-            if will_collide and time_to_collision < 3.0:  # Moins de 3 secondes
-                near_dangers.append(
-                    {
-                        "obstacle": obstacle,
-                        "time": time_to_collision,
-                        "danger_level": 5 - time_to_collision,
-                    }
-                )
-            elif self.is_near_trajectory(obstacle) and time_to_collision < 4.0:
-                # Obstacle proche de la trajectoire
-                near_dangers.append(
-                    {
-                        "obstacle": obstacle,
-                        "time": time_to_collision,
-                        "danger_level": 3 - time_to_collision,
-                    }
-                )
-
-        near_dangers.sort(key=lambda x: x["danger_level"], reverse=True)
-        return near_dangers
+        times, colliding, near_trajectory = self._scan_obstacles()
+        if not times.size:
+            return []
+
+        # Moins de 3 secondes sur la trajectoire, sinon moins de 4 secondes à côté
+        colliding = colliding & (times < self.near_window)
+        near = ~colliding & near_trajectory & (times < self.side_window)
+        selected = colliding | near
+        levels = np.where(colliding, 5 - times, 3 - times)
+        return self._sorted_dangers(np.flatnonzero(selected), times[selected], levels[selected])
+
+    def _world(self):
+        # l'instantané passé à decide() fait foi, même si le jeu a avancé depuis ;
+        # sinon il est reconstruit quand le champ a changé
+        if self._pinned is not None:
+            return self._pinned
+        if self.snapshot is None or not self.snapshot.is_current(self.obstacles):
+            self.snapshot = WorldSnapshot(self.obstacles, self.power_ups)
+        return self.snapshot
+
+    def _scan_obstacles(self):
+        """Temps avant collision et trajectoires, en une passe sur l'instantané"""
+        world = self._world()
+        key = (world, self.state.x, self.state.y)
+        if key != self._scan_key:
+            self._scan = (
+                world.times_to_impact(self.state.y + self.state.height),
+                self._will_collide_all(world.x, world.y, world.width, self.state.get_rect()),
+                self._near_trajectory_all(world.center_x, world.width),
+            )
+            self._scan_key = key
+        return self._scan
+
+    def _danger_map(self):
+        # carte des dangers de la rangée du joueur (rectangle pygame : y tronqué)
+        player_rect = self.state.get_rect()
+        return self._world().danger(player_rect.y, player_rect.bottom)
+
+    def _live_obstacles(self):
+        world = self._world()
+        return world.index, world.x, world.y, world.width, world.speed
+
+    def _times_to_collision(self, y, speed):
+        """Version vectorisée de calculate_time_to_collision"""
+        distance_y = y - (self.state.y + self.state.height)
+        times = np.full(len(y), np.inf)
+        np.divide(distance_y, speed, out=times, where=speed > 0)
+        return times
+
+    def _will_collide_all(self, x, y, width, player_rect):
+        """Version vectorisée de will_collide"""
+        x_overlap = (x < player_rect.x + player_rect.width) & (x + width > player_rect.x)
+        coming_toward = y < player_rect.y + player_rect.height
+        return x_overlap & coming_toward
+
+    def _near_trajectory_all(self, center_x, width):
+        """Version vectorisée de is_near_trajectory"""
+        player_center_x = self.state.x + self.state.width / 2
+        distance_x = np.abs(player_center_x - center_x)
+        return distance_x < (self.state.width + width) / 2 + self.trajectory_margin
+
+    def _sorted_dangers(self, positions, times, levels):
+        # Tri stable par danger décroissant, comme list.sort(reverse=True)
+        order = np.argsort(-levels, kind="stable")
+        world = self._world()
+        return [
+            {"obstacle": world.obstacle(position), "time": time, "danger_level": level}
+            for position, time, level in zip(
+                positions[order].tolist(), times[order].tolist(), levels[order].tolist()
+            )
+        ]
 
     def calculate_time_to_collision(self, obstacle):
         """Calcule le temps avant collision avec l'obstacle"""
         if obstacle.speed <= 0:
             return float("inf")
 
-        distance_y = obstacle.y - (self.player.y + self.player.height)
+        distance_y = obstacle.y - (self.state.y + self.state.height)
         return distance_y / obstacle.speed
 
     def will_collide(self, obstacle, player_rect):
@@ -126,11 +255,11 @@ class SimpleAI:
 
     def is_near_trajectory(self, obstacle):
         """Vérifie si l'obstacle est proche de la trajectoire du joueur"""
-        player_center_x = self.player.x + self.player.width / 2
+        player_center_x = self.state.x + self.state.width / 2
         obstacle_center_x = obstacle.x + obstacle.width / 2
 
         distance_x = abs(player_center_x - obstacle_center_x)
-        safe_distance = (self.player.width + obstacle.width) / 2 + 20
+        safe_distance = (self.state.width + obstacle.width) / 2 + self.trajectory_margin
 
         return distance_x < safe_distance
 
@@ -151,11 +280,11 @@ class SimpleAI:
 
     def evade_to_safest_side(self, obstacle):
         """Évite vers le côté le plus sûr"""
-        left_space = self.player.x  # Espace à gauche
-        right_space = self.screen_width - (self.player.x + self.player.width)  # Espace à droite
+        left_space = self.state.x  # Espace à gauche
+        right_space = self.screen_width - (self.state.x + self.state.width)  # Espace à droite
 
         obstacle_center = obstacle.x + obstacle.width / 2
-        player_center = self.player.x + self.player.width / 2
+        player_center = self.state.x + self.state.width / 2
 
         # Vérifier s'il y a d'autres obstacles sur les côtés
         left_clear = self.is_side_clear("left")
@@ -175,21 +304,23 @@ class SimpleAI:
             # Aucun côté libre - mouvement d'urgence
             self.emergency_evasion()
 
-    def is_side_clear(self, side, look_ahead=100):
+    def is_side_clear(self, side, look_ahead=None):
         """Vérifie si un côté est libre d'obstacles"""
+        if look_ahead is None:
+            look_ahead = self.look_ahead
         if side == "left":
-            check_x = max(0, self.player.x - look_ahead)
+            check_x = max(0, self.state.x - look_ahead)
             check_width = look_ahead
         else:  # right
-            check_x = self.player.x + self.player.width
+            check_x = self.state.x + self.state.width
             check_width = look_ahead
 
-        check_rect = pygame.Rect(check_x, self.player.y, check_width, self.player.height)
-
-        for obstacle in self.obstacles:
-            if check_rect.colliderect(obstacle.get_rect()):
-                return False
-        return True
+        check_rect = self._check_rect
+        check_rect.update(check_x, self.state.y, check_width, self.state.height)
+        danger = self._danger_map()
+        if danger is not None:
+            return not danger.occupied(check_rect.x, check_rect.right)
+        return not self._world().collides(check_rect)
 
     def avoid_obstacles(self, dangers):
         """Évite les obstacles proches de manière intelligente"""
@@ -219,7 +350,7 @@ class SimpleAI:
         for danger in dangers:
             obstacle = danger["obstacle"]
             obstacle_center = obstacle.x + obstacle.width / 2
-            player_center = self.player.x + self.player.width / 2
+            player_center = self.state.x + self.state.width / 2
 
             if obstacle_center < player_center:
                 # Obstacle vient de gauche - mieux vaut aller à droite
@@ -252,12 +383,12 @@ class SimpleAI:
         """Trouve les power-ups intéressants à attraper"""
         good_power_ups = []
 
-        for power_up in self.power_ups:
+        for power_up in self._world().power_ups:
             # Calculer la valeur du power-up
             value = self.calculate_power_up_value(power_up)
 
             # Vérifier si c'est safe d'aller le chercher
-            if value > 2 and self.is_power_up_safe(power_up):
+            if value > self.power_up_min_value and self.is_power_up_safe(power_up):
                 good_power_ups.append({"power_up": power_up, "value": value})
 
         if good_power_ups:
@@ -269,13 +400,8 @@ class SimpleAI:
 
     def calculate_power_up_value(self, power_up):
         """Calcule la valeur d'un power-up"""
-        base_values = {
-            "shield": 5,  # Très valuable - protection
-            "speed": 3,  # Moyennement valuable
-            "points": 1,  # Peu valuable
-        }
-
-        base_value = base_values.get(power_up.type, 1)
+        # shield : très valuable (protection), speed : moyennement, points : peu
+        base_value = self.power_up_values.get(power_up.type, 1)
 
         # Ajuster selon la distance
         distance = self.calculate_distance_to_power_up(power_up)
@@ -283,17 +409,17 @@ class SimpleAI:
 
         # Ajuster selon les besoins actuels
         need_factor = 1.0
-        if power_up.type == "shield" and self.player.shield_time < 2:
-            need_factor = 2.0  # Besoin urgent de bouclier
-        elif power_up.type == "speed" and self.player.speed_boost_time < 2:
-            need_factor = 1.5  # Besoin de vitesse
+        if power_up.type == "shield" and self.state.shield_time < 2:
+            need_factor = self.shield_need  # Besoin urgent de bouclier
+        elif power_up.type == "speed" and self.state.speed_boost_time < 2:
+            need_factor = self.speed_need  # Besoin de vitesse
 
         return base_value * distance_factor * need_factor
 
     def calculate_distance_to_power_up(self, power_up):
         """Calcule la distance jusqu'au power-up"""
-        dx = power_up.x - self.player.x
-        dy = power_up.y - self.player.y
+        dx = power_up.x - self.state.x
+        dy = power_up.y - self.state.y
         return math.sqrt(dx * dx + dy * dy)
 
     def is_power_up_safe(self, power_up):
@@ -301,39 +427,44 @@ class SimpleAI:
         # Vérifier les obstacles sur le chemin
         path_rect = self.calculate_path_to_power_up(power_up)
 
-        for obstacle in self.obstacles:
-            if self.will_collide(obstacle, path_rect):
-                time_to_power_up = self.calculate_time_to_power_up(power_up)
-                time_to_obstacle = self.calculate_time_to_collision(obstacle)
+        danger = self._danger_map()
+        if danger is not None and path_rect.bottom == danger.bottom:
+            # obstacles au-dessus du joueur sur le chemin : tous arrivent avant lui
+            return not danger.approaching(path_rect.x, path_rect.right)
 
-                if time_to_obstacle < time_to_power_up + 1.0:  # Marge de sécurité
-                    return False
+        _, x, y, width, speed = self._live_obstacles()
+        blocking = self._will_collide_all(x, y, width, path_rect)
+        if not blocking.any():
+            return True
 
-        return True
+        time_to_power_up = self.calculate_time_to_power_up(power_up)
+        times_to_obstacle = self._times_to_collision(y[blocking], speed[blocking])
+        return not (times_to_obstacle < time_to_power_up + 1.0).any()  # Marge de sécurité
 
     def calculate_path_to_power_up(self, power_up):
         """Calcule le rectangle représentant le chemin vers le power-up"""
-        x1 = min(self.player.x, power_up.x)
-        x2 = max(self.player.x + self.player.width, power_up.x + power_up.width)
-        y1 = min(self.player.y, power_up.y)
-        y2 = max(self.player.y + self.player.height, power_up.y + power_up.height)
+        x1 = min(self.state.x, power_up.x)
+        x2 = max(self.state.x + self.state.width, power_up.x + power_up.width)
+        y1 = min(self.state.y, power_up.y)
+        y2 = max(self.state.y + self.state.height, power_up.y + power_up.height)
 
-        return pygame.Rect(x1, y1, x2 - x1, y2 - y1)
+        self._path_rect.update(x1, y1, x2 - x1, y2 - y1)
+        return self._path_rect
 
     def calculate_time_to_power_up(self, power_up):
         """Calcule le temps nécessaire pour atteindre le power-up"""
-        horizontal_distance = abs((power_up.x + power_up.width / 2) - (self.player.x + self.player.width / 2))
-        vertical_distance = abs((power_up.y + power_up.height / 2) - (self.player.y + self.player.height / 2))
+        horizontal_distance = abs((power_up.x + power_up.width / 2) - (self.state.x + self.state.width / 2))
+        vertical_distance = abs((power_up.y + power_up.height / 2) - (self.state.y + self.state.height / 2))
 
-        time_horizontal = horizontal_distance / self.player.speed
-        time_vertical = vertical_distance / self.player.speed
+        time_horizontal = horizontal_distance / self.state.speed
+        time_vertical = vertical_distance / self.state.speed
 
         return max(time_horizontal, time_vertical)
 
     def chase_power_up(self, power_up):
         """Poursuit un power-up de manière intelligente"""
         power_up_center_x = power_up.x + power_up.width / 2
-        player_center_x = self.player.x + self.player.width / 2
+        player_center_x = self.state.x + self.state.width / 2
 
         # Se déplacer progressivement vers le power-up
         if power_up_center_x > player_center_x + 10:  # Marge pour éviter les oscillations
@@ -345,7 +476,7 @@ class SimpleAI:
     def smart_positioning(self):
         """Se positionne stratégiquement sur l'écran"""
         screen_center = self.screen_width / 2
-        player_center = self.player.x + self.player.width / 2
+        player_center = self.state.x + self.state.width / 2
 
         # Préférer le centre pour avoir plus d'options d'évitement
         if abs(player_center - screen_center) > 100:
@@ -356,8 +487,8 @@ class SimpleAI:
                 self.move_left()
         else:
             # Près du centre, faire de petits mouvements stratégiques
-            if random.random() < 0.01:  # 1% de chance par frame
-                if random.choice([True, False]):
+            if self.rng.random() < 0.01:  # 1% de chance par frame
+                if self.rng.choice([True, False]):
                     self.small_move_left()
                 else:
                     self.small_move_right()
@@ -366,7 +497,7 @@ class SimpleAI:
         """Mouvement prudent quand aucune bonne option n'est disponible"""
         # Bouger légèrement vers le centre
         screen_center = self.screen_width / 2
-        player_center = self.player.x + self.player.width / 2
+        player_center = self.state.x + self.state.width / 2
 
         if player_center < screen_center:
             self.small_move_right()
@@ -376,29 +507,23 @@ class SimpleAI:
     def emergency_evasion(self):
         """Mouvement d'urgence quand tout semble perdu"""
         # Mouvement rapide et aléatoire
-        if random.choice([True, False]):
+        if self.rng.choice([True, False]):
             self.move_left()
         else:
             self.move_right()
 
-    # Méthodes de mouvement de base
+    # Méthodes de mouvement de base : la décision note l'action, apply() l'exécute
     def move_left(self):
-        if self.player.x > self.player.speed:
-            self.player.x -= self.player.speed
-            self.last_direction = "left"
+        self.action = "left"
 
     def move_right(self):
-        if self.player.x < self.screen_width - self.player.width - self.player.speed:
-            self.player.x += self.player.speed
-            self.last_direction = "right"
+        self.action = "right"
 
     def small_move_left(self):
-        if self.player.x > 2:
-            self.player.x -= 2
+        self.action = "small_left"
 
     def small_move_right(self):
-        if self.player.x < self.screen_width - self.player.width - 2:
-            self.player.x += 2
+        self.action = "small_right"
 
     # Méthodes utilitaires pour la compatibilité
     def find_most_dangerous_obstacle(self):
@@ -411,4 +536,6 @@ class SimpleAI:
         return self.find_good_power_up()
 
     def avoid_obstacle(self, obstacle):
+        self.action = None
         self.handle_immediate_danger([{"obstacle": obstacle, "time": 0.5, "danger_level": 5}])
+        self.apply(self.action)
@@ -0,0 +1,131 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from snapshot import PlayerState
+
+
+class AIScheduler:
+    """Cadence les décisions des IA, sur un pool de threads si workers > 0.
+
+    Chaque contrôleur décide au plus decision_rate fois par seconde de jeu
+    (à chaque tick si None) et rejoue entre-temps sa dernière action
+    validée. budget_ms borne le temps passé dans step() pour tout le tick.
+    Avec des workers, decide() tourne sur un instantané copié et un
+    PlayerState figé : le tick attend les décisions en cours jusqu'à la fin
+    du budget (2 ms si None), puis continue avec l'action précédente. Sans
+    workers, les décisions se font dans le tick ; une fois le budget
+    épuisé, les contrôleurs restants sont reportés au tick suivant (et
+    passent alors en premier). Sans budget, tout se fait dans le tick, comme
+    avant, et la partie reste déterministe.
+    """
+
+    DEFAULT_WAIT_MS = 2.0  # attente des threads sans budget_ms
+
+    def __init__(self, workers=0, budget_ms=None):
+        self.workers = workers
+        self.budget = budget_ms / 1000 if budget_ms is not None else None
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="ia") if workers else None
+        self._pending = {}  # contrôleur -> Future de sa décision en cours
+        self._committed = {}  # contrôleur -> dernière action validée
+        self._next_tick = {}  # contrôleur -> tick de sa prochaine décision
+        self._deferred = []  # contrôleurs reportés faute de budget, dans l'ordre : prioritaires au tick suivant
+        self.decisions = 0
+        self.deferred = 0  # décisions reportées au tick suivant
+        self.stale_ticks = 0  # ticks joués avec une action en attente de remplacement
+
+    def reset(self):
+        # nouvelle partie : les décisions en vol portent sur l'ancienne. cancel() n'arrête pas
+        # un decide() déjà lancé : on l'attend, sinon il écrirait dans le contrôleur pendant
+        # son reset() (Game.reset_game) ; son résultat est jeté
+        running = [future for future in self._pending.values() if not future.cancel()]
+        if running:
+            wait(running)
+        self._pending.clear()
+        self._committed.clear()
+        self._next_tick.clear()
+        self._deferred.clear()
+
+    def pending(self, controller):
+        return controller in self._pending
+
+    def step(self, controllers, tick, tick_rate, capture):
+        """Fait décider les contrôleurs dus puis applique les actions validées.
+
+        capture(copy) construit l'instantané du tick ; il n'est appelé
+        qu'une fois, et seulement si une décision est lancée.
+        """
+        start = time.perf_counter()
+        due = []
+        for controller in controllers:
+            self._collect(controller)
+            if self.is_due(controller, tick):
+                due.append(controller)
+        if due:
+            # les reportés du tick précédent d'abord, dans leur ordre : aucun n'attend indéfiniment
+            rank = {controller: order for order, controller in enumerate(self._deferred)}
+            due.sort(key=lambda controller: rank.get(controller, len(rank)))
+            self._deferred.clear()
+            world = capture(self._pool is not None)
+            if self._pool is None:
+                self._prepare(due, world)
+            for controller in due:
+                if (
+                    self._pool is None
+                    and self.budget is not None
+                    and time.perf_counter() - start >= self.budget
+                    and not getattr(controller, "prepared", False)  # action déjà calculée : rien à payer
+                ):
+                    self._deferred.append(controller)
+                    self.deferred += 1
+                    continue
+                if controller.decision_rate:
+                    self._next_tick[controller] = tick + tick_rate / controller.decision_rate
+                if self._pool is None:
+                    self._commit(controller, controller.decide(world))
+                else:
+                    state = PlayerState.of(controller.player)
+                    self._pending[controller] = self._pool.submit(controller.decide, world, state)
+
+        if self._pending:
+            budget = self.budget if self.budget is not None else self.DEFAULT_WAIT_MS / 1000
+            remaining = budget - (time.perf_counter() - start)
+            if remaining > 0:
+                wait(list(self._pending.values()), timeout=remaining)
+            for controller in controllers:
+                self._collect(controller)
+                if controller in self._pending:
+                    self.stale_ticks += 1
+
+        for controller in controllers:
+            controller.apply(self._committed.get(controller))
+
+    def is_due(self, controller, tick):
+        """Le contrôleur doit-il décider à ce tick (pas de décision en cours, cadence respectée) ?"""
+        return controller not in self._pending and tick >= self._next_tick.get(controller, tick)
+
+    def _prepare(self, due, world):
+        # contrôleurs qui savent décider par lots (PolicyAI) : un seul appel pour tous
+        groups = {}
+        for controller in due:
+            decide_batch = getattr(controller, "decide_batch", None)
+            if decide_batch is not None:
+                groups.setdefault(decide_batch, []).append(controller)
+        for decide_batch, group in groups.items():
+            if len(group) > 1:
+                decide_batch(group, [world] * len(group))
+
+    def _collect(self, controller):
+        future = self._pending.get(controller)
+        if future is not None and future.done():
+            del self._pending[controller]
+            self._commit(controller, future.result())
+
+    def _commit(self, controller, action):
+        self._committed[controller] = action
+        self.decisions += 1
+
+    def close(self):
+        self.reset()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
@@ -0,0 +1,84 @@
+import os
+import queue
+import threading
+import time
+
+import pygame
+
+from audio_cache import AudioCache
+
+SOUND_NAMES = ("hit", "powerup", "zap", "ai_grace", "click")
+SOUND_EXTS = (".wav", ".ogg", ".mp3")
+MUSIC_EXTS = (".ogg", ".mp3", ".wav")
+
+
+def find_asset(base_name, exts, sfx_dir=os.path.join("assets", "sfx")):
+    for ext in exts:
+        path = os.path.join(sfx_dir, f"{base_name}{ext}")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class AssetLoader:
+    """Charge le mixer, les sons et la musique sur un thread, pendant que le menu s'affiche.
+
+    Le thread ne fait que l'initialisation du mixer et le décodage ; il
+    dépose chaque son prêt dans une file que le thread principal vide par
+    poll() (Game.run, à chaque frame) : volumes et lecture restent sur le
+    thread principal. Les effets passent par AudioCache (PCM déjà décodé
+    dans assets/.cache) ; la musique reste lue en flux par le mixer. Un son
+    manquant ou illisible n'est jamais livré, play_sound l'ignore comme un
+    son pas encore chargé. timings garde la durée de chaque étape (mode
+    --startup-time).
+    """
+
+    def __init__(self, sound_names=SOUND_NAMES, cache=None):
+        self.sound_names = sound_names
+        self.cache = cache if cache is not None else AudioCache(exts=SOUND_EXTS)
+        self.timings = {}  # étape -> secondes, depuis start()
+        self.done = threading.Event()
+        self._ready = queue.SimpleQueue()  # (nom, Sound) ou ("music", chemin)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="assets", daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout=None):
+        return self.done.wait(timeout)
+
+    def poll(self):
+        """Éléments chargés depuis le dernier appel : liste de (nom, Sound ou chemin de musique)."""
+        ready = []
+        while True:
+            try:
+                ready.append(self._ready.get_nowait())
+            except queue.Empty:
+                return ready
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                return  # pas de périphérique audio : jeu muet
+            self.timings["mixer"] = time.perf_counter() - start
+            try:
+                for name, sound in self.cache.load(self.sound_names):
+                    self._ready.put((name, sound))
+                    self.timings[name] = time.perf_counter() - start
+            except OSError:
+                pass  # cache inaccessible : les sons déjà livrés suffisent
+            path = find_asset("music", MUSIC_EXTS)
+            if path:
+                try:
+                    pygame.mixer.music.load(path)
+                except Exception:
+                    path = None
+            if path:
+                self._ready.put(("music", path))
+                self.timings["music"] = time.perf_counter() - start
+        finally:
+            self.done.set()
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+
+import pygame
+
+MANIFEST_VERSION = 1
+# une date plus récente que ça n'est pas fiable (horloge des fichiers grossière) : contenu revérifié
+RACY_NS = 2 * 10**9
+
+
+class AudioCache:
+    """Sons décodés une fois, gardés en PCM brut au format du mixer.
+
+    manifest.json associe à chaque nom de son son fichier source (taille,
+    date, empreinte SHA-1 du contenu) et le fichier PCM décodé, nommé
+    d'après l'empreinte et le format du mixer. Au lancement suivant, le PCM
+    est relu par mmap dans pygame.mixer.Sound(buffer=...) sans repasser par
+    le décodeur. Une entrée est refaite quand la source change (taille ou
+    date différente, puis empreinte différente) ; tout le cache l'est quand
+    le format du mixer change. Les sons sans fichier sont notés dans
+    missing : tant que le dossier des sons n'a pas bougé, ils ne sont plus
+    cherchés. Une date trop récente (RACY_NS) ne prouve rien, le fichier
+    a pu changer dans la même graduation de l'horloge : elle n'est pas
+    prise pour acquise. Un cache impossible à écrire ne coûte que le
+    décodage : les sons sont servis quand même.
+    """
+
+    def __init__(self, sfx_dir=os.path.join("assets", "sfx"), cache_dir=None, exts=(".wav", ".ogg", ".mp3")):
+        self.sfx_dir = sfx_dir
+        self.cache_dir = cache_dir if cache_dir is not None else os.path.join(os.path.dirname(sfx_dir), ".cache")
+        self.exts = exts
+        self.manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        self.hits = 0  # sons relus depuis le cache
+        self.decoded = 0  # sons décodés depuis leur source
+
+    def load(self, names):
+        """Génère (nom, Sound) pour chaque son trouvé ; le mixer doit être initialisé."""
+        mixer_format = list(pygame.mixer.get_init())
+        manifest = self._read_manifest()
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("format") != mixer_format:
+            self._drop(manifest.get("sounds", {}).values())
+            manifest = {"version": MANIFEST_VERSION, "format": mixer_format, "sounds": {}, "missing": []}
+        sources = self._sources(names, manifest)
+        changed = False
+        for name in names:
+            source = sources.get(name)
+            entry = manifest["sounds"].get(name)
+            if source is None:
+                if entry is not None:
+                    self._drop([entry])
+                    del manifest["sounds"][name]
+                changed = True
+                continue
+            stamp = entry and (entry["size"], entry["mtime_ns"])
+            sound = self._cached(entry, source) if entry is not None else None
+            if sound is not None and stamp != (entry["size"], entry["mtime_ns"]):
+                changed = True  # même contenu, nouvelle date : ne plus rehacher au prochain lancement
+            if sound is None:
+                try:
+                    sound = pygame.mixer.Sound(source)
+                except Exception:
+                    continue  # illisible : ni son, ni entrée
+                self.decoded += 1
+                if name in manifest["sounds"]:
+                    self._drop([manifest["sounds"].pop(name)])
+                entry = self._store(source, sound, mixer_format)
+                if entry is not None:  # sinon cache impossible à écrire : le son reste servi
+                    manifest["sounds"][name] = entry
+                changed = True
+            yield name, sound
+        missing = sorted(name for name in names if name not in sources)
+        dir_mtime = os.stat(self.sfx_dir).st_mtime_ns if os.path.isdir(self.sfx_dir) else None
+        if dir_mtime is not None and self._racy(dir_mtime):
+            dir_mtime = None  # dossier modifié à l'instant : relisté au prochain lancement
+        if changed or manifest["missing"] != missing or manifest.get("dir_mtime_ns") != dir_mtime:
+            manifest["missing"] = missing
+            manifest["dir_mtime_ns"] = dir_mtime
+            try:
+                self._write_manifest(manifest)
+            except OSError:
+                pass  # cache non inscriptible : tout sera redécodé au prochain lancement
+
+    def _sources(self, names, manifest):
+        """Fichier source de chaque son : celui du manifeste si le dossier n'a pas changé."""
+        if not os.path.isdir(self.sfx_dir):
+            return {}
+        if os.stat(self.sfx_dir).st_mtime_ns == manifest.get("dir_mtime_ns"):
+            known = {name: entry["source"] for name, entry in manifest["sounds"].items()}
+            if all(name in known or name in manifest["missing"] for name in names):
+                return {name: known[name] for name in names if name in known}
+        # un seul listage du dossier plutôt qu'un os.path.exists par extension
+        files = set(os.listdir(self.sfx_dir))
+        sources = {}
+        for name in names:
+            for ext in self.exts:
+                if f"{name}{ext}" in files:
+                    sources[name] = os.path.join(self.sfx_dir, f"{name}{ext}")
+                    break
+        return sources
+
+    def _cached(self, entry, source):
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        if entry["source"] != source:
+            return None
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if stamp != (entry["size"], entry["mtime_ns"]) or self._racy(stat.st_mtime_ns):
+            # date ou taille changée (ou trop récente pour s'y fier) : le contenu décide
+            if self._digest(source) != entry["sha1"]:
+                return None
+            entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+        path = os.path.join(self.cache_dir, entry["pcm"])
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size != entry["bytes"] or not entry["bytes"]:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    sound = pygame.mixer.Sound(buffer=data)
+        except (OSError, ValueError, pygame.error):
+            return None
+        self.hits += 1
+        return sound
+
+    def _store(self, source, sound, mixer_format):
+        """Écrit le PCM décodé ; renvoie son entrée, ou None si le cache n'est pas inscriptible."""
+        raw = sound.get_raw()
+        try:
+            digest = self._digest(source)
+            stat = os.stat(source)
+            frequency, size, channels = mixer_format
+            pcm = f"{os.path.basename(source)}-{digest[:16]}-{frequency}-{size}-{channels}.pcm"
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write(os.path.join(self.cache_dir, pcm), raw)
+        except OSError:
+            return None
+        return {
+            "source": source,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": digest,
+            "pcm": pcm,
+            "bytes": len(raw),
+        }
+
+    @staticmethod
+    def _racy(mtime_ns):
+        return time.time_ns() - mtime_ns < RACY_NS
+
+    @staticmethod
+    def _digest(path):
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _drop(self, entries):
+        for entry in entries:
+            try:
+                os.remove(os.path.join(self.cache_dir, entry["pcm"]))
+            except (OSError, KeyError, TypeError):
+                pass
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _write_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._write(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write(path, data):
+        # fichier temporaire puis os.replace, comme HighScoreStore : jamais de cache à moitié écrit
+        temp = f"{path}.tmp"
+        try:
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, path)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,355 @@
+import random
+
+import numpy as np
+
+from obstacle import Obstacle
+from powerup import PowerUp
+
+# Actions par joueur : masque de bits (N parties, P joueurs)
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+ACTION_UP = 4
+ACTION_DOWN = 8
+ACTION_SHOOT = 16
+
+POWER_UP_TYPES = {name: index for index, name in enumerate(PowerUp.TYPES)}
+
+PLAYER_SIZE = 50
+PLAYER_SPAWNS = [(325, 500), (425, 500)]
+PROJECTILE_WIDTH = 10
+PROJECTILE_HEIGHT = 18
+PROJECTILE_SPEED = 12
+POWER_UP_SIZE = 30
+POWER_UP_SPEED = 3
+
+
+class BatchGame:
+    """N parties indépendantes avancées en même temps, mêmes règles que Game.update.
+
+    Chaque entité est stockée dans des tableaux NumPy (partie, slot). Les slots
+    valides sont compactés en tête et gardent l'ordre d'apparition, comme les
+    listes de Game, pour que les collisions se résolvent dans le même ordre.
+    Le tirage aléatoire passe par un random.Random par partie et par les
+    constructeurs Obstacle/PowerUp : avec les mêmes graines, une partie du lot
+    suit exactement une partie Game(headless=True, rng=random.Random(seed)).
+    """
+
+    def __init__(self, n_games, seeds=None, active_players=2, ai_extra_hits=0,
+                 screen_width=800, screen_height=600, capacity=32):
+        self.n_games = n_games
+        self.n_players = len(PLAYER_SPAWNS)
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        if seeds is None:
+            seeds = range(n_games)
+        self.rngs = [random.Random(seed) for seed in seeds]
+        if len(self.rngs) != n_games:
+            raise ValueError("il faut une graine par partie")
+
+        shape = (n_games, self.n_players)
+        spawn = np.array(PLAYER_SPAWNS, dtype=np.int64)
+        self.px = np.broadcast_to(spawn[:, 0], shape).copy()
+        self.py = np.broadcast_to(spawn[:, 1], shape).copy()
+        self.base_speed = 5
+        self.speed = np.full(shape, self.base_speed, dtype=np.int64)
+        self.score = np.zeros(shape, dtype=np.int64)
+        self.speed_boost_time = np.zeros(shape)
+        self.shield_time = np.zeros(shape)
+        self.alive = np.ones(shape, dtype=bool)
+        self.ai_extra_hits = np.full(shape, ai_extra_hits, dtype=np.int64)
+        self.max_ammo = 3
+        self.ammo = np.full(shape, self.max_ammo, dtype=np.int64)
+        if active_players == 1:
+            self.alive[:, 1:] = False
+            self.ai_extra_hits[:, 1:] = 0
+
+        self.frame = np.zeros(n_games, dtype=np.int64)
+        self.level = np.ones(n_games, dtype=np.int64)
+        self.obstacle_timer = np.zeros(n_games, dtype=np.int64)
+        self.power_up_timer = np.zeros(n_games, dtype=np.int64)
+        self.slow_timer = np.zeros(n_games)
+        self.game_over = np.zeros(n_games, dtype=bool)
+
+        # obstacles : x, y, largeur, hauteur, vitesse
+        self.obstacle_count = np.zeros(n_games, dtype=np.int64)
+        self.obstacles = {
+            "x": np.zeros((n_games, capacity), dtype=np.int64),
+            "y": np.zeros((n_games, capacity)),
+            "w": np.zeros((n_games, capacity), dtype=np.int64),
+            "h": np.zeros((n_games, capacity), dtype=np.int64),
+            "speed": np.zeros((n_games, capacity), dtype=np.int64),
+        }
+        self.power_up_count = np.zeros(n_games, dtype=np.int64)
+        self.power_ups = {
+            "x": np.zeros((n_games, capacity), dtype=np.int64),
+            "y": np.zeros((n_games, capacity), dtype=np.int64),
+            "type": np.zeros((n_games, capacity), dtype=np.int64),
+        }
+        self.projectile_count = np.zeros(n_games, dtype=np.int64)
+        self.projectiles = {
+            "x": np.zeros((n_games, capacity), dtype=np.int64),
+            "y": np.zeros((n_games, capacity), dtype=np.int64),
+            "owner": np.zeros((n_games, capacity), dtype=np.int64),
+        }
+
+    # --- stockage -----------------------------------------------------------
+
+    @staticmethod
+    def _valid(counts):
+        # seules les colonnes occupées par au moins une partie sont parcourues
+        width = int(counts.max(initial=0))
+        return np.arange(width)[None, :] < counts[:, None]
+
+    @staticmethod
+    def _append(arrays, counts, game, values):
+        capacity = next(iter(arrays.values())).shape[1]
+        if counts[game] >= capacity:
+            for name, arr in arrays.items():
+                grown = np.zeros((arr.shape[0], capacity * 2), dtype=arr.dtype)
+                grown[:, :capacity] = arr
+                arrays[name] = grown
+        slot = counts[game]
+        for name, value in values.items():
+            arrays[name][game, slot] = value
+        counts[game] += 1
+
+    @staticmethod
+    def _compact(arrays, counts, keep):
+        # tri stable : les slots gardés remontent en tête dans leur ordre d'origine
+        width = keep.shape[1]
+        order = np.argsort(~keep, axis=1, kind="stable")
+        for arr in arrays.values():
+            arr[:, :width] = np.take_along_axis(arr[:, :width], order, axis=1)
+        counts[:] = keep.sum(axis=1)
+
+    @staticmethod
+    def _overlap(ax, ay, aw, ah, bx, by, bw, bh):
+        # même test que pygame.Rect.colliderect, coordonnées tronquées comme Rect
+        ax, ay, bx, by = (np.trunc(v) for v in (ax, ay, bx, by))
+        return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+    # --- simulation ---------------------------------------------------------
+
+    def step(self, actions):
+        """Avance toutes les parties d'une frame.
+
+        actions : tableau (n_games, n_players) de masques ACTION_*. Le tir est
+        traité avant la mise à jour, comme l'évènement clavier dans Game.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        active = ~self.game_over
+        live = self.alive & active[:, None]
+
+        shooting = live & ((actions & ACTION_SHOOT) != 0) & (self.ammo > 0)
+        for p in range(self.n_players):
+            for game in np.flatnonzero(shooting[:, p]):
+                self.ammo[game, p] -= 1
+                self._append(
+                    self.projectiles,
+                    self.projectile_count,
+                    game,
+                    {
+                        "x": self.px[game, p] + PLAYER_SIZE // 2 - 5,
+                        "y": self.py[game, p] - 10,
+                        "owner": p,
+                    },
+                )
+
+        self._update_power_up_timers(live)
+
+        self.frame[active] += 1
+        elapsed = self.frame / 60
+        self.level = np.where(
+            active, np.maximum(1, (elapsed // 30).astype(np.int64) + 1), self.level
+        )
+
+        self._move_players(actions, live)
+        self._spawn(active)
+
+        speed_scale = np.where(self.slow_timer > 0, 0.55, 1.0)
+        slowing = active & (self.slow_timer > 0)
+        self.slow_timer[slowing] = np.maximum(0.0, self.slow_timer[slowing] - 1 / 60)
+
+        obs = self.obstacles
+        stored = self._valid(self.obstacle_count)
+        width = stored.shape[1]
+        obs_valid = stored & active[:, None]
+        obs_y = obs["y"][:, :width]
+        obs_y += np.where(obs_valid, obs["speed"][:, :width] * speed_scale[:, None], 0)
+        off_screen = obs_valid & (obs_y > self.screen_height)
+        self.score += off_screen.sum(axis=1)[:, None] * self.alive
+
+        destroyed = self._update_projectiles(active, obs_valid)
+        zapped = self._update_power_ups(active, obs_valid)
+        collided = self._collide_players(obs_valid & ~zapped)
+
+        keep = obs_valid & ~(off_screen | destroyed | collided | zapped)
+        keep |= stored & ~active[:, None]
+        self._compact(obs, self.obstacle_count, keep)
+
+        self.game_over |= active & ~self.alive.any(axis=1)
+
+    def _update_power_up_timers(self, live):
+        boosting = live & (self.speed_boost_time > 0)
+        self.speed_boost_time[boosting] -= 1 / 60
+        ended = boosting & (self.speed_boost_time <= 0)
+        self.speed[ended] = self.base_speed
+        self.speed_boost_time[ended] = 0
+
+        shielded = live & (self.shield_time > 0)
+        self.shield_time[shielded] -= 1 / 60
+        self.shield_time[shielded & (self.shield_time <= 0)] = 0
+
+    def _move_players(self, actions, live):
+        # mêmes tests séquentiels que Player.move
+        max_x = self.screen_width - PLAYER_SIZE
+        max_y = self.screen_height - PLAYER_SIZE
+        left = live & ((actions & ACTION_LEFT) != 0) & (self.px > 0)
+        self.px[left] -= self.speed[left]
+        right = live & ((actions & ACTION_RIGHT) != 0) & (self.px < max_x)
+        self.px[right] += self.speed[right]
+        up = live & ((actions & ACTION_UP) != 0) & (self.py > 0)
+        self.py[up] -= self.speed[up]
+        down = live & ((actions & ACTION_DOWN) != 0) & (self.py < max_y)
+        self.py[down] += self.speed[down]
+
+    def _spawn(self, active):
+        self.obstacle_timer[active] += 1
+        spawn_rate = np.maximum(15, 60 - self.level * 6)
+        for game in np.flatnonzero(active & (self.obstacle_timer >= spawn_rate)):
+            obstacle = Obstacle(self.rngs[game])
+            self._append(
+                self.obstacles,
+                self.obstacle_count,
+                game,
+                {
+                    "x": obstacle.x,
+                    "y": obstacle.y,
+                    "w": obstacle.width,
+                    "h": obstacle.height,
+                    "speed": obstacle.speed + min(8, self.level[game] // 2),
+                },
+            )
+            self.obstacle_timer[game] = 0
+
+        self.power_up_timer[active] += 1
+        for game in np.flatnonzero(active & (self.power_up_timer >= 250)):
+            rng = self.rngs[game]
+            if rng.random() < 0.4:
+                power_up = PowerUp(rng)
+                self._append(
+                    self.power_ups,
+                    self.power_up_count,
+                    game,
+                    {"x": power_up.x, "y": power_up.y, "type": POWER_UP_TYPES[power_up.type]},
+                )
+                self.power_up_timer[game] = 0
+
+    def _update_projectiles(self, active, obs_valid):
+        proj = self.projectiles
+        stored = self._valid(self.projectile_count)
+        if stored.shape[1] == 0:
+            return np.zeros_like(obs_valid)
+        width = stored.shape[1]
+        proj_valid = stored & active[:, None]
+        proj_x = proj["x"][:, :width]
+        proj_y = proj["y"][:, :width]
+        proj_y -= np.where(proj_valid, PROJECTILE_SPEED, 0)
+        gone = proj_valid & (proj_y + PROJECTILE_HEIGHT < 0)
+        flying = proj_valid & ~gone
+
+        obs = self.obstacles
+        o = obs_valid.shape[1]
+        hits = self._overlap(
+            proj_x[:, :, None], proj_y[:, :, None], PROJECTILE_WIDTH, PROJECTILE_HEIGHT,
+            obs["x"][:, None, :o], obs["y"][:, None, :o], obs["w"][:, None, :o], obs["h"][:, None, :o],
+        )
+        hits &= flying[:, :, None] & obs_valid[:, None, :]
+        hit = hits.any(axis=2)
+        # chaque tir ne détruit que le premier obstacle touché dans l'ordre de la liste
+        first = hits.argmax(axis=2) if o else np.zeros(hit.shape, dtype=np.int64)
+        destroyed = np.zeros_like(obs_valid)
+        games, slots = np.nonzero(hit)
+        destroyed[games, first[games, slots]] = True
+        owners = proj["owner"][games, slots]
+        np.add.at(self.score, (games, owners), self.alive[games, owners].astype(np.int64))
+
+        keep = stored & ~(gone | hit)
+        self._compact(proj, self.projectile_count, keep)
+        return destroyed
+
+    def _update_power_ups(self, active, obs_valid):
+        pu = self.power_ups
+        zapped = np.zeros_like(obs_valid)
+        stored = self._valid(self.power_up_count)
+        width = stored.shape[1]
+        taken = np.zeros_like(stored)
+        valid = stored & active[:, None]
+        pu_y = pu["y"][:, :width]
+        pu_y += np.where(valid, POWER_UP_SPEED, 0)
+        off_screen = valid & (pu_y > self.screen_height)
+
+        # slot par slot pour garder l'ordre de ramassage (ZAP retire l'obstacle le plus bas)
+        for k in range(width):
+            candidates = valid[:, k] & ~off_screen[:, k]
+            if not candidates.any():
+                continue
+            picked_by = np.full(self.n_games, -1)
+            for p in range(self.n_players):
+                touch = candidates & (picked_by < 0) & self.alive[:, p] & self._overlap(
+                    self.px[:, p], self.py[:, p], PLAYER_SIZE, PLAYER_SIZE,
+                    pu["x"][:, k], pu["y"][:, k], POWER_UP_SIZE, POWER_UP_SIZE,
+                )
+                picked_by[touch] = p
+            for game in np.flatnonzero(picked_by >= 0):
+                self._apply_effect(game, picked_by[game], PowerUp.TYPES[pu["type"][game, k]],
+                                   obs_valid, zapped)
+            taken[:, k] = picked_by >= 0
+
+        keep = stored & ~(off_screen | taken)
+        self._compact(pu, self.power_up_count, keep)
+        return zapped
+
+    def _apply_effect(self, game, p, kind, obs_valid, zapped):
+        if kind == "speed":
+            self.speed[game, p] = self.base_speed * 2
+            self.speed_boost_time[game, p] = 5
+        elif kind == "shield":
+            self.shield_time[game, p] = 8
+        elif kind == "points":
+            self.score[game, p] += 50
+        elif kind == "slow":
+            self.slow_timer[game] = 4.0
+        elif kind == "zap":
+            remaining = obs_valid[game] & ~zapped[game]
+            if remaining.any():
+                heights = np.where(remaining, self.obstacles["y"][game, :remaining.size], -np.inf)
+                zapped[game, heights.argmax()] = True
+        elif kind == "ammo":
+            self.ammo[game, p] = min(self.max_ammo, self.ammo[game, p] + 5)
+
+    def _collide_players(self, obs_valid):
+        obs = self.obstacles
+        o = obs_valid.shape[1]
+        collided = np.zeros_like(obs_valid)
+        for p in range(self.n_players):
+            touch = obs_valid & self.alive[:, p, None] & self._overlap(
+                self.px[:, p, None], self.py[:, p, None], PLAYER_SIZE, PLAYER_SIZE,
+                obs["x"][:, :o], obs["y"][:, :o], obs["w"][:, :o], obs["h"][:, :o],
+            )
+            hits = touch.sum(axis=1)
+            shielded = self.shield_time[:, p] > 0
+            # sans bouclier : les hits de grâce absorbent les premiers chocs,
+            # le suivant élimine et les obstacles d'après ne touchent plus ce joueur
+            extra = np.where(shielded, 0, self.ai_extra_hits[:, p])
+            reach = np.cumsum(touch, axis=1) <= extra[:, None] + 1
+            collided |= touch & (shielded[:, None] | reach)
+            used = np.minimum(hits, extra)
+            self.ai_extra_hits[:, p] -= used
+            self.alive[:, p] &= shielded | (hits <= extra)
+        return collided
+
+    # --- résultats ----------------------------------------------------------
+
+    def best_scores(self):
+        return self.score.max(axis=1)
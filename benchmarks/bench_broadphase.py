@@ -0,0 +1,96 @@
+"""Compare la broadphase UniformGrid aux boucles imbriquées de Game.update.
+
+Usage : python benchmarks/bench_broadphase.py [--frames 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from broadphase import UniformGrid, run_starts  # noqa: E402
+from obstacle import Obstacle, ObstacleField  # noqa: E402
+from projectile import Projectile  # noqa: E402
+
+WIDTH, HEIGHT = 800, 600
+
+
+def make_world(rng, n_obstacles, n_projectiles):
+    obstacles = []
+    for _ in range(n_obstacles):
+        obstacle = Obstacle(rng)
+        obstacle.y = rng.uniform(-80, HEIGHT)
+        obstacles.append(obstacle)
+    projectiles = [
+        Projectile(rng.randint(0, WIDTH - 10), rng.randint(0, HEIGHT)) for _ in range(n_projectiles)
+    ]
+    field = ObstacleField(screen_height=HEIGHT)
+    for obstacle in obstacles:
+        field.append(obstacle)
+    return obstacles, field, projectiles
+
+
+def nested_loops(obstacles, projectiles):
+    # boucle d'origine : chaque tir contre chaque obstacle, premier touché seulement
+    hits = []
+    for index, projectile in enumerate(projectiles):
+        for target, obstacle in enumerate(obstacles):
+            if projectile.get_rect().colliderect(obstacle.get_rect()):
+                hits.append((index, target))
+                break
+    return hits
+
+
+def boxes(entities):
+    arr = np.array([(e.x, e.y, e.width, e.height) for e in entities], dtype=np.float64)
+    arr = arr.reshape(-1, 4).astype(np.int64)
+    return arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+
+
+def with_grid(grid, field, projectiles):
+    # comme Game.update : boîtes des obstacles lues dans l'ObstacleField
+    grid.rebuild(*field.bounds())
+    queries, stored = grid.overlapping(*boxes(projectiles))
+    first = run_starts(queries)
+    return list(zip(queries[first].tolist(), stored[first].tolist()))
+
+
+def timed(func, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        result = func()
+    return (time.perf_counter() - start) / frames * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    grid = UniformGrid(WIDTH, HEIGHT, min_pairs=0)
+    brute = UniformGrid(WIDTH, HEIGHT, min_pairs=float("inf"))
+    print(f"{'obstacles':>9} {'tirs':>5} {'boucles ms':>11} {'direct ms':>10} {'grille ms':>10}")
+    for n_obstacles in (10, 100, 500, 2000):
+        for n_projectiles in (2, 20, 100, 500):
+            obstacles, field, projectiles = make_world(
+                random.Random(args.seed), n_obstacles, n_projectiles
+            )
+            loops_ms, expected = timed(lambda: nested_loops(obstacles, projectiles), args.frames)
+            brute_ms, brute_hits = timed(lambda: with_grid(brute, field, projectiles), args.frames)
+            grid_ms, grid_hits = timed(lambda: with_grid(grid, field, projectiles), args.frames)
+            if not expected == brute_hits == grid_hits:
+                raise SystemExit("résultats différents entre boucles et broadphase")
+            print(
+                f"{n_obstacles:>9} {n_projectiles:>5} {loops_ms:>11.3f} {brute_ms:>10.3f} {grid_ms:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
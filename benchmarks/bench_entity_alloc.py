@@ -0,0 +1,99 @@
+"""Mémoire des entités (__slots__) et allocations par minute de jeu, avec et sans EntityPool.
+
+1. Octets par entité mesurés par tracemalloc : Obstacle, PowerUp et
+   Projectile avec __slots__, contre les mêmes classes avec un __dict__.
+2. Une minute de jeu headless (3600 ticks, parties relancées à la fin),
+   les joueurs tirant toutes les --shot-every frames : entités
+   construites, collectes du ramasse-miettes (génération 0) et pic
+   tracemalloc, avec les pools de Game puis avec des pools désactivés
+   (limit=0 : chaque apparition construit une entité).
+
+Usage : python benchmarks/bench_entity_alloc.py [--minutes 2]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+from obstacle import Obstacle  # noqa: E402
+from powerup import PowerUp  # noqa: E402
+from projectile import Projectile  # noqa: E402
+
+ENTITIES = {
+    "Obstacle": (Obstacle, lambda rng: (rng,)),
+    "PowerUp": (PowerUp, lambda rng: (rng,)),
+    "Projectile": (Projectile, lambda rng: (rng.randint(0, 790), 500)),
+}
+
+
+def bytes_per_entity(kind, make_args, count=10000):
+    rng = random.Random(0)
+    args = [make_args(rng) for _ in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [kind(*arg) for arg in args]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del entities
+    return used / count
+
+
+def play(minutes, pooled, shot_every):
+    game = Game(headless=True, seed=0)
+    game.ai_all_default = True
+    game.start_game()
+    pools = (game.obstacle_pool, game.power_up_pool, game.projectile_pool)
+    if not pooled:
+        for pool in pools:
+            pool.limit = 0
+    ticks = minutes * 3600
+    gc.collect()
+    collections = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    for tick in range(ticks):
+        if game.game_over:
+            game.reset_game(start_immediately=True)
+        if tick % shot_every == 0:
+            for player in game.players:
+                player.ammo = player.max_ammo
+                game.player_shoot(player)
+        game.step()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    collections = gc.get_stats()[0]["collections"] - collections
+    created = sum(pool.created for pool in pools)
+    spawned = created + sum(pool.reused for pool in pools)
+    return spawned / minutes, created / minutes, collections / minutes, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=1, help="minutes de jeu simulées (3600 ticks)")
+    parser.add_argument("--shot-every", type=int, default=10, help="frames entre deux tirs de chaque joueur")
+    args = parser.parse_args()
+
+    print(f"{'entité':>10} | {'__slots__':>10} | {'__dict__':>10}")
+    for name, (kind, make_args) in ENTITIES.items():
+        with_dict = type(name, (kind,), {})  # sous-classe sans __slots__ : retrouve un __dict__
+        slots = bytes_per_entity(kind, make_args)
+        plain = bytes_per_entity(with_dict, make_args)
+        print(f"{name:>10} | {slots:7.0f} o | {plain:7.0f} o")
+
+    print()
+    print(f"{'pools':>10} | {'apparitions/min':>15} | {'construites/min':>15} | {'gc gen0/min':>11} | pic tracemalloc")
+    for pooled in (True, False):
+        spawned, created, collections, peak = play(args.minutes, pooled, args.shot_every)
+        print(
+            f"{'oui' if pooled else 'non':>10} | {spawned:15.0f} | {created:15.0f} | {collections:11.1f}"
+            f" | {peak / 1024:8.0f} Kio"
+        )
+
+
+if __name__ == "__main__":
+    main()
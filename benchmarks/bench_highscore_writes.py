@@ -0,0 +1,62 @@
+"""Nombre d'écritures de highscore.json pendant une partie qui bat le record.
+
+Simule une partie à 60 fps dont le score monte à chaque frame, puis une fin
+de partie, et compare l'ancien comportement (une écriture par frame) au
+HighScoreStore (écriture différée à débit borné).
+
+Usage : python benchmarks/bench_highscore_writes.py [--seconds 3] [--interval 1.0]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from highscore import HighScoreStore  # noqa: E402
+
+
+def run(store, frames, on_record):
+    # le score dépasse le record à chaque frame, comme dans Game.update
+    for score in range(1, frames + 1):
+        store.value = score
+        on_record(score)
+        time.sleep(1 / 60)
+    store.flush()  # fin de partie
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args()
+    frames = int(args.seconds * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = HighScoreStore(os.path.join(tmp, "legacy.json"))
+        # ancien save_high_score : écriture synchrone à chaque frame
+        run(legacy, frames, lambda score: legacy._write(score))
+
+        path = os.path.join(tmp, "highscore.json")
+        store = HighScoreStore(path, min_interval=args.interval)
+        start = time.perf_counter()
+        run(store, frames, store.set)
+        store.close()
+        elapsed = time.perf_counter() - start
+        with open(path, encoding="utf-8") as f:
+            saved = json.load(f)["high_score"]
+
+    # une écriture par intervalle entamé, plus la fin de partie
+    bound = math.ceil(elapsed / args.interval) + 1
+    print(f"{frames} frames ({args.seconds:.1f}s) avec un nouveau record à chaque frame")
+    print(f"avant (écriture par frame) : {legacy.writes} écritures")
+    print(f"après (écriture différée)  : {store.writes} écritures (borne {bound})")
+    assert saved == frames, f"record sauvegardé {saved} au lieu de {frames}"
+    assert store.writes <= bound
+
+
+if __name__ == "__main__":
+    main()
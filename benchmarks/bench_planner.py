@@ -0,0 +1,96 @@
+"""Survie des IA face au temps CPU de décision : SimpleAI contre PlannerAI à plusieurs budgets.
+
+Chaque configuration joue les mêmes parties headless (mêmes graines, deux
+joueurs IA) jusqu'à la fin de partie ou --frames ticks. Pour chaque joueur
+on note le tick de son élimination ; le temps passé dans decide() est
+mesuré autour de chaque appel et rapporté au tick simulé.
+
+Usage :
+    python benchmarks/bench_planner.py --games 5 --frames 3600
+    python benchmarks/bench_planner.py --budgets 250 1000 4000 --output planner.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+
+
+def timed(decide, totals):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return decide(*args, **kwargs)
+        finally:
+            totals[0] += time.perf_counter() - start
+            totals[1] += 1
+
+    return wrapper
+
+
+def play(seed, frames, ai_kind, ai_options):
+    """Joue une partie ; renvoie (ticks de survie par joueur, ticks joués, secondes dans decide)."""
+    game = Game(headless=True, seed=seed, ai_kind=ai_kind, ai_options=ai_options)
+    game.ai_all_default = True
+    game.start_game()
+    totals = [0.0, 0]
+    for controller in game.ai_controllers.values():
+        controller.decide = timed(controller.decide, totals)
+    survival = {}
+    while not game.game_over and game.frame_count < frames:
+        game.step()
+        for player in game.players:
+            if not player.alive:
+                survival.setdefault(player.name, game.frame_count)
+    for player in game.players:
+        survival.setdefault(player.name, game.frame_count)
+    return list(survival.values()), game.frame_count, totals[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=3600, help="ticks max par partie (60 par seconde)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--budgets", type=int, nargs="+", default=[250, 500, 1000, 2000], help="budgets du planificateur (µs)"
+    )
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    args = parser.parse_args()
+
+    configs = [("simple", "simple", {})]
+    configs += [(f"planner/{budget}us", "planner", {"budget_us": budget}) for budget in args.budgets]
+    results = {}
+    print(f"{'IA':>16} | survie moy. | survie min | parties complètes | decide / tick")
+    for name, kind, options in configs:
+        survivals, ticks, seconds = [], 0, 0.0
+        for index in range(args.games):
+            survival, played, spent = play(args.seed + index, args.frames, kind, options)
+            survivals += survival
+            ticks += played
+            seconds += spent
+        results[name] = {
+            "mean_survival_ticks": statistics.mean(survivals),
+            "min_survival_ticks": min(survivals),
+            "full_survivals": sum(1 for value in survivals if value >= args.frames),
+            "players": len(survivals),
+            "decide_ms_per_tick": seconds * 1000 / ticks,
+        }
+        row = results[name]
+        print(
+            f"{name:>16} | {row['mean_survival_ticks'] / 60:9.1f} s | {row['min_survival_ticks'] / 60:8.1f} s"
+            f" | {row['full_survivals']:>8}/{row['players']:<8} | {row['decide_ms_per_tick']:8.3f} ms"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"games": args.games, "frames": args.frames, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
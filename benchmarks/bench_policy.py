@@ -0,0 +1,90 @@
+"""Débit des décisions de PolicyAI : un appel par joueur contre un lot pour toutes les parties.
+
+N parties headless (deux joueurs IA chacune) sont avancées de --warmup
+ticks pour remplir l'écran d'obstacles, puis figées. On mesure ensuite
+les décisions par seconde :
+  - par joueur : decide() de chaque contrôleur, une inférence par appel ;
+  - en lot : PolicyAI.decide_batch() sur tous les joueurs de toutes les
+    parties, une multiplication matricielle par couche ;
+  - inférence seule : Policy.act() sur la matrice d'observations du lot.
+
+Usage :
+    python benchmarks/bench_policy.py --games 1 8 64 --hidden 64 64
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+from policy import FEATURES, Policy, PolicyAI  # noqa: E402
+
+
+def make_games(count, policy, warmup):
+    games = []
+    for seed in range(count):
+        game = Game(headless=True, seed=seed, ai_kind="policy", ai_options={"policy": policy})
+        game.ai_all_default = True
+        game.start_game()
+        game.run_headless(max_frames=warmup)
+        games.append(game)
+    return games
+
+
+def rate(function, decisions, rounds):
+    function()  # premier passage hors mesure
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return decisions * rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--hidden", type=int, nargs="*", default=[], help="couches cachées du MLP (linéaire sinon)")
+    parser.add_argument("--warmup", type=int, default=600, help="ticks joués avant la mesure")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    policy = Policy.random(hidden=tuple(args.hidden)) if args.hidden else Policy.default()
+    shape = " x ".join(str(n) for n in (len(FEATURES), *args.hidden, 3))
+    print(f"politique {shape}")
+    print(f"{'parties':>8} | {'joueurs':>7} | {'par joueur':>12} | {'en lot':>12} | {'inférence seule':>15}")
+    for count in args.games:
+        games = make_games(count, policy, args.warmup)
+        controllers, worlds = [], []
+        for game in games:
+            world = game._capture_world(False)
+            for player in game.players:
+                controllers.append(game.ai_controllers[player])
+                worlds.append(world)
+
+        def one_by_one():
+            for controller, world in zip(controllers, worlds):
+                controller.decide(world)
+
+        def batched():
+            PolicyAI.decide_batch(controllers, worlds)
+            for controller in controllers:
+                controller._prepared = PolicyAI._UNSET
+
+        observations = np.empty((len(controllers), len(FEATURES)))
+        for row, (controller, world) in enumerate(zip(controllers, worlds)):
+            controller._pinned, controller.state = world, controller.player
+            controller.observe(observations[row])
+            controller._pinned = None
+
+        n = len(controllers)
+        single = rate(one_by_one, n, args.rounds)
+        batch = rate(batched, n, args.rounds)
+        inference = rate(lambda: policy.act(observations), n, args.rounds)
+        print(f"{count:>8} | {n:>7} | {single:>10.0f}/s | {batch:>10.0f}/s | {inference:>13.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
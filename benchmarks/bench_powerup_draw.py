@@ -0,0 +1,61 @@
+"""Coût d'affichage de 50 power-ups : police recréée à chaque frame vs sprites en cache.
+
+Usage : python benchmarks/bench_powerup_draw.py [--frames 300] [--count 50]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from powerup import PowerUp  # noqa: E402
+
+
+def legacy_draw(power_up, screen):
+    # ancien PowerUp.draw : rect + nouvelle police + rendu du symbole à chaque appel
+    pygame.draw.rect(screen, power_up.color, (power_up.x, power_up.y, power_up.width, power_up.height))
+    font = pygame.font.Font(None, 20)
+    text = font.render(power_up.symbol, True, (0, 0, 0))
+    screen.blit(text, (power_up.x + 2, power_up.y + 6))
+
+
+def time_frames(screen, power_ups, draw, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((30, 30, 60))
+        for power_up in power_ups:
+            draw(power_up, screen)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--count", type=int, default=50)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    rng = random.Random(0)
+    power_ups = []
+    for _ in range(args.count):
+        power_up = PowerUp(rng)
+        power_up.y = rng.randint(0, 570)
+        power_ups.append(power_up)
+
+    before = time_frames(screen, power_ups, legacy_draw, args.frames)
+    after = time_frames(screen, power_ups, PowerUp.draw, args.frames)
+    print(f"{args.count} power-ups, {args.frames} frames")
+    print(f"avant (police par appel) : {before:.3f} ms/frame")
+    print(f"après (sprite en cache)  : {after:.3f} ms/frame  (x{before / after:.1f})")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
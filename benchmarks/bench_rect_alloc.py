@@ -0,0 +1,96 @@
+"""Rectangles pygame construits par frame chargée (joueurs IA, obstacles, power-ups, tirs).
+
+La partie headless est avancée de --warmup ticks. Pendant --frames ticks,
+le champ est ensuite gardé dense : il est complété à chaque frame jusqu'à
+--obstacles obstacles (répartis sur la moitié haute de l'écran) et
+--power-ups power-ups, et les joueurs tirent régulièrement. Une partie
+finie est relancée. pygame.Rect est remplacé par une sous-classe qui
+compte les constructions par ligne d'appel ; les rectangles tenus par les
+entités (mis à jour sur place) ne sont pas construits et n'apparaissent
+donc pas, quel que soit le nombre d'entités. tracemalloc donne en plus
+les octets alloués par frame encore vivants à la fin.
+
+Usage : python benchmarks/bench_rect_alloc.py [--frames 600] [--obstacles 40]
+"""
+import argparse
+import collections
+import os
+import sys
+import tracemalloc
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def busy_game(warmup, seed=0):
+    game = Game(headless=True, seed=seed)
+    game.ai_all_default = True
+    game.start_game()
+    game.run_headless(max_frames=warmup)
+    return game
+
+
+def fill(game, obstacles, power_ups):
+    """Complète le champ jusqu'à obstacles obstacles et power_ups power-ups."""
+    while len(game.obstacles) < obstacles:
+        obstacle = game.obstacle_pool.acquire(game.rng)
+        obstacle.y = game.rng.uniform(-obstacle.height, game.screen_height / 2)
+        game.obstacles.append(obstacle)
+        game.obstacle_pool.release(obstacle)
+    while len(game.power_ups) < power_ups:
+        game.power_ups.append(game.power_up_pool.acquire(game.rng))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--warmup", type=int, default=1200, help="ticks joués avant la mesure")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--obstacles", type=int, default=40, help="obstacles gardés à l'écran")
+    parser.add_argument("--power-ups", type=int, default=6, help="power-ups gardés à l'écran")
+    parser.add_argument("--shot-every", type=int, default=5, help="frames entre deux tirs de chaque joueur")
+    args = parser.parse_args()
+
+    game = busy_game(args.warmup)
+    sites = collections.Counter()
+    original = pygame.Rect
+
+    class CountingRect(original):
+        def __init__(self, *args):
+            caller = sys._getframe(1)
+            sites[f"{os.path.relpath(caller.f_code.co_filename, ROOT)}:{caller.f_lineno}"] += 1
+            super().__init__(*args)
+
+    pygame.Rect = CountingRect
+    tracemalloc.start()
+    try:
+        entities = 0
+        for tick in range(args.frames):
+            if game.game_over:
+                game.reset_game(start_immediately=True)
+            fill(game, args.obstacles, args.power_ups)
+            entities += len(game.obstacles) + len(game.power_ups) + len(game.projectiles)
+            if tick % args.shot_every == 0:
+                for player in game.players:
+                    player.ammo = player.max_ammo
+                    game.player_shoot(player)
+            game.step()
+        played = args.frames
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        pygame.Rect = original
+
+    print(f"{played} frames, {entities / played:.1f} entités par frame en moyenne (obstacles, power-ups, tirs)")
+    print(f"pygame.Rect construits : {sum(sites.values()) / played:.1f} par frame")
+    for site, count in sites.most_common():
+        print(f"  {site:>20} : {count / played:6.2f} par frame")
+    print(f"mémoire encore allouée : {current / played:.0f} o par frame")
+
+
+if __name__ == "__main__":
+    main()
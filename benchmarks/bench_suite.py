@@ -0,0 +1,172 @@
+"""Suite de benchmarks : Game.update, Game.draw et SimpleAI.make_decision sur des mondes synthétiques.
+
+Chaque monde contient N obstacles, N tirs et N particules (N = 10, 100,
+1000, 10000). update() est mesuré sur un monde reconstruit à chaque
+échantillon, draw() et make_decision() sur le même monde. Les médianes
+sont écrites en JSON ; --compare relit un fichier de référence et échoue
+si une mesure régresse de plus de --threshold %.
+
+Usage :
+    python benchmarks/bench_suite.py --output bench.json
+    python benchmarks/bench_suite.py --compare bench.json --threshold 15
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game  # noqa: E402
+from highscore import HighScoreStore  # noqa: E402
+from obstacle import Obstacle  # noqa: E402
+from particles import ParticlePool  # noqa: E402
+from projectile import Projectile  # noqa: E402
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def populate(game, size, seed):
+    """Remet la partie à zéro puis la remplit de size obstacles, tirs et particules."""
+    game.reset_game(start_immediately=True)
+    rng = random.Random(seed)
+    for _ in range(size):
+        obstacle = Obstacle(rng)
+        obstacle.y = rng.uniform(-80, game.screen_height)
+        game.obstacles.append(obstacle)
+    game.projectiles.extend(
+        Projectile(rng.randint(0, game.screen_width - 10), rng.randint(0, game.screen_height))
+        for _ in range(size)
+    )
+    game.particles = ParticlePool(capacity=max(1024, size), seed=seed)
+    for _ in range(-(-size // 12)):
+        game.particles.spawn(
+            rng.randint(0, game.screen_width), rng.randint(0, game.screen_height), (255, 200, 80), 12
+        )
+    game.flash_timer = 0.0
+
+
+def sample(func, repeat, setup=None):
+    # un appel de chauffe, hors mesure (allocations et caches du premier passage)
+    if setup is not None:
+        setup()
+    func()
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        # comme timeit : pas de ramasse-miettes pendant la mesure
+        gc.disable()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        times.append(elapsed * 1000)
+    times.sort()
+    return {
+        "median_ms": statistics.median(times),
+        "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "min_ms": times[0],
+        "samples": len(times),
+    }
+
+
+def run_suite(sizes, repeat, seed):
+    game = Game(seed=seed)
+    # pas d'écriture du vrai highscore.json pendant les mesures
+    tmp = tempfile.TemporaryDirectory()
+    game.high_scores = HighScoreStore(os.path.join(tmp.name, "highscore.json"))
+    game.ai_all_default = True
+    results = {}
+    for size in sizes:
+        results[f"update/{size}"] = sample(
+            game.update, repeat, setup=lambda: populate(game, size, seed)
+        )
+
+        populate(game, size, seed)
+        game.draw()  # premier rendu : caches de texte et de sprites
+        results[f"draw/{size}"] = sample(game.draw, repeat)
+
+        ai = game.ai_controllers[game.players[0]]
+
+        def decide():
+            game.obstacles.version += 1  # nouvelle frame : pas de scan en cache
+            ai.make_decision()
+
+        results[f"make_decision/{size}"] = sample(decide, repeat)
+        print(
+            f"{size:>6} : update {results[f'update/{size}']['median_ms']:8.3f} ms"
+            f" | draw {results[f'draw/{size}']['median_ms']:8.3f} ms"
+            f" | make_decision {results[f'make_decision/{size}']['median_ms']:8.3f} ms"
+        )
+    game.close()  # comme Game.run : attend le thread des sons avant pygame.quit()
+    tmp.cleanup()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Liste des (mesure, référence, actuelle, écart %) au-delà du seuil."""
+    regressions = []
+    for name, reference in baseline["results"].items():
+        current = results.get(name)
+        if current is None or reference["median_ms"] <= 0:
+            continue
+        change = (current["median_ms"] / reference["median_ms"] - 1) * 100
+        status = "REGRESSION" if change > threshold else "ok"
+        print(
+            f"{name:>22} : {reference['median_ms']:8.3f} -> {current['median_ms']:8.3f} ms"
+            f" ({change:+6.1f} %) {status}"
+        )
+        if change > threshold:
+            regressions.append((name, reference["median_ms"], current["median_ms"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="fichier JSON des résultats")
+    parser.add_argument("--compare", metavar="REFERENCE", help="JSON de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=20.0, help="régression tolérée en %%")
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.repeat, args.seed)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import numpy as np
+
+
+def rects_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Test de pygame.Rect.colliderect sur des tableaux (coordonnées déjà entières)."""
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+
+def run_starts(values):
+    """Masque des premières occurrences dans un tableau trié (np.unique est lent ici)."""
+    starts = np.empty(len(values), dtype=bool)
+    starts[:1] = True
+    np.not_equal(values[1:], values[:-1], out=starts[1:])
+    return starts
+
+
+class UniformGrid:
+    """Broadphase par grille uniforme sur l'écran.
+
+    rebuild() enregistre les boîtes (x, y, largeur, hauteur) de la frame ;
+    overlapping() renvoie, pour un second lot de boîtes, les paires
+    (requête, boîte rangée) qui se touchent. Au-delà de min_pairs paires
+    possibles, seules les paires qui partagent une cellule de la grille passent
+    au test exact ; en dessous, un test direct de toutes les paires coûte moins
+    cher que la grille. Tout est calculé en bloc avec NumPy, sans boucle par
+    objet. Les boîtes hors écran sont rabattues sur les cellules du bord :
+    requêtes et boîtes rangées subissent le même rabattement, rien n'est perdu.
+    """
+
+    def __init__(self, width, height, cell_size=64, min_pairs=20000):
+        self.cell_size = cell_size
+        self.min_pairs = min_pairs
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self.size = 0
+        self._boxes = None
+        self._built = False
+        self._starts = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+        self._owners = np.zeros(0, dtype=np.int64)
+
+    def _cells(self, x, y, width, height):
+        # cellules couvertes par chaque boîte -> (ids de cellule, indice de boîte)
+        cs = self.cell_size
+        # np.clip est nettement plus lent que minimum/maximum sur de petits tableaux
+        x0 = np.minimum(np.maximum(x // cs, 0), self.cols - 1)
+        x1 = np.minimum(np.maximum((x + width - 1) // cs, x0), self.cols - 1)
+        y0 = np.minimum(np.maximum(y // cs, 0), self.rows - 1)
+        y1 = np.minimum(np.maximum((y + height - 1) // cs, y0), self.rows - 1)
+        nx = x1 - x0 + 1
+        counts = nx * (y1 - y0 + 1)
+        owners = np.repeat(np.arange(len(x)), counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        span = nx[owners]
+        cells = (y0[owners] + local // span) * self.cols + x0[owners] + local % span
+        return cells, owners
+
+    def rebuild(self, x, y, width, height):
+        # la grille elle-même n'est construite qu'au premier besoin
+        self._boxes = (x, y, width, height)
+        self.size = len(x)
+        self._built = False
+
+    def _build(self):
+        cells, owners = self._cells(*self._boxes)
+        order = np.argsort(cells, kind="stable")
+        self._owners = owners[order]
+        per_cell = np.bincount(cells, minlength=self.cols * self.rows)
+        self._starts[1:] = np.cumsum(per_cell)
+        self._built = True
+
+    def pairs(self, x, y, width, height):
+        """Paires candidates (indice requête, indice rangé), triées et sans doublon."""
+        if not self.size or not len(x):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        if not self._built:
+            self._build()
+        cells, queries = self._cells(x, y, width, height)
+        starts = self._starts[cells]
+        counts = self._starts[cells + 1] - starts
+        total = counts.sum()
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        stored = self._owners[np.repeat(starts, counts) + offsets]
+        keys = np.sort(np.repeat(queries, counts) * self.size + stored)
+        keys = keys[run_starts(keys)]
+        return keys // self.size, keys % self.size
+
+    def overlapping(self, x, y, width, height):
+        """Paires (requête, rangée) qui se touchent vraiment, triées par requête puis rangée."""
+        sx, sy, sw, sh = self._boxes
+        if len(x) * self.size <= self.min_pairs:
+            hit = rects_overlap(
+                x[:, None], y[:, None], width[:, None], height[:, None],
+                sx[None, :], sy[None, :], sw[None, :], sh[None, :],
+            )
+            return np.nonzero(hit)
+        queries, stored = self.pairs(x, y, width, height)
+        hit = rects_overlap(
+            x[queries], y[queries], width[queries], height[queries],
+            sx[stored], sy[stored], sw[stored], sh[stored],
+        )
+        return queries[hit], stored[hit]
@@ -0,0 +1,202 @@
+import math
+
+import numpy as np
+
+ABOVE, IN_ROW, PASSED = 0, 1, 2
+
+
+class DangerMap:
+    """Carte 1-D des dangers pour une rangée de l'écran (en pratique celle d'un joueur).
+
+    Chaque colonne (ou paquet de bucket colonnes) garde le moment le plus
+    proche où un obstacle qui la couvre entrera dans la rangée [top, bottom) :
+    -inf s'il y est déjà, +inf si aucun obstacle encore au-dessus de bottom
+    ne la couvre. Les moments sont comptés sur l'horloge de chute (somme des
+    speed_scale passés à advance) : tous les obstacles tombent au même
+    rythme, donc une chute ne change rien à la carte. Seuls les évènements
+    la modifient : apparition, entrée dans la rangée, sortie par le bas,
+    obstacle détruit. L'ObstacleField les signale à ses cartes ; les
+    colonnes à recalculer sont notées puis recalculées ensemble à la
+    requête suivante.
+
+    Les tests de la rangée reprennent ceux des rectangles pygame (y tronqué),
+    les requêtes sont exactes avec bucket=1.
+    """
+
+    LOOP_LIMIT = 16  # au-delà, _flush passe par un calcul vectorisé
+
+    def __init__(self, field, top, bottom, width=800, bucket=1):
+        self.field = field
+        self.top = top
+        self.bottom = bottom
+        self.bucket = bucket
+        self.clock = 0.0
+        self.entry = np.full(-(-width // bucket), np.inf)
+        self.phase = np.full(len(field.x), PASSED, dtype=np.int8)
+        self._stale = []  # (premières, dernières colonnes) à recalculer
+        self.rebuild()
+
+    def rebuild(self):
+        """Recalcule toute la carte depuis le champ."""
+        field = self.field
+        if len(self.phase) < len(field.x):
+            self.phase = np.full(len(field.x), PASSED, dtype=np.int8)
+        n = field.count
+        self.phase[:n] = self._phases(slice(0, n))
+        self.phase[: n][~field.alive[:n]] = PASSED
+        self._stale = [(np.array([0]), np.array([len(self.entry)]))]
+        self._flush()
+
+    def frozen(self):
+        """Copie figée des colonnes, pour un instantané lu hors du thread principal."""
+        self._flush()
+        copy = DangerMap.__new__(DangerMap)
+        copy.field = None
+        copy.top, copy.bottom, copy.bucket = self.top, self.bottom, self.bucket
+        copy.clock = self.clock
+        copy.entry = self.entry.copy()
+        copy.phase = None
+        copy._stale = []
+        return copy
+
+    # --- évènements signalés par l'ObstacleField
+
+    def added(self, index):
+        if index >= len(self.phase):
+            self.phase = np.concatenate(
+                (self.phase, np.full(len(self.field.x) - len(self.phase), PASSED, dtype=np.int8))
+            )
+        phase = self._phases(slice(index, index + 1))[0]
+        self.phase[index] = phase
+        if phase != PASSED:
+            start, stop = self._columns(self.field.x[index], self.field.x[index] + self.field.width[index])
+            value = self._entry_times(np.array([index]))[0]
+            np.minimum(self.entry[start:stop], value, out=self.entry[start:stop])
+
+    def removed(self, indices):
+        """Obstacles tués (déjà marqués morts dans le champ)."""
+        indices = np.atleast_1d(indices)
+        indices = indices[self.phase[indices] != PASSED]
+        if indices.size:
+            self.phase[indices] = PASSED
+            self._stale.append(self._spans(indices))
+
+    def advanced(self, speed_scale):
+        self.clock += speed_scale
+        n = self.field.count
+        phases = self._phases(slice(0, n))
+        phases[~self.field.alive[:n]] = PASSED
+        changed = np.flatnonzero(phases != self.phase[:n])
+        if not changed.size:
+            return
+        self.phase[:n] = phases
+        self._stale.append(self._spans(changed))
+
+    def compacted(self, live):
+        self.phase[: live.size] = self.phase[live]
+        self.phase[live.size :] = PASSED
+
+    def cleared(self):
+        self.phase[:] = PASSED
+        self.entry[:] = np.inf
+        self._stale = []
+
+    # --- requêtes (x en pixels, intervalle [x0, x1))
+
+    def _columns(self, x0, x1):
+        start = max(0, math.floor(x0) // self.bucket)
+        stop = min(len(self.entry), (math.ceil(x1) - 1) // self.bucket + 1)
+        return start, stop
+
+    def earliest(self, x0, x1):
+        """Temps (en frames à 60 Hz) avant qu'un obstacle entre dans la rangée entre x0 et x1."""
+        self._flush()
+        start, stop = self._columns(x0, x1)
+        if start >= stop:
+            return math.inf
+        return max(0.0, self.entry[start:stop].min().item() - self.clock)
+
+    def occupied(self, x0, x1):
+        """Un obstacle touche-t-il la rangée entre x0 et x1 en ce moment ?"""
+        self._flush()
+        start, stop = self._columns(x0, x1)
+        return start < stop and self.entry[start:stop].min() == -np.inf
+
+    def approaching(self, x0, x1):
+        """Un obstacle encore au-dessus du bas de la rangée couvre-t-il [x0, x1) ?"""
+        self._flush()
+        start, stop = self._columns(x0, x1)
+        return start < stop and self.entry[start:stop].min() < np.inf
+
+    # --- calculs internes
+
+    def _phases(self, slots):
+        field = self.field
+        y = field.y[slots]
+        top = y.astype(np.int64)
+        phases = np.where((top < self.bottom) & (top + field.height[slots] > self.top), IN_ROW, ABOVE)
+        phases[y >= self.bottom] = PASSED
+        return phases.astype(np.int8)
+
+    def _spans(self, indices):
+        """Colonnes [premières, dernières) couvertes par des obstacles."""
+        x = self.field.x[indices]
+        first = np.clip(x // self.bucket, 0, len(self.entry))
+        last = np.clip((x + self.field.width[indices] - 1) // self.bucket + 1, 0, len(self.entry))
+        return first, last
+
+    def _entry_times(self, indices):
+        field = self.field
+        # y tronqué : l'obstacle touche la rangée dès que y >= top - hauteur + 1
+        distance = self.top - field.height[indices] + 1 - field.y[indices]
+        times = self.clock + np.maximum(0.0, distance / field.speed[indices])
+        times[self.phase[indices] == IN_ROW] = -np.inf
+        return times
+
+    def _flush(self):
+        """Recalcule les colonnes notées depuis les obstacles qui les couvrent."""
+        if not self._stale:
+            return
+        firsts = np.concatenate([first for first, _ in self._stale])
+        lasts = np.concatenate([last for _, last in self._stale])
+        self._stale = []
+        low, high = firsts.min().item(), lasts.max().item()
+        if low >= high:
+            return
+        field = self.field
+        n = field.count
+        x = field.x[:n]
+        covering = np.flatnonzero(
+            (self.phase[:n] != PASSED) & (x < high * self.bucket) & (x + field.width[:n] > low * self.bucket)
+        )
+        first, last = self._spans(covering)
+        first, last = np.maximum(first, low), np.minimum(last, high)
+        if len(firsts) == 1:
+            touched = None
+            self.entry[low:high] = np.inf
+        else:
+            # colonnes notées : somme de +1/-1 aux bords des intervalles
+            edges = np.zeros(len(self.entry) + 1, dtype=np.int64)
+            np.add.at(edges, firsts, 1)
+            np.add.at(edges, lasts, -1)
+            touched = np.cumsum(edges[:-1]) > 0
+            self.entry[touched] = np.inf
+        values = self._entry_times(covering)
+        if covering.size <= self.LOOP_LIMIT:
+            # peu d'obstacles concernés : une tranche chacun
+            for start, stop, value in zip(first.tolist(), last.tolist(), values.tolist()):
+                segment = self.entry[start:stop]
+                if touched is None:
+                    np.minimum(segment, value, out=segment)
+                else:
+                    np.minimum(segment, np.where(touched[start:stop], value, np.inf), out=segment)
+            return
+        # beaucoup d'obstacles : toutes les colonnes couvertes (colonne, valeur) à plat
+        lengths = np.maximum(0, last - first)
+        starts = np.repeat(first - (np.cumsum(lengths) - lengths), lengths)
+        columns = starts + np.arange(lengths.sum())
+        values = np.repeat(values, lengths)
+        if touched is not None:
+            keep = touched[columns]
+            columns, values = columns[keep], values[keep]
+        np.minimum.at(self.entry, columns, values)
@@ -0,0 +1,62 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Affichage par rectangles sales : seules les zones modifiées sont envoyées à l'écran.
+
+    Chaque frame, begin() efface les zones dessinées à la frame précédente
+    avec la couleur de fond, le jeu redessine puis signale ses zones via
+    mark(), et present() envoie à pygame.display.update() l'union des
+    anciennes et des nouvelles zones. Un changement de fond (palier de
+    niveau) ou un overlay plein écran (flash, menu, pause, options, game
+    over) force un redessin complet avec flip() ; la frame suivante est
+    elle aussi complète pour effacer l'overlay.
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.background = None
+        self.previous = []
+        self.current = []
+        self.full = True
+        self._full_next = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        """Force un redessin complet à la prochaine frame."""
+        self._full_next = True
+
+    def begin(self, background, full=False):
+        """Efface la frame précédente ; full=True pour une frame avec overlay."""
+        if background != self.background:
+            self.background = background
+            full = True
+        self.full = full or self._full_next
+        # un overlay n'est pas suivi par rects : la frame suivante repart de zéro
+        self._full_next = full
+        if self.full:
+            self.screen.fill(background)
+        else:
+            fill = self.screen.fill
+            for rect in self.previous:
+                fill(background, rect)
+        self.current = []
+
+    def mark(self, rect):
+        """Enregistre une zone dessinée (Rect ou None) ; renvoie rect."""
+        if rect:
+            self.current.append(rect)
+        return rect
+
+    def mark_all(self, rects):
+        self.current.extend(rect for rect in rects if rect)
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self.previous + self.current)
+            self.partial_frames += 1
+        self.previous = self.current
@@ -0,0 +1,69 @@
+class EntityPool:
+    """Liste libre d'entités (Obstacle, PowerUp, Projectile) réutilisées au lieu d'être recréées.
+
+    acquire() ressort une entité rendue et la réinitialise par sa méthode
+    reset(), qui prend les mêmes arguments que le constructeur (et tire
+    les mêmes nombres aléatoires) ; la liste vide, une entité est
+    construite. release() la rend dès qu'elle quitte le jeu : au-delà de
+    limit entités libres, elle est laissée au ramasse-miettes.
+    """
+
+    def __init__(self, kind, limit=256):
+        self.kind = kind
+        self.limit = limit
+        self.free = []
+        self.created = 0  # entités construites
+        self.reused = 0  # entités ressorties de la liste libre
+
+    def __len__(self):
+        return len(self.free)
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*args, **kwargs)
+            self.reused += 1
+            return entity
+        self.created += 1
+        return self.kind(*args, **kwargs)
+
+    def release(self, entity):
+        if len(self.free) < self.limit:
+            self.free.append(entity)
+
+
+class EntityList(list):
+    """Liste d'entités aux retraits différés : kill(indice) marque, compact() retire.
+
+    Game.update marque les power-ups et les tirs qui quittent le jeu pendant
+    la frame au lieu de les retirer un à un (list.remove : recherche par
+    identité puis décalage, à chaque retrait) ; compact() les retire tous
+    en une passe, dans l'ordre, en les rendant à leur pool. Les indices
+    restent donc stables jusqu'au compact(). La liste est la même d'une
+    partie à l'autre (clear() vide sur place) : les IA et les instantanés
+    qui la lisent restent branchés dessus.
+    """
+
+    def __init__(self, entities=()):
+        super().__init__(entities)
+        self.dead = set()  # indices marqués depuis le dernier compact()
+
+    def kill(self, index):
+        self.dead.add(index)
+
+    def compact(self, release=None):
+        if not self.dead:
+            return
+        dead = self.dead
+        if release is not None:
+            for index in sorted(dead):
+                release(self[index])
+        self[:] = [entity for index, entity in enumerate(self) if index not in dead]
+        dead.clear()
+
+    def clear(self, release=None):
+        if release is not None:
+            for entity in self:
+                release(entity)
+        super().clear()
+        self.dead.clear()
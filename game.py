@@ -1,59 +1,142 @@
-import json
-import os
 import random
 import time
+import numpy as np
 import pygame
 from player import Player
-from obstacle import Obstacle
+from obstacle import Obstacle, ObstacleField
+from entity_pool import EntityList, EntityPool
+from particles import ParticlePool
+from text_cache import TextCache
+from dirty_rects import DirtyRectRenderer
+from surface_cache import SurfaceCache
+from highscore import HighScoreStore
+from asset_loader import AssetLoader
+from profiler import FrameProfiler
 from ai import SimpleAI
+from ai_scheduler import AIScheduler
+from planner import PlannerAI
+from policy import PolicyAI
+from snapshot import WorldSnapshot
+from broadphase import UniformGrid, run_starts
 from powerup import PowerUp
 from projectile import Projectile
 
 
+class InputState(dict):
+    """Touches injectées (mode headless) : une touche absente est relâchée."""
+
+    def __missing__(self, key):
+        return False
+
+
+# contrôleurs IA disponibles (main.py --ai)
+AI_KINDS = {"simple": SimpleAI, "planner": PlannerAI, "policy": PolicyAI}
+
+
 class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
+    def __init__(
+        self,
+        headless=False,
+        rng=None,
+        dirty_rects=False,
+        tick_rate=60,
+        max_fps=60,
+        seed=None,
+        ai_workers=0,
+        ai_budget_ms=None,
+        ai_rate=None,
+        ai_kind="simple",
+        ai_options=None,
+    ):
+        # headless : pas de fenêtre, pas de son, pas de limite de fps
+        self.headless = headless
+        # pas fixe : la simulation avance par ticks de dt secondes, l'affichage suit à son rythme
+        self.tick_rate = tick_rate
+        self.dt = 1 / tick_rate
+        # vitesses en pixels par frame à 60 Hz, ramenées au tick (entier si exact)
+        step_scale = 60 / tick_rate
+        self.step_scale = int(step_scale) if step_scale.is_integer() else step_scale
+        self.max_fps = max_fps  # 0 : affichage sans limite
+        self.max_ticks_per_frame = 5  # au-delà, la simulation ralentit plutôt que de s'emballer
+        self.render_dt = 1 / 60
+        # seed : graine de la partie, dont dérivent apparitions, IA et particules
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        # rng : source des apparitions d'obstacles/power-ups (random.Random propre à la partie)
+        self.rng = rng if rng is not None else random.Random(self.seed)
         self.screen_width = 800
         self.screen_height = 600
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.display.set_caption("Jeu Multi IA - Score: 0")
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        if headless:
+            self.screen = None
+            self.clock = None
+            self.font = None
+            self.small_font = None
+        else:
+            # seulement les modules utilisés ; le mixer est ouvert par AssetLoader, en arrière-plan
+            pygame.display.init()
+            pygame.font.init()
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+            pygame.display.set_caption("Jeu Multi IA - Score: 0")
+            self.clock = pygame.time.Clock()
+            self.font = pygame.font.Font(None, 36)
+            self.small_font = pygame.font.Font(None, 24)
+
+        self.text_cache = TextCache()
+        self.surfaces = SurfaceCache()
+        self._frozen_frame = None  # (clé, copie de l'écran) du décor de menu/pause
+        # dirty_rects : n'envoyer à l'écran que les zones modifiées
+        self.renderer = DirtyRectRenderer(self.screen) if dirty_rects and not headless else None
 
         self.players = self._create_players()
-        self.obstacles = []
-        self.power_ups = []
-        self.projectiles = []
+        # entités réutilisées plutôt que recréées à chaque apparition
+        self.obstacle_pool = EntityPool(Obstacle)
+        self.power_up_pool = EntityPool(PowerUp)
+        self.projectile_pool = EntityPool(Projectile)
+        self.obstacles = ObstacleField(screen_height=self.screen_height)
+        # listes gardées d'une partie à l'autre : les IA y restent branchées
+        self.power_ups = EntityList()
+        self.projectiles = EntityList()
+        # ai_workers : décisions des IA sur des threads (0 : dans le tick, déterministe)
+        self.ai_rate = ai_rate  # décisions par seconde de chaque IA (None : à chaque tick)
+        self.ai_kind = ai_kind  # clé de AI_KINDS ; ai_options : paramètres du contrôleur
+        self.ai_options = ai_options or {}
+        self.ai_scheduler = AIScheduler(ai_workers, ai_budget_ms)
         self.ai_controllers = self._create_ai_controllers()
+        self.broadphase = UniformGrid(self.screen_width, self.screen_height)
+        self.player_grid = UniformGrid(self.screen_width, self.screen_height)
 
         self.obstacle_timer = 0
         self.game_over = False
         self.level = 1
-        self.start_time = time.time()
+        self.frame_count = 0
         self.power_up_timer = 0
         self.ai_thinking = {player.name: False for player in self.players}
         self.global_best = 0
-        self.high_score = self.load_high_score()
+        self.high_scores = HighScoreStore()
+        self.high_score = self.high_scores.value
         self.paused = False
         self.in_menu = True
         self.slow_timer = 0.0
         self.muted = False
         self.music_volume = 0.4
         self.fx_volume = 0.7
-        self.sounds = self._load_sounds()
-        self.music_loaded = self._load_music()
-        if self.music_loaded:
-            pygame.mixer.music.play(-1)
+        # sons et musique arrivent pendant que le menu tourne (poll_assets) ; un son absent est ignoré
+        self.sounds = {}
+        self.music_loaded = False
+        self.assets = None
+        if not headless:
+            self.assets = AssetLoader()
+            self.assets.start()
         self.flash_timer = 0.0
-        self.particles = []
+        self.particles = ParticlePool(seed=self.seed)
+        self.recorder = None  # ReplayRecorder éventuel (main.py --record)
+        self.profiler = FrameProfiler()
         self.in_options = False
         self.pending_remap = None  # (player_index, control_name)
         self.ai_all_default = False
         self.active_players = 2
         self.menu_button_rects = {}
         self.menu_pressed = None
+        self._shoot_held = {}  # step() : touche de tir enfoncée au tick précédent, par joueur
 
     def _create_players(self):
         return [
@@ -88,70 +171,46 @@ class Game:
         ]
 
     def _create_ai_controllers(self):
+        # une graine par joueur : les décisions de l'IA ne décalent pas les apparitions
+        controller = AI_KINDS[self.ai_kind]
         return {
-            player: SimpleAI(
-                player, self.obstacles, self.power_ups, self.screen_width, self.screen_height
+            player: controller(
+                player,
+                self.obstacles,
+                self.power_ups,
+                self.screen_width,
+                self.screen_height,
+                step_scale=self.step_scale,
+                rng=random.Random(f"{self.seed}:{index}"),
+                decision_rate=self.ai_rate,
+                **self.ai_options,
             )
-            for player in self.players
-        }
-
-    def _find_asset(self, base_name, exts):
-        sfx_dir = os.path.join("assets", "sfx")
-        for ext in exts:
-            path = os.path.join(sfx_dir, f"{base_name}{ext}")
-            if os.path.exists(path):
-                return path
-        return None
-
-    def _load_sound(self, base_name, volume=0.6):
-        path = self._find_asset(base_name, [".wav", ".ogg", ".mp3"])
-        if not path:
-            return None
-        try:
-            sound = pygame.mixer.Sound(path)
-            sound.set_volume(volume)
-            return sound
-        except Exception:
-            return None
-
-    def _load_sounds(self):
-        return {
-            "hit": self._load_sound("hit", self.fx_volume),
-            "powerup": self._load_sound("powerup", self.fx_volume),
-            "zap": self._load_sound("zap", self.fx_volume),
-            "ai_grace": self._load_sound("ai_grace", self.fx_volume),
-            "click": self._load_sound("click", self.fx_volume),
+            for index, player in enumerate(self.players)
         }
 
-    def _load_music(self):
-        path = self._find_asset("music", [".ogg", ".mp3", ".wav"])
-        if not path:
-            return False
-        try:
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.set_volume(self.music_volume)
-            return True
-        except Exception:
-            return False
+    def _capture_world(self, copy):
+        # un seul instantané du monde par tick, partagé par toutes les IA ;
+        # copié quand les décisions tournent sur d'autres threads
+        return WorldSnapshot(self.obstacles, self.power_ups, copy=copy, slow_timer=self.slow_timer)
+
+    def poll_assets(self):
+        """Prend en compte les sons et la musique chargés depuis la dernière frame."""
+        for name, asset in self.assets.poll():
+            if name == "music":
+                self.music_loaded = True
+                pygame.mixer.music.set_volume(0 if self.muted else self.music_volume)
+                pygame.mixer.music.play(-1)
+            else:
+                asset.set_volume(0 if self.muted else self.fx_volume)
+                self.sounds[name] = asset
 
     def play_sound(self, name):
-        snd = self.sounds.get(name)
+        snd = self.sounds.get(name)  # absent tant que le thread de chargement ne l'a pas livré
         if snd and not self.muted:
             snd.play()
 
     def spawn_particles(self, x, y, color=(255, 255, 255), amount=12):
-        for _ in range(amount):
-            self.particles.append(
-                {
-                    "x": x + random.randint(-5, 5),
-                    "y": y + random.randint(-5, 5),
-                    "vx": random.uniform(-2, 2),
-                    "vy": random.uniform(-2, 2),
-                    "life": random.randint(20, 35),
-                    "color": color,
-                    "size": random.randint(2, 4),
-                }
-            )
+        self.particles.spawn(x, y, color, amount)
 
     def set_fx_volume(self, value):
         self.fx_volume = max(0.0, min(1.0, value))
@@ -168,29 +227,27 @@ class Game:
             pass
 
     def load_high_score(self):
-        path = "highscore.json"
-        if not os.path.exists(path):
-            return 0
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return int(data.get("high_score", 0))
-        except Exception:
-            return 0
+        return self.high_scores.load()
 
     def save_high_score(self):
-        path = "highscore.json"
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({"high_score": self.high_score}, f)
-        except Exception:
-            pass
+        # écriture différée : le thread de HighScoreStore s'en charge
+        self.high_scores.set(self.high_score)
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                # une saisie peut changer le HUD ou le menu : recomposer le décor figé
+                self._frozen_frame = None
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    continue
+                if event.key == pygame.K_F4:
+                    if self.profiler.filled:
+                        self.profiler.dump_csv()
+                    continue
                 if event.key == pygame.K_ESCAPE:
                     if self.in_options:
                         self.in_options = False
@@ -229,10 +286,7 @@ class Game:
                                 continue
                             shoot_key = player.controls.get("shoot")
                             if shoot_key and event.key == shoot_key:
-                                proj = player.shoot()
-                                if proj:
-                                    self.projectiles.append(proj)
-                                    self.play_sound("zap")
+                                self.player_shoot(player)
             if event.type == pygame.MOUSEBUTTONDOWN and self.in_menu:
                 self.menu_pressed = self.get_menu_key_at_pos(event.pos)
                 if self.menu_pressed:
@@ -242,6 +296,14 @@ class Game:
                 self.menu_pressed = None
         return True
 
+    def player_shoot(self, player):
+        proj = player.shoot(self.projectile_pool)
+        if proj:
+            self.projectiles.append(proj)
+            self.play_sound("zap")
+            if self.recorder is not None:
+                self.recorder.note_shot(self.players.index(player))
+
     def handle_options_input(self, event):
         # Pendant le remap, le prochain keydown assigne directement
         if self.pending_remap and event.key not in (pygame.K_ESCAPE, pygame.K_o):
@@ -314,14 +376,21 @@ class Game:
     def reset_game(self, start_immediately=False):
         for player in self.players:
             player.reset()
-        self.obstacles = []
-        self.power_ups = []
-        self.projectiles = []
-        self.ai_controllers = self._create_ai_controllers()
+        # vidés sur place : les contrôleurs IA gardent leurs références
+        self.obstacles.clear()
+        self.power_ups.clear(self.power_up_pool.release)
+        self.projectiles.clear(self.projectile_pool.release)
+        self.ai_scheduler.reset()
+        for index, controller in enumerate(self.ai_controllers.values()):
+            controller.reset(random.Random(f"{self.seed}:{index}"))
+        for player in self.players:
+            # carte des dangers de chaque rangée de joueur, tenue à jour dès le premier obstacle
+            rect = player.get_rect()
+            self.obstacles.danger_map(rect.y, rect.bottom)
         self.obstacle_timer = 0
         self.game_over = False
         self.level = 1
-        self.start_time = time.time()
+        self.frame_count = 0
         self.power_up_timer = 0
         self.ai_thinking = {player.name: False for player in self.players}
         self.paused = False
@@ -329,7 +398,8 @@ class Game:
         self.flash_timer = 0.0
         if start_immediately:
             self.in_menu = False
-        pygame.display.set_caption("Jeu Multi IA - Score: 0")
+        if not self.headless:
+            pygame.display.set_caption("Jeu Multi IA - Score: 0")
         if self.music_loaded and not self.muted:
             pygame.mixer.music.play(-1)
 
@@ -341,130 +411,182 @@ class Game:
             # désactiver le joueur 2
             self.players[1].alive = False
             self.players[1].ai_enabled = False
+        if self.recorder is not None:
+            self.recorder.start(self)
 
     def zap_closest_obstacle(self):
-        if not self.obstacles:
+        target = self.obstacles.lowest()
+        if target is None:
             return
-        target = max(self.obstacles, key=lambda o: o.y)
-        self.obstacles.remove(target)
+        self.obstacles.kill(target)
         self.play_sound("zap")
 
-    def update(self):
+    def _entity_boxes(self, entities):
+        # boîtes entières comme pygame.Rect (coordonnées tronquées)
+        boxes = np.array(
+            [(entity.x, entity.y, entity.width, entity.height) for entity in entities],
+            dtype=np.float64,
+        ).reshape(-1, 4).astype(np.int64)
+        return boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+
+    def _obstacle_contacts(self, entities):
+        """Paires (entité, obstacle vivant) qui se touchent, triées par entité puis obstacle."""
+        if not entities:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        queries, stored = self.broadphase.overlapping(*self._entity_boxes(entities))
+        if self.obstacles.dead:
+            alive = self.obstacles.alive[stored]
+            return queries[alive], stored[alive]
+        return queries, stored
+
+    def elapsed_time(self):
+        # temps simulé : suit les ticks, s'arrête pendant la pause et le menu
+        return self.frame_count / self.tick_rate
+
+    def update(self, keys=None):
         if self.in_menu or self.paused or self.game_over or self.in_options:
             return
 
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = InputState() if self.headless else pygame.key.get_pressed()
+        if self.recorder is not None:
+            self.recorder.record(self, keys)
+        self.frame_count += 1
+        lap = self.profiler.lap
 
         for player in self.players:
-            self.ai_thinking[player.name] = False
+            player.update_power_ups(self.dt)
 
-        for player in self.players:
-            player.update_power_ups()
-
-        current_time = time.time() - self.start_time
+        current_time = self.elapsed_time()
         self.level = max(1, int(current_time // 30) + 1)
         # changer forme des joueurs après niveau 2
         if self.level >= 2:
             for p in self.players:
                 p.shape = "circle"
+        lap("entities")
 
+        controllers = []
         for player in self.players:
             if not player.alive:
                 continue
             if player.ai_enabled:
-                self.ai_thinking[player.name] = True
-                self.ai_controllers[player].make_decision()
+                controllers.append(self.ai_controllers[player])
             else:
-                player.move(keys)
+                player.move(keys, self.step_scale)
+        if controllers:
+            self.ai_scheduler.step(controllers, self.frame_count, self.tick_rate, self._capture_world)
+        for player in self.players:
+            self.ai_thinking[player.name] = self.ai_scheduler.pending(self.ai_controllers[player])
+        lap("ai")
 
-        self.obstacle_timer += 1
+        self.obstacle_timer += self.step_scale
         spawn_rate = max(15, 60 - self.level * 6)
         if self.obstacle_timer >= spawn_rate:
-            new_obstacle = Obstacle()
+            new_obstacle = self.obstacle_pool.acquire(self.rng)
             new_obstacle.speed += min(8, self.level // 2)
             self.obstacles.append(new_obstacle)
+            # le champ a copié ses valeurs : l'objet resservira au prochain obstacle
+            self.obstacle_pool.release(new_obstacle)
             self.obstacle_timer = 0
 
-        self.power_up_timer += 1
-        if self.power_up_timer >= 250 and random.random() < 0.4:
-            self.power_ups.append(PowerUp())
+        self.power_up_timer += self.step_scale
+        if self.power_up_timer >= 250 and self.rng.random() < 0.4:
+            self.power_ups.append(self.power_up_pool.acquire(self.rng))
             self.power_up_timer = 0
 
         speed_scale = 0.55 if self.slow_timer > 0 else 1.0
         if self.slow_timer > 0:
-            self.slow_timer = max(0.0, self.slow_timer - 1 / 60)
-
-        obstacles_to_remove = []
-        for obstacle in self.obstacles:
-            if obstacle.update(speed_scale):
-                obstacles_to_remove.append(obstacle)
-                for player in self.players:
-                    if player.alive:
-                        player.score += 1
-
-        particles_to_remove = []
-        for p in self.particles:
-            p["x"] += p.get("vx", 0)
-            p["y"] += p.get("vy", 0)
-            p["life"] -= 1
-            if p["life"] <= 0:
-                particles_to_remove.append(p)
-        for p in particles_to_remove:
-            if p in self.particles:
-                self.particles.remove(p)
-
-        projectiles_to_remove = []
-        destroyed_by_projectile = []
-        for projectile in self.projectiles:
-            if projectile.update():
-                projectiles_to_remove.append(projectile)
-                continue
-            for obstacle in self.obstacles:
-                if projectile.get_rect().colliderect(obstacle.get_rect()):
-                    destroyed_by_projectile.append(obstacle)
-                    projectiles_to_remove.append(projectile)
-                    if projectile.owner and projectile.owner.alive:
-                        projectile.owner.score += 1
-                    self.play_sound("zap")
-                    break
-
-        for projectile in set(projectiles_to_remove):
-            if projectile in self.projectiles:
-                self.projectiles.remove(projectile)
-
-        for power_up in self.power_ups[:]:
-            if power_up.update():
-                self.power_ups.remove(power_up)
-                continue
+            self.slow_timer = max(0.0, self.slow_timer - self.dt)
 
+        off_screen = self.obstacles.advance(speed_scale * self.step_scale)
+        passed = int(off_screen.sum())
+        if passed:
             for player in self.players:
-                if player.alive and player.get_rect().colliderect(power_up.get_rect()):
-                    power_up.apply_effect(player, self)
-                    self.play_sound("powerup")
-                    self.spawn_particles(power_up.x, power_up.y, color=(150, 255, 200))
-                    self.power_ups.remove(power_up)
-                    break
-
-        collided_obstacles = []
-        for obstacle in self.obstacles:
-            for player in self.players:
-                if player.alive and player.get_rect().colliderect(obstacle.get_rect()):
-                    collided_obstacles.append(obstacle)
-                    if player.shield_time > 0:
-                        self.flash_timer = 0.25
-                    elif player.ai_enabled and player.ai_extra_hits > 0:
-                        player.ai_extra_hits -= 1
-                        self.flash_timer = 0.25
-                        self.play_sound("ai_grace")
-                    else:
-                        player.eliminate()
-                        self.flash_timer = 0.25
-                    self.play_sound("hit")
-
-        # Remove any obstacles that were hit by players
-        for obstacle in set(obstacles_to_remove + collided_obstacles + destroyed_by_projectile):
-            if obstacle in self.obstacles:
-                self.obstacles.remove(obstacle)
+                if player.alive:
+                    player.score += passed
+        lap("entities")
+
+        self.particles.update(self.step_scale)
+        lap("particles")
+
+        # Broadphase : grille des obstacles reconstruite une fois par frame
+        self.broadphase.rebuild(*self.obstacles.bounds())
+        lap("collisions")
+
+        flying = []  # (indice dans self.projectiles, tir)
+        for index, projectile in enumerate(self.projectiles):
+            if projectile.update(self.step_scale):
+                self.projectiles.kill(index)
+            else:
+                flying.append((index, projectile))
+        lap("entities")
+
+        # obstacles détruits ou percutés pendant la frame (indices dans le champ)
+        hit_obstacles = []
+        if flying:
+            shooters, targets = self._obstacle_contacts([projectile for _, projectile in flying])
+            # chaque tir ne détruit que le premier obstacle touché (ordre d'apparition)
+            first = run_starts(shooters)
+            for index, target in zip(shooters[first].tolist(), targets[first].tolist()):
+                slot, projectile = flying[index]
+                hit_obstacles.append(target)
+                self.projectiles.kill(slot)
+                if projectile.owner and projectile.owner.alive:
+                    projectile.owner.score += 1
+                self.play_sound("zap")
+        self.projectiles.compact(self.projectile_pool.release)
+        lap("collisions")
+
+        falling = []  # (indice dans self.power_ups, power-up)
+        for index, power_up in enumerate(self.power_ups):
+            if power_up.update(self.step_scale):
+                self.power_ups.kill(index)
+            else:
+                falling.append((index, power_up))
+        lap("entities")
+
+        alive_players = [player for player in self.players if player.alive]
+        touched = {}
+        if falling and alive_players:
+            self.player_grid.rebuild(*self._entity_boxes(alive_players))
+            pairs = self.player_grid.overlapping(*self._entity_boxes([power_up for _, power_up in falling]))
+            for power_up_index, player_index in zip(*(p.tolist() for p in pairs)):
+                # premier joueur (dans l'ordre) qui touche le power-up
+                touched.setdefault(power_up_index, alive_players[player_index])
+        for power_up_index, player in sorted(touched.items()):
+            slot, power_up = falling[power_up_index]
+            power_up.apply_effect(player, self)
+            self.play_sound("powerup")
+            self.spawn_particles(power_up.x, power_up.y, color=(150, 255, 200))
+            self.power_ups.kill(slot)
+        self.power_ups.compact(self.power_up_pool.release)
+
+        contacts = zip(*(pairs.tolist() for pairs in self._obstacle_contacts(alive_players)))
+        for player_index, index in contacts:
+            player = alive_players[player_index]
+            # une fois éliminé, les obstacles suivants ne touchent plus ce joueur
+            if not player.alive:
+                continue
+            hit_obstacles.append(index)
+            if player.shield_time > 0:
+                self.flash_timer = 0.25
+            elif player.ai_enabled and player.ai_extra_hits > 0:
+                player.ai_extra_hits -= 1
+                self.flash_timer = 0.25
+                self.play_sound("ai_grace")
+            else:
+                player.eliminate()
+                self.flash_timer = 0.25
+            self.play_sound("hit")
+
+        # Retirer en une passe les obstacles sortis, touchés ou détruits
+        if passed:
+            self.obstacles.kill(off_screen)
+        if hit_obstacles:
+            self.obstacles.kill(hit_obstacles)
+        self.obstacles.compact()
+        lap("collisions")
 
         if not any(player.alive for player in self.players):
             self.game_over = True
@@ -473,12 +595,20 @@ class Game:
         self.global_best = max(self.global_best, best_score)
         if self.global_best > self.high_score:
             self.high_score = self.global_best
-            self.save_high_score()
-        pygame.display.set_caption(
-            f"Jeu Multi IA - Meilleur: {self.global_best} - Niveau: {self.level} - High score: {self.high_score}"
-        )
+            if not self.headless:
+                self.save_high_score()
+        if self.game_over and not self.headless:
+            self.high_scores.flush()
+        if self.game_over and self.recorder is not None:
+            self.recorder.save()
+        if not self.headless:
+            pygame.display.set_caption(
+                f"Jeu Multi IA - Meilleur: {self.global_best} - Niveau: {self.level} - High score: {self.high_score}"
+            )
+        lap("entities")
 
-    def draw(self):
+    def draw(self, alpha=1.0):
+        """Affiche la frame ; alpha (0..1) interpole entre les deux derniers ticks."""
         palette = [
             (30, 30, 60),
             (20, 80, 120),
@@ -487,31 +617,83 @@ class Game:
             (60, 20, 20),
         ]
         bg = palette[(self.level - 1) % len(palette)]
-        self.screen.fill(bg)
+        self.surfaces.resize(self.screen.get_size())
+        renderer = self.renderer
+        if renderer is None:
+            self.screen.fill(bg)
+            mark = mark_all = lambda drawn: drawn
+        else:
+            overlay_shown = (
+                self.flash_timer > 0
+                or self.in_options
+                or self.in_menu
+                or self.paused
+                or self.game_over
+            )
+            renderer.begin(bg, full=overlay_shown)
+            mark, mark_all = renderer.mark, renderer.mark_all
+
+        frozen_key = self._frozen_key()
+        if self._frozen_frame is not None and self._frozen_frame[0] == frozen_key:
+            # menu/pause : le décor statique est déjà composité, on le recopie
+            self.screen.blit(self._frozen_frame[1], (0, 0))
+        else:
+            self._frozen_frame = None
+            self._draw_scene(mark, mark_all, alpha)
+            if frozen_key is not None:
+                if self.in_menu:
+                    self.draw_menu_backdrop()
+                else:
+                    self.draw_overlay("PAUSE", "Appuie sur P pour reprendre")
+                self._frozen_frame = (frozen_key, self.screen.copy())
+
+        if self.in_options:
+            self.draw_options()
+        elif self.in_menu:
+            self.draw_menu(backdrop=frozen_key is None)
+        elif self.paused:
+            if frozen_key is None:
+                self.draw_overlay("PAUSE", "Appuie sur P pour reprendre")
+        elif self.game_over:
+            best_player = max(self.players, key=lambda p: p.score)
+            self.draw_overlay(
+                "GAME OVER",
+                f"Meilleur: {best_player.name} ({best_player.score} pts) | ESPACE pour recommencer",
+            )
+
+        mark(self.profiler.draw(self.screen))
+        self.profiler.lap("draw")
+        if renderer is None:
+            pygame.display.flip()
+        else:
+            renderer.present()
+        self.profiler.lap("flip")
 
+    def _draw_scene(self, mark, mark_all, alpha=1.0):
+        """Fond d'alerte, entités et HUD ; mark/mark_all reçoivent les zones dessinées."""
         if self.flash_timer > 0:
-            overlay = pygame.Surface((self.screen_width, self.screen_height))
-            overlay.set_alpha(int(180 * min(1.0, self.flash_timer * 2)))
-            overlay.fill((255, 80, 80))
+            overlay = self.surfaces.filled(
+                (self.screen_width, self.screen_height),
+                (255, 80, 80),
+                int(180 * min(1.0, self.flash_timer * 2)),
+            )
             self.screen.blit(overlay, (0, 0))
-            self.flash_timer = max(0.0, self.flash_timer - 1 / 60)
+            self.flash_timer = max(0.0, self.flash_timer - self.render_dt)
 
         for idx, player in enumerate(self.players):
             if self.active_players == 1 and idx > 0:
                 continue
-            player.draw(self.screen)
+            mark(player.draw(self.screen, alpha))
 
-        for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+        mark_all(self.obstacles.draw(self.screen, alpha))
 
         for power_up in self.power_ups:
-            power_up.draw(self.screen)
+            mark(power_up.draw(self.screen, alpha))
 
-        for p in self.particles:
-            pygame.draw.circle(self.screen, p["color"], (int(p["x"]), int(p["y"])), p["size"])
+        mark_all(self.particles.draw(self.screen))
 
         for projectile in self.projectiles:
-            projectile.draw(self.screen)
+            mark(projectile.draw(self.screen, alpha))
 
         for idx, player in enumerate(self.players):
             if self.active_players == 1 and idx > 0:
@@ -522,26 +704,30 @@ class Game:
                     start = ai.debug_line["start"]
                     end = ai.debug_line["end"]
                     color = ai.debug_line.get("color", (255, 255, 255))
-                    pygame.draw.line(
+                    mark(pygame.draw.line(
                         self.screen,
                         color,
                         (int(start[0]), int(start[1])),
                         (int(end[0]), int(end[1])),
                         3,
-                    )
-                    pygame.draw.circle(
+                    ))
+                    mark(pygame.draw.circle(
                         self.screen,
                         color,
                         (int(end[0]), int(end[1])),
                         6,
                         1,
-                    )
+                    ))
 
-        level_text = self.font.render(f"Niveau: {self.level}", True, (255, 255, 0))
-        self.screen.blit(level_text, (10, 10))
+        level_text = self.text_cache.render(
+            self.font, f"Niveau: {self.level}", True, (255, 255, 0)
+        )
+        mark(self.screen.blit(level_text, (10, 10)))
 
-        hs_text = self.small_font.render(f"High score: {self.high_score}", True, (255, 255, 255))
-        self.screen.blit(hs_text, (10, 40))
+        hs_text = self.text_cache.render(
+            self.small_font, f"High score: {self.high_score}", True, (255, 255, 255)
+        )
+        mark(self.screen.blit(hs_text, (10, 40)))
 
         y_offset = 70
         for idx, player in enumerate(self.players):
@@ -549,71 +735,73 @@ class Game:
                 continue
             color = (0, 255, 0) if player.alive else (150, 150, 150)
             status = "IA" if player.ai_enabled else "Humain"
-            text = self.small_font.render(
+            text = self.text_cache.render(
+                self.small_font,
                 f"{player.name} ({status}) - Score: {player.score}", True, color
             )
-            self.screen.blit(text, (10, y_offset))
+            mark(self.screen.blit(text, (10, y_offset)))
             if player.speed_boost_time > 0:
-                boost_text = self.small_font.render(
+                boost_text = self.text_cache.render(
+                    self.small_font,
                     f"Vitesse x2: {player.speed_boost_time:.1f}s", True, (200, 255, 200)
                 )
-                self.screen.blit(boost_text, (30, y_offset + 20))
+                mark(self.screen.blit(boost_text, (30, y_offset + 20)))
             if player.shield_time > 0:
-                shield_text = self.small_font.render(
+                shield_text = self.text_cache.render(
+                    self.small_font,
                     f"Bouclier: {player.shield_time:.1f}s", True, (200, 255, 255)
                 )
-                self.screen.blit(shield_text, (30, y_offset + 40))
+                mark(self.screen.blit(shield_text, (30, y_offset + 40)))
             if player.ai_enabled and self.ai_thinking.get(player.name, False):
-                thinking_text = self.small_font.render(
+                thinking_text = self.text_cache.render(
+                    self.small_font,
                     "IA en reflexion...", True, (255, 255, 0)
                 )
-                self.screen.blit(thinking_text, (30, y_offset + 60))
-            ammo_text = self.small_font.render(
+                mark(self.screen.blit(thinking_text, (30, y_offset + 60)))
+            ammo_text = self.text_cache.render(
+                self.small_font,
                 f"Munitions: {player.ammo} | Hits IA: {player.ai_extra_hits}", True, (255, 230, 180)
             )
-            self.screen.blit(ammo_text, (30, y_offset + 80))
+            mark(self.screen.blit(ammo_text, (30, y_offset + 80)))
             y_offset += 110
 
         slow_text = ""
         if self.slow_timer > 0:
             slow_text = f"Ralenti: {self.slow_timer:.1f}s"
-        stats_text = self.small_font.render(
+        stats_text = self.text_cache.render(
+            self.small_font,
             f"Obstacles: {len(self.obstacles)} | Power-ups: {len(self.power_ups)} {slow_text} | Son: {'Off' if self.muted else 'On'}",
             True,
             (200, 200, 255),
         )
-        self.screen.blit(stats_text, (400, 10))
+        mark(self.screen.blit(stats_text, (400, 10)))
 
-        instructions = self.small_font.render(
+        instructions = self.text_cache.render(
+            self.small_font,
             "ENTREE jouer | 1=Solo 2=Deux joueurs | A: IA auto | M: Son On/Off | O Options | Fleches+Ctrl dr: J1 tir | ZQSD+E: J2 tir | TAB/T IA tous | P Pause | ESPACE Restart",
             True,
             (240, 240, 240),
         )
-        self.screen.blit(instructions, (20, 570))
+        mark(self.screen.blit(instructions, (20, 570)))
 
-        if self.in_options:
-            self.draw_options()
-        elif self.in_menu:
-            self.draw_menu()
+    def _frozen_key(self):
+        """Clé du décor figé (menu ou pause), None quand la scène peut encore bouger."""
+        if self.in_options or self.flash_timer > 0:
+            return None
+        if self.in_menu:
+            kind = "menu"
         elif self.paused:
-            self.draw_overlay("PAUSE", "Appuie sur P pour reprendre")
-        elif self.game_over:
-            best_player = max(self.players, key=lambda p: p.score)
-            self.draw_overlay(
-                "GAME OVER",
-                f"Meilleur: {best_player.name} ({best_player.score} pts) | ESPACE pour recommencer",
-            )
-
-        pygame.display.flip()
+            kind = "pause"
+        else:
+            return None
+        return kind, self.screen.get_size()
 
     def draw_overlay(self, title, subtitle):
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(190)
-        overlay.fill((0, 0, 0))
+        overlay = self.surfaces.filled((self.screen_width, self.screen_height), (0, 0, 0), 190)
         self.screen.blit(overlay, (0, 0))
 
-        title_text = self.font.render(title, True, (255, 255, 255))
-        sub_text = self.small_font.render(subtitle, True, (220, 220, 0))
+        title_text = self.text_cache.render(self.font, title, True, (255, 255, 255))
+        sub_text = self.text_cache.render(self.small_font, subtitle, True, (220, 220, 0))
         self.screen.blit(
             title_text,
             (self.screen_width // 2 - title_text.get_width() // 2, 220),
@@ -623,20 +811,17 @@ class Game:
             (self.screen_width // 2 - sub_text.get_width() // 2, 280),
         )
     
-    def draw_menu(self):
+    def draw_menu_backdrop(self):
         # fond semi-transparent avec dégradé simple
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((12, 18, 40))
+        overlay = self.surfaces.filled((self.screen_width, self.screen_height), (12, 18, 40), 200)
         self.screen.blit(overlay, (0, 0))
 
         # bandeau supérieur
-        header = pygame.Surface((self.screen_width, 120))
-        header.fill((30, 60, 120))
+        header = self.surfaces.filled((self.screen_width, 120), (30, 60, 120))
         self.screen.blit(header, (0, 0))
 
-        title_text = self.font.render("MENU PRINCIPAL", True, (255, 255, 255))
-        subtitle = self.small_font.render("Choisis joueurs, IA, son avant de lancer", True, (220, 230, 255))
+        title_text = self.text_cache.render(self.font, "MENU PRINCIPAL", True, (255, 255, 255))
+        subtitle = self.text_cache.render(self.small_font, "Choisis joueurs, IA, son avant de lancer", True, (220, 230, 255))
         self.screen.blit(
             title_text,
             (self.screen_width // 2 - title_text.get_width() // 2, 28),
@@ -646,6 +831,11 @@ class Game:
             (self.screen_width // 2 - subtitle.get_width() // 2, 70),
         )
 
+    def draw_menu(self, backdrop=True):
+        # backdrop=False : le fond est déjà dans le décor figé, seuls les boutons sont redessinés
+        if backdrop:
+            self.draw_menu_backdrop()
+
         self.menu_button_rects = {}
 
         mouse_pos = pygame.mouse.get_pos()
@@ -662,9 +852,9 @@ class Game:
             pygame.draw.rect(self.screen, base_color, rect, border_radius=14)
             border_col = (90, 150, 240) if hovered else (70, 120, 200)
             pygame.draw.rect(self.screen, border_col, rect, width=2, border_radius=14)
-            t = self.small_font.render(title, True, (210, 225, 255))
-            v = self.font.render(value, True, (255, 255, 255))
-            h = self.small_font.render(hint, True, (180, 195, 215))
+            t = self.text_cache.render(self.small_font, title, True, (210, 225, 255))
+            v = self.text_cache.render(self.font, value, True, (255, 255, 255))
+            h = self.text_cache.render(self.small_font, hint, True, (180, 195, 215))
             self.screen.blit(t, (rect.x + 16, rect.y + 12))
             self.screen.blit(v, (rect.x + 16, rect.y + 46))
             self.screen.blit(h, (rect.x + 16, rect.y + 86))
@@ -702,7 +892,7 @@ class Game:
         pygame.draw.rect(self.screen, (10, 25, 20), start_rect.move(3, 5), border_radius=16)
         pygame.draw.rect(self.screen, start_col, start_rect, border_radius=16)
         pygame.draw.rect(self.screen, (80, 200, 140), start_rect, width=3, border_radius=16)
-        start_txt = self.font.render("START", True, (255, 255, 255))
+        start_txt = self.text_cache.render(self.font, "START", True, (255, 255, 255))
         self.screen.blit(
             start_txt,
             (start_rect.x + start_rect.width // 2 - start_txt.get_width() // 2,
@@ -710,16 +900,14 @@ class Game:
         )
         self.menu_button_rects["start"] = start_rect
 
-        hint = self.small_font.render("Clique sur START après tes choix", True, (230, 230, 230))
+        hint = self.text_cache.render(self.small_font, "Clique sur START après tes choix", True, (230, 230, 230))
         self.screen.blit(hint, (self.screen_width // 2 - hint.get_width() // 2, start_rect.y + 80))
 
     def draw_options(self):
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(210)
-        overlay.fill((10, 10, 30))
+        overlay = self.surfaces.filled((self.screen_width, self.screen_height), (10, 10, 30), 210)
         self.screen.blit(overlay, (0, 0))
 
-        title = self.font.render("OPTIONS", True, (255, 255, 255))
+        title = self.text_cache.render(self.font, "OPTIONS", True, (255, 255, 255))
         self.screen.blit(title, (self.screen_width // 2 - title.get_width() // 2, 40))
 
         opts = [
@@ -734,7 +922,7 @@ class Game:
         ]
         y = 120
         for line in opts:
-            txt = self.small_font.render(line, True, (220, 220, 240))
+            txt = self.text_cache.render(self.small_font, line, True, (220, 220, 240))
             self.screen.blit(txt, (60, y))
             y += 28
 
@@ -746,13 +934,14 @@ class Game:
         ]
         y += 10
         for line in controls_lines:
-            txt = self.small_font.render(line, True, (180, 220, 255))
+            txt = self.text_cache.render(self.small_font, line, True, (180, 220, 255))
             self.screen.blit(txt, (60, y))
             y += 24
 
         if self.pending_remap:
             idx, ctrl = self.pending_remap
-            prompt = self.small_font.render(
+            prompt = self.text_cache.render(
+                self.small_font,
                 f"Appuie sur la nouvelle touche pour J{idx+1} {ctrl}", True, (255, 220, 120)
             )
             self.screen.blit(prompt, (60, y + 20))
@@ -768,16 +957,102 @@ class Game:
             if snd:
                 snd.set_volume(0 if self.muted else self.fx_volume)
 
+    def store_previous_positions(self):
+        """Mémorise les positions avant un tick, pour interpoler l'affichage."""
+        for player in self.players:
+            player.prev_x, player.prev_y = player.x, player.y
+        self.obstacles.store_previous()
+        for power_up in self.power_ups:
+            power_up.prev_y = power_up.y
+        for projectile in self.projectiles:
+            projectile.prev_y = projectile.y
+
     def run(self):
+        # boucle à pas fixe : l'horloge réelle alimente un accumulateur vidé par ticks de dt
         running = True
+        accumulator = 0.0
+        previous = time.perf_counter()
         while running:
-            running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            self.profiler.begin_frame()
+            now = time.perf_counter()
+            frame_time = now - previous
+            previous = now
+            accumulator += frame_time
 
+            running = self.handle_events()
+            self.poll_assets()
+            self.profiler.lap("events")
+            ticks = 0
+            while accumulator >= self.dt and ticks < self.max_ticks_per_frame:
+                self.store_previous_positions()
+                self.update()
+                accumulator -= self.dt
+                ticks += 1
+            if ticks == self.max_ticks_per_frame:
+                # machine trop lente : abandonner le retard plutôt que de l'accumuler
+                accumulator = min(accumulator, self.dt)
+
+            # sous charge, plusieurs ticks passent avant un seul affichage (frames sautées)
+            self.render_dt = frame_time
+            self.draw(alpha=accumulator / self.dt)
+            if self.max_fps:
+                self.clock.tick(self.max_fps)
+
+        self.close()
+
+    def close(self):
+        """Fin de session : record, threads d'IA, replay, puis pygame (après le thread des sons)."""
+        self.high_scores.close()
+        self.ai_scheduler.close()
+        if self.recorder is not None:
+            self.recorder.save()
+        if self.assets is not None:
+            # ne pas fermer pygame sous un décodage en cours
+            self.assets.wait(2.0)
         pygame.quit()
 
+    def step(self, keys=None):
+        """Avance la simulation d'une frame avec des touches injectées.
+
+        Comme KEYDOWN dans handle_events, le tir part à l'appui : une touche
+        de tir maintenue ne tire qu'une fois.
+        """
+        if keys is None:
+            keys = InputState()
+        playing = not (self.in_menu or self.paused or self.game_over or self.in_options)
+        for player in self.players:
+            shoot_key = player.controls.get("shoot")
+            pressed = bool(shoot_key and keys[shoot_key])
+            held = self._shoot_held.get(player.name, False)
+            self._shoot_held[player.name] = pressed
+            if pressed and not held and playing and player.alive and not player.ai_enabled:
+                self.player_shoot(player)
+        self.update(keys)
+
+    def run_headless(self, max_frames=None, input_source=None):
+        """Simule la partie sans affichage ni limite de fps.
+
+        input_source(game) renvoie l'InputState de la frame (None = aucune touche).
+        Sans max_frames, la partie doit être lancée : dans le menu, step() ne
+        finit jamais la partie.
+        """
+        if max_frames is None and self.in_menu:
+            raise RuntimeError("run_headless sans max_frames : lancer la partie d'abord (start_game)")
+        frames = 0
+        start = time.perf_counter()
+        while not self.game_over and (max_frames is None or frames < max_frames):
+            keys = input_source(self) if input_source else None
+            self.step(keys)
+            frames += 1
+        elapsed = time.perf_counter() - start
+        return {
+            "frames": frames,
+            "seconds": elapsed,
+            "fps": frames / elapsed if elapsed > 0 else float("inf"),
+            "scores": {player.name: player.score for player in self.players},
+            "game_over": self.game_over,
+        }
+
 
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+
+
+class HighScoreStore:
+    """Record persistant, écrit en différé par un thread d'arrière-plan.
+
+    set() ne fait que marquer la valeur comme sale ; le thread l'écrit au
+    plus une fois toutes les min_interval secondes. flush() écrit tout de
+    suite (fin de partie), close() écrit ce qui reste et arrête le thread.
+    Chaque écriture passe par un fichier temporaire puis os.replace : un
+    crash en pleine écriture ne peut pas corrompre le record.
+    """
+
+    def __init__(self, path="highscore.json", min_interval=2.0):
+        self.path = path
+        self.min_interval = min_interval
+        self.value = self.load()
+        self.writes = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closing = threading.Event()
+        self._thread = None
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return 0
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return int(data.get("high_score", 0))
+        except Exception:
+            return 0
+
+    def set(self, value):
+        with self._lock:
+            self.value = value
+            self._dirty = True
+        if self._thread is None and not self._closing.is_set():
+            # thread démarré au premier record seulement
+            self._thread = threading.Thread(target=self._run, name="highscore", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def flush(self):
+        """Écrit la valeur en attente, s'il y en a une."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                value = self.value
+                self._dirty = False
+            if not self._write(value):
+                with self._lock:
+                    # écriture ratée : reprise au prochain intervalle ou à close()
+                    self._dirty = True
+
+    def close(self):
+        self._closing.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _write(self, value):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"high_score": value}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self.writes += 1
+        return True
+
+    def _run(self):
+        while not self._closing.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            if self._closing.is_set():
+                break
+            self.flush()
+            # débit borné : au plus une écriture par min_interval
+            self._closing.wait(self.min_interval)
@@ -1,5 +1,213 @@
-from game import Game
+import time
+
+STARTED = time.perf_counter()  # --startup-time : tout ce qui suit est compté
+
+import argparse  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+
+from game import AI_KINDS, Game  # noqa: E402
+from replay import ReplayPlayer, ReplayRecorder  # noqa: E402
+
+IMPORTED = time.perf_counter()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Jeu Multi IA - Evite les obstacles")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulation IA sans fenêtre, sans son et sans limite de fps",
+    )
+    parser.add_argument("--games", type=int, default=1, help="nombre de parties headless")
+    parser.add_argument(
+        "--frames", type=int, default=36000, help="frames max par partie headless"
+    )
+    parser.add_argument("--players", type=int, choices=(1, 2), default=2)
+    parser.add_argument(
+        "--tick-rate", type=int, default=60, help="ticks de simulation par seconde"
+    )
+    parser.add_argument(
+        "--max-fps", type=int, default=60, help="limite d'affichage (0 : sans limite)"
+    )
+    parser.add_argument("--seed", type=int, help="graine de la (première) partie")
+    parser.add_argument("--record", metavar="FICHIER", help="enregistrer la session dans un replay")
+    parser.add_argument("--replay", metavar="FICHIER", help="rejouer un replay en headless")
+    parser.add_argument("--replay-game", type=int, default=0, help="partie du replay à rejouer")
+    parser.add_argument("--seek", type=int, help="arrêter le replay à ce tick")
+    parser.add_argument(
+        "--ai-workers",
+        type=int,
+        default=0,
+        help="threads de décision des IA (0 : décisions dans le tick, déterministes)",
+    )
+    parser.add_argument(
+        "--ai-budget-ms",
+        type=float,
+        help="temps max des décisions IA par tick (2 ms d'attente avec --ai-workers ; sans limite sinon)",
+    )
+    parser.add_argument("--ai-rate", type=float, help="décisions par seconde de chaque IA")
+    parser.add_argument("--ai", choices=sorted(AI_KINDS), default="simple", help="contrôleur des IA")
+    parser.add_argument(
+        "--planner-budget-us",
+        type=int,
+        default=1000,
+        help="temps de recherche du planificateur par décision (µs)",
+    )
+    parser.add_argument(
+        "--policy-weights", metavar="FICHIER", help="poids .npz de --ai policy (politique par défaut sinon)"
+    )
+    parser.add_argument(
+        "--startup-time",
+        action="store_true",
+        help="mesurer le démarrage (première frame, sons, imports) puis quitter",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="n'envoyer à l'écran que les zones modifiées (machines peu puissantes)",
+    )
+    args = parser.parse_args()
+    if args.record and args.ai_workers:
+        # le replay resimule les IA dans le tick : décisions asynchrones non rejouables
+        parser.error("--record n'est pas compatible avec --ai-workers")
+    if args.record and args.ai_budget_ms is not None:
+        # décisions reportées selon l'horloge : le replay ne les retrouverait pas
+        parser.error("--record n'est pas compatible avec --ai-budget-ms")
+    if args.record and args.ai != "simple":
+        # budget en temps réel : les plans dépendent de la machine
+        parser.error("--record n'enregistre que les parties avec --ai simple")
+    return args
+
+
+def ai_options(args):
+    if args.ai == "planner":
+        return {"budget_us": args.planner_budget_us}
+    if args.ai == "policy":
+        return {"weights": args.policy_weights}
+    return {}
+
+
+def run_headless(args):
+    total_frames = 0
+    start = time.perf_counter()
+    for index in range(args.games):
+        seed = None if args.seed is None else args.seed + index
+        game = Game(
+            headless=True,
+            tick_rate=args.tick_rate,
+            seed=seed,
+            ai_workers=args.ai_workers,
+            ai_budget_ms=args.ai_budget_ms,
+            ai_rate=args.ai_rate,
+            ai_kind=args.ai,
+            ai_options=ai_options(args),
+        )
+        game.active_players = args.players
+        game.ai_all_default = True
+        game.start_game()
+        stats = game.run_headless(max_frames=args.frames)
+        game.ai_scheduler.close()
+        total_frames += stats["frames"]
+        scores = ", ".join(f"{name}: {score}" for name, score in stats["scores"].items())
+        print(
+            f"Partie {index + 1}: {stats['frames']} frames en {stats['seconds']:.2f}s "
+            f"({stats['fps']:.0f} fps) - {scores}"
+        )
+    elapsed = time.perf_counter() - start
+    fps = total_frames / elapsed if elapsed > 0 else float("inf")
+    print(f"Total: {total_frames} frames en {elapsed:.2f}s ({fps:.0f} fps)")
+
+
+def run_replay(args):
+    player = ReplayPlayer(args.replay, game_index=args.replay_game)
+    start = time.perf_counter()
+    if args.seek is not None:
+        player.seek(args.seek)
+    else:
+        player.run()
+    elapsed = time.perf_counter() - start
+    fps = player.frame / elapsed if elapsed > 0 else float("inf")
+    scores = ", ".join(f"{p.name}: {p.score}" for p in player.game.players)
+    print(
+        f"Replay: tick {player.frame}/{player.length} en {elapsed:.2f}s ({fps:.0f} fps) - {scores}"
+        f"{' - game over' if player.game.game_over else ''}"
+    )
+
+
+def make_game(args):
+    return Game(
+        dirty_rects=args.dirty_rects,
+        tick_rate=args.tick_rate,
+        max_fps=args.max_fps,
+        seed=args.seed,
+        ai_workers=args.ai_workers,
+        ai_budget_ms=args.ai_budget_ms,
+        ai_rate=args.ai_rate,
+        ai_kind=args.ai,
+        ai_options=ai_options(args),
+    )
+
+
+def import_times(module="game", top=12):
+    """Modules les plus longs à importer (cumulé, µs), mesurés par python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    rows, pending = [], []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        # les sous-modules sont listés avant leur parent : on garde ceux qui précèdent module
+        if depth == 1:
+            pending.append((int(cumulative), depth, name.strip()))
+        elif depth == 0:
+            if name.strip() == module:
+                rows = pending + [(int(cumulative), depth, module)]
+            pending = []
+    return sorted(rows, reverse=True)[:top]
+
+
+def report_startup(args):
+    game = make_game(args)
+    created = time.perf_counter()
+    game.handle_events()
+    game.draw()  # le menu, sans attendre les sons
+    first_frame = time.perf_counter()
+    game.assets.wait(10.0)
+    ready = time.perf_counter()
+
+    def ms(seconds):
+        return f"{seconds * 1000:8.1f} ms"
+
+    print(f"{'imports':<26} {ms(IMPORTED - STARTED)}")
+    print(f"{'Game() (fenêtre, polices)':<26} {ms(created - IMPORTED)}")
+    print(f"{'première frame du menu':<26} {ms(first_frame - STARTED)}  depuis le lancement")
+    print(f"{'sons et musique prêts':<26} {ms(ready - STARTED)}  (thread de chargement)")
+    for step, seconds in game.assets.timings.items():
+        print(f"  {step:<24} {ms(seconds)}  après le début du chargement")
+    cache = game.assets.cache
+    print(f"  cache audio : {cache.hits} relus, {cache.decoded} décodés ({cache.cache_dir})")
+    game.close()
+    print("imports les plus longs (cumulé) :")
+    for cumulative, depth, name in import_times():
+        print(f"  {'  ' * depth}{name:<24} {cumulative / 1000:8.1f} ms")
+
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    if args.replay:
+        run_replay(args)
+    elif args.headless:
+        run_headless(args)
+    elif args.startup_time:
+        report_startup(args)
+    else:
+        game = make_game(args)
+        if args.record:
+            game.recorder = ReplayRecorder(args.record)
+        game.run()
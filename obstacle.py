@@ -1,22 +1,245 @@
-import pygame
 import random
+import numpy as np
+import pygame
+from broadphase import rects_overlap
+from danger_map import DangerMap
 
 
 class Obstacle:
-    def __init__(self):
-        self.width = random.randint(30, 80)
-        self.height = random.randint(30, 80)
-        self.x = random.randint(0, 800 - self.width)
+    __slots__ = ("width", "height", "x", "y", "speed", "color", "rect")
+
+    def __init__(self, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)  # mis à jour sur place par get_rect()
+        self.reset(rng)
+
+    def reset(self, rng=random):
+        self.width = rng.randint(30, 80)
+        self.height = rng.randint(30, 80)
+        self.x = rng.randint(0, 800 - self.width)
         self.y = -self.height
-        self.speed = random.randint(3, 7)
-        self.color = (random.randint(200, 255), random.randint(0, 100), random.randint(0, 100))
+        self.speed = rng.randint(3, 7)
+        self.color = (rng.randint(200, 255), rng.randint(0, 100), rng.randint(0, 100))
+
+    def get_rect(self):
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
+
+
+class ObstacleRef:
+    """Vue sur un slot d'ObstacleField, valable jusqu'au prochain compact()."""
+
+    __slots__ = ("field", "index", "rect")
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+        self.rect = None  # construit au premier get_rect(), puis mis à jour sur place
 
-    def update(self, speed_scale=1.0):
-        self.y += self.speed * speed_scale
-        return self.y > 600
+    @property
+    def x(self):
+        return self.field.x[self.index].item()
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    @property
+    def y(self):
+        return self.field.y[self.index].item()
+
+    @property
+    def width(self):
+        return self.field.width[self.index].item()
+
+    @property
+    def height(self):
+        return self.field.height[self.index].item()
+
+    @property
+    def speed(self):
+        return self.field.speed[self.index].item()
+
+    @property
+    def color(self):
+        return tuple(self.field.color[self.index].tolist())
 
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        if self.rect is None:
+            self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        else:
+            self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
+
+
+class ObstacleField:
+    """Obstacles rangés en colonnes NumPy : x, y, largeur, hauteur, vitesse, couleur.
+
+    Les slots [0, count) gardent l'ordre d'apparition. Un obstacle retiré en
+    cours de frame est seulement marqué mort (kill) ; compact() les supprime
+    tous en une seule passe. Les DangerMap demandées par danger_map() sont
+    tenues à jour à chaque modification.
+    """
+
+    MAX_DANGER_MAPS = 4  # rangées suivies en même temps (une par hauteur de joueur)
+
+    COLUMNS = ("x", "y", "prev_y", "width", "height", "speed", "color", "alive")
+
+    def __init__(self, capacity=64, screen_height=600):
+        self.screen_height = screen_height
+        self.count = 0
+        self.dead = 0  # slots tués en attente de compact()
+        self.version = 0  # incrémenté à chaque modification, pour les caches
+        self.index = np.arange(capacity)
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.prev_y = np.zeros(capacity, dtype=np.float64)  # y au tick précédent (interpolation)
+        self.width = np.zeros(capacity, dtype=np.int64)
+        self.height = np.zeros(capacity, dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.int64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.danger_maps = {}  # (haut, bas) de la rangée -> DangerMap
+
+    def __len__(self):
+        return self.count - self.dead
+
+    def __iter__(self):
+        for index in self.live_indices():
+            yield ObstacleRef(self, index)
+
+    def __getitem__(self, index):
+        return ObstacleRef(self, index)
+
+    def _grow(self):
+        capacity = len(self.x) * 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+        self.index = np.arange(capacity)
+
+    def add(self, x, y, width, height, speed, color):
+        if self.count >= len(self.x):
+            self._grow()
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_y[i] = y
+        self.width[i] = width
+        self.height[i] = height
+        self.speed[i] = speed
+        self.color[i] = color
+        self.alive[i] = True
+        self.count += 1
+        self.version += 1
+        for danger_map in self.danger_maps.values():
+            danger_map.added(i)
+
+    def append(self, obstacle):
+        self.add(obstacle.x, obstacle.y, obstacle.width, obstacle.height, obstacle.speed, obstacle.color)
+
+    def clear(self):
+        self.alive[: self.count] = False
+        self.count = 0
+        self.dead = 0
+        self.version += 1
+        for danger_map in self.danger_maps.values():
+            danger_map.cleared()
+
+    def live_indices(self):
+        if not self.dead:
+            return self.index[: self.count]
+        return np.flatnonzero(self.alive[: self.count])
+
+    def live_columns(self):
+        """(indices, x, y, largeur, vitesse) des obstacles vivants, en vues si possible."""
+        n = self.count
+        if not self.dead:
+            return self.index[:n], self.x[:n], self.y[:n], self.width[:n], self.speed[:n]
+        live = self.live_indices()
+        return live, self.x[live], self.y[live], self.width[live], self.speed[live]
+
+    def advance(self, speed_scale=1.0):
+        """Fait tomber tous les obstacles; renvoie le masque de ceux sortis de l'écran."""
+        n = self.count
+        alive = self.alive[:n]
+        self.y[:n] += np.where(alive, self.speed[:n] * speed_scale, 0)
+        self.version += 1
+        for danger_map in self.danger_maps.values():
+            danger_map.advanced(speed_scale)
+        return alive & (self.y[:n] > self.screen_height)
+
+    def bounds(self):
+        """Boîtes entières (x, y, largeur, hauteur) des slots [0, count), comme pygame.Rect."""
+        n = self.count
+        return self.x[:n], self.y[:n].astype(np.int64), self.width[:n], self.height[:n]
+
+    def colliding(self, rect):
+        """Indices (ordre d'apparition) des obstacles vivants qui touchent rect."""
+        x, y, width, height = self.bounds()
+        hit = self.alive[: self.count] & rects_overlap(
+            x, y, width, height, rect.x, rect.y, rect.width, rect.height
+        )
+        return np.flatnonzero(hit)
+
+    def lowest(self):
+        """Indice de l'obstacle vivant le plus bas (le premier en cas d'égalité)."""
+        live = self.live_indices()
+        if live.size == 0:
+            return None
+        return live[np.argmax(self.y[live])]
+
+    def kill(self, index):
+        """Marque un indice (ou un masque) comme mort jusqu'au prochain compact()."""
+        if isinstance(index, np.ndarray) and index.dtype == bool:
+            self.alive[: len(index)] &= ~index
+            index = np.flatnonzero(index)
+        else:
+            self.alive[index] = False
+        self.dead = self.count - int(np.count_nonzero(self.alive[: self.count]))
+        self.version += 1
+        for danger_map in self.danger_maps.values():
+            danger_map.removed(index)
+
+    def compact(self):
+        if not self.dead:
+            return
+        n = self.count
+        live = self.live_indices()
+        for danger_map in self.danger_maps.values():
+            danger_map.compacted(live)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            column[: live.size] = column[live]
+        self.alive[live.size : n] = False
+        self.count = live.size
+        self.dead = 0
+        self.version += 1
+
+    def danger_map(self, top, bottom):
+        """DangerMap de la rangée [top, bottom), créée et suivie au premier appel."""
+        key = (top, bottom)
+        danger_map = self.danger_maps.get(key)
+        if danger_map is None:
+            if len(self.danger_maps) >= self.MAX_DANGER_MAPS:
+                del self.danger_maps[next(iter(self.danger_maps))]
+            danger_map = self.danger_maps[key] = DangerMap(self, top, bottom)
+        return danger_map
+
+    def store_previous(self):
+        self.prev_y[: self.count] = self.y[: self.count]
+
+    def draw(self, screen, alpha=1.0):
+        """Dessine les obstacles vivants (interpolés selon alpha) et renvoie les rects touchés."""
+        live = self.live_indices()
+        y = self.y[live]
+        if alpha < 1:
+            prev_y = self.prev_y[live]
+            y = prev_y + (y - prev_y) * alpha
+        return [
+            pygame.draw.rect(screen, color, (x, y, width, height))
+            for x, y, width, height, color in zip(
+                self.x[live].tolist(),
+                y.tolist(),
+                self.width[live].tolist(),
+                self.height[live].tolist(),
+                self.color[live].tolist(),
+            )
+        ]
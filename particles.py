@@ -0,0 +1,108 @@
+import numpy as np
+import pygame
+
+
+class ParticlePool:
+    """Particules de capacité fixe stockées en tableaux NumPy.
+
+    Position, vitesse, durée de vie, couleur et taille sont des colonnes ;
+    les particules vivantes occupent [0, count) dans l'ordre d'apparition.
+    update() intègre tout en bloc puis compacte les mortes en une passe.
+
+    Quand le pool est plein, overflow choisit la politique :
+    - "drop_oldest" : les plus anciennes particules laissent leur place ;
+    - "drop_new" : les nouvelles particules en trop sont ignorées.
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_new")
+
+    def __init__(self, capacity=1024, overflow="drop_oldest", seed=None):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"politique de débordement inconnue: {overflow}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.dropped = 0  # particules perdues à cause de la capacité
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)  # en frames à 60 Hz
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.int64)
+        self._sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y, color=(255, 255, 255), amount=12):
+        amount = min(amount, self.capacity)
+        free = self.capacity - self.count
+        if amount > free:
+            if self.overflow == "drop_new":
+                self.dropped += amount - free
+                amount = free
+            else:
+                # décaler pour libérer la place des plus anciennes
+                evicted = amount - free
+                self._keep(slice(evicted, self.count))
+                self.dropped += evicted
+        if amount <= 0:
+            return
+
+        start, end = self.count, self.count + amount
+        rng = self.rng
+        self.pos[start:end, 0] = x + rng.integers(-5, 6, amount)
+        self.pos[start:end, 1] = y + rng.integers(-5, 6, amount)
+        self.vel[start:end] = rng.uniform(-2, 2, (amount, 2))
+        self.life[start:end] = rng.integers(20, 36, amount)
+        self.color[start:end] = color
+        self.size[start:end] = rng.integers(2, 5, amount)
+        self.count = end
+
+    def _keep(self, selection):
+        # compaction en une passe : sélection (masque ou tranche) recopiée en tête
+        for column in (self.pos, self.vel, self.life, self.color, self.size):
+            kept = column[: self.count][selection]
+            column[: len(kept)] = kept
+        self.count = len(kept)
+
+    def update(self, step_scale=1):
+        n = self.count
+        if not n:
+            return
+        self.pos[:n] += self.vel[:n] * step_scale
+        self.life[:n] -= step_scale
+        alive = self.life[:n] > 0
+        if not alive.all():
+            self._keep(alive)
+
+    def _sprite(self, color, size):
+        key = (color, size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        """Dessine les particules et renvoie les rects touchés."""
+        n = self.count
+        if not n:
+            return []
+        # un seul appel blits pour toutes les particules, sprites pré-rendus
+        centers = self.pos[:n].astype(np.int64)
+        sizes = self.size[:n].tolist()
+        colors = [tuple(c) for c in self.color[:n].tolist()]
+        return screen.blits(
+            [
+                (self._sprite(color, size), (cx - size, cy - size))
+                for (cx, cy), color, size in zip(centers.tolist(), colors, sizes)
+            ],
+            True,
+        )
@@ -0,0 +1,205 @@
+import itertools
+import math
+import time
+
+import numpy as np
+
+from ai import SimpleAI
+
+ACTIONS = (None, "left", "right")
+DIRECTIONS = {None: 0, "left": -1, "right": 1}
+
+
+class PlannerAI(SimpleAI):
+    """IA qui planifie : cherche la suite de déplacements qui survit le plus longtemps.
+
+    Les obstacles tombent en ligne droite : leur hauteur à chaque tick à
+    venir se déduit de leur vitesse et du ralenti restant. Un plan est une
+    suite de segments (rester, gauche, droite) de segment_ticks frames ; la
+    dernière action est tenue jusqu'à l'horizon. La recherche part des
+    trois plans constants et du plan retenu à la décision précédente, puis
+    essaie les plans par nombre de segments croissant et s'arrête avant le
+    lot qui dépasserait budget_us : le meilleur plan trouvé jusque-là est
+    joué. budget_us=None explore tout
+    (décisions déterministes). Sans obstacle à portée pendant l'horizon,
+    le comportement est celui de SimpleAI (power-ups, recentrage).
+    """
+
+    def __init__(self, *args, budget_us=1000, segments=6, segment_ticks=10, margin=4, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget_us = budget_us
+        self.segments = segments
+        # segment_ticks en frames à 60 Hz, ramenées au tick
+        self.segment_ticks = max(1, round(segment_ticks / self.step_scale))
+        self.horizon = segments * self.segment_ticks
+        self.margin = margin  # pixels de marge autour du joueur
+        self.plan = ()  # meilleur plan, une action par tick
+        self.plans_evaluated = 0  # plans évalués à la dernière décision
+        self._profiles = {}  # ticks ralentis -> profil de chute cumulé
+        self._plan_batches = None
+
+    def reset(self, rng=None):
+        super().reset(rng)
+        self.plan = ()
+        self.plans_evaluated = 0
+
+    def _choose(self):
+        self.debug_line = None
+        deadline = None
+        if self.budget_us is not None:
+            deadline = time.perf_counter() + self.budget_us / 1e6
+
+        threats = self._threats()
+        if threats is None:
+            self.plan = ()
+            self.plans_evaluated = 0
+            super()._choose()
+            return
+
+        best_score = best_plan = None
+        evaluated = 0
+        per_plan = 0.0  # coût mesuré d'un plan, pour ne pas entamer un lot hors budget
+        for positions, expand in self._candidates():
+            started = time.perf_counter()
+            if deadline is not None and evaluated and started + per_plan * len(positions) > deadline:
+                break
+            score, index = self._best(positions, *threats)
+            if best_score is None or score > best_score:
+                best_score, best_plan = score, expand(index)
+            evaluated += len(positions)
+            per_plan = (time.perf_counter() - started) / len(positions)
+        self.plans_evaluated = evaluated
+        self.plan = best_plan
+        self.action = best_plan[0]
+
+    def _profile(self, slow_ticks):
+        """Chute cumulée (en multiples de la vitesse) après 1..horizon ticks."""
+        offsets = self._profiles.get(slow_ticks)
+        if offsets is None:
+            scales = np.full(self.horizon, float(self.step_scale))
+            scales[:slow_ticks] *= 0.55  # ralenti du power-up "slow", comme Game.update
+            offsets = np.cumsum(scales)
+            self._profiles[slow_ticks] = offsets
+        return offsets
+
+    def _threats(self):
+        """Obstacles qui passent à la hauteur du joueur pendant l'horizon.
+
+        Renvoie (ticks concernés, bornes basse et haute de x du joueur en
+        collision, par tick et par obstacle) ou None s'il n'y en a aucun.
+        Hors de la hauteur du joueur, les bornes sont infinies.
+        """
+        world = self._world()
+        if not len(world):
+            return None
+        tick_rate = 60 / self.step_scale
+        slow_ticks = min(self.horizon, math.ceil(world.slow_timer * tick_rate - 1e-9))
+        key = (self.horizon, slow_ticks, self.step_scale)
+        tops = world.trajectories(key, self._profile(slow_ticks))
+
+        y = self.state.y - self.margin
+        bottom = self.state.y + self.state.height + self.margin
+        vertical = (tops < bottom) & (tops + world.height > y)
+        columns = np.flatnonzero(vertical.any(axis=0))
+        if not columns.size:
+            return None
+        rows = np.flatnonzero(vertical.any(axis=1))
+        vertical = vertical[np.ix_(rows, columns)]
+        # collision quand low < x du joueur < high
+        low = world.x[columns] - self.state.width - self.margin
+        high = world.x[columns] + world.width[columns] + self.margin
+        return rows, np.where(vertical, low, np.inf), np.where(vertical, high, -np.inf)
+
+    def _candidates(self):
+        """Lots (x du joueur après chaque tick, plan n° i -> actions par tick).
+
+        D'abord rester, gauche et droite tenus jusqu'à l'horizon (toujours
+        évalués), puis le plan précédent décalé du temps écoulé depuis, puis
+        les plans à 2, 3, ... segments : un lot par profondeur, évalué d'un
+        coup.
+        """
+        batches = self._batches()
+        yield self._expand_batch(*batches[0])
+        if self.plan:
+            elapsed = self._ticks_per_decision()
+            shifted = self.plan[elapsed:]
+            last = shifted[-1] if shifted else self.plan[-1]
+            plan = shifted + (last,) * (self.horizon - len(shifted))
+            yield self._follow(plan)[None, :], lambda index: plan
+        for batch in batches[1:]:
+            yield self._expand_batch(*batch)
+
+    def _expand_batch(self, sequences, directions, walk):
+        ticks = self.segment_ticks
+        return self._sweep(directions, walk), lambda index: tuple(
+            action for action in sequences[index] for _ in range(ticks)
+        )
+
+    def _batches(self):
+        # plans par segments, identiques d'une décision à l'autre : construits une fois
+        if self._plan_batches is None:
+            self._plan_batches = []
+            for depth in range(1, self.segments + 1):
+                sequences = [
+                    sequence + (sequence[-1],) * (self.segments - depth)
+                    for sequence in itertools.product(ACTIONS, repeat=depth)
+                    # une action répétée en fin de plan : déjà vu à la profondeur précédente
+                    if depth == 1 or sequence[-1] != sequence[-2]
+                ]
+                directions = np.array([[DIRECTIONS[action] for action in plan] for plan in sequences])
+                # déplacement cumulé, en pas du joueur, après chaque tick
+                walk = np.cumsum(np.repeat(directions, self.segment_ticks, axis=1), axis=1)
+                self._plan_batches.append((sequences, directions, walk))
+        return self._plan_batches
+
+    def _ticks_per_decision(self):
+        if not self.decision_rate:
+            return 1
+        return max(1, round(60 / self.step_scale / self.decision_rate))
+
+    def _follow(self, plan):
+        """x du joueur après chaque tick d'un plan quelconque (bornes de l'écran comprises)."""
+        step = self.state.speed * self.step_scale
+        right_limit = self.screen_width - self.state.width
+        positions = self.state.x + step * np.cumsum([DIRECTIONS[action] for action in plan])
+        if positions.min() >= 0 and positions.max() <= right_limit:
+            return positions
+        # un bord est atteint : on rejoue tick par tick
+        x = self.state.x
+        for tick, action in enumerate(plan):
+            x = min(right_limit, max(0, x + DIRECTIONS[action] * step))
+            positions[tick] = x
+        return positions
+
+    def _sweep(self, directions, walk):
+        """Même calcul pour un lot de plans par segments (plans x segments de -1/0/1)."""
+        step = self.state.speed * self.step_scale
+        right_limit = self.screen_width - self.state.width
+        positions = self.state.x + step * walk
+        if positions.min() >= 0 and positions.max() <= right_limit:
+            return positions
+        # au moins un plan touche un bord : bornage segment par segment
+        ramp = step * np.arange(1, self.segment_ticks + 1)
+        x = np.full(len(directions), float(self.state.x))
+        runs = []
+        for segment in directions.T:
+            run = np.clip(x[:, None] + segment[:, None] * ramp, 0, right_limit)
+            x = run[:, -1]
+            runs.append(run)
+        return np.concatenate(runs, axis=1)
+
+    def _best(self, positions, rows, low, high):
+        """Meilleur plan d'un lot : ((ticks survécus, écart minimal, proximité du centre), indice)."""
+        px = positions[:, rows, None]
+        closest = np.maximum(low - px, px - high).min(axis=2)
+        hit = closest < 0
+        first = np.where(hit.any(axis=1), hit.argmax(axis=1), len(rows))
+        survived = np.append(rows, self.horizon)[first]
+        before_hit = np.arange(len(rows)) < first[:, None]
+        clearance = np.minimum(100.0, np.where(before_hit, closest, np.inf).min(axis=1))
+        clearance[survived == 0] = 0.0
+        centre = -np.abs(positions[:, -1] + self.state.width / 2 - self.screen_width / 2)
+        # à score égal, le premier plan du lot (le plus simple) l'emporte
+        index = np.lexsort((-np.arange(len(positions)), centre, clearance, survived))[-1].item()
+        score = (survived[index].item(), clearance[index].item(), centre[index].item())
+        return score, index
@@ -5,8 +5,11 @@ class Player:
     def __init__(self, x, y, name="Joueur", color=(0, 128, 255), controls=None, screen_size=(800, 600)):
         self.x = x
         self.y = y
+        self.prev_x, self.prev_y = x, y  # position au tick précédent (interpolation)
         self.width = 50
         self.height = 50
+        # rectangle de collision mis à jour sur place par get_rect() : aucune allocation par appel
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         self.color = color
         self.base_speed = 5
         self.speed = self.base_speed
@@ -33,6 +36,7 @@ class Player:
         
     def reset(self):
         self.x, self.y = self.spawn_point
+        self.prev_x, self.prev_y = self.spawn_point
         self.score = 0
         self.speed = self.base_speed
         self.speed_boost_time = 0
@@ -43,42 +47,53 @@ class Player:
         self.ammo = self.max_ammo
         self.shape = "rect"
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """Dessine le joueur et renvoie la zone touchée (None s'il est éliminé).
+
+        alpha interpole entre la position du tick précédent et l'actuelle.
+        """
         if not self.alive:
-            return
+            return None
+        if alpha >= 1:
+            x, y = self.x, self.y
+        else:
+            x = int(self.prev_x + (self.x - self.prev_x) * alpha)
+            y = int(self.prev_y + (self.y - self.prev_y) * alpha)
+        drawn = []
         if self.shield_time > 0:
-            pygame.draw.circle(
+            drawn.append(pygame.draw.circle(
                 screen,
                 self.shield_color,
-                (self.x + self.width // 2, self.y + self.height // 2),
+                (x + self.width // 2, y + self.height // 2),
                 self.width + 5,
                 3,
-            )
+            ))
 
         if self.shape == "circle":
-            pygame.draw.circle(
+            drawn.append(pygame.draw.circle(
                 screen,
                 self.color,
-                (self.x + self.width // 2, self.y + self.height // 2),
+                (x + self.width // 2, y + self.height // 2),
                 self.width // 2,
-            )
+            ))
         else:
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+            drawn.append(pygame.draw.rect(screen, self.color, (x, y, self.width, self.height)))
         
         if self.speed_boost_time > 0:
             for i in range(3):
                 offset = (i - 1) * 2
-                pygame.draw.rect(
+                drawn.append(pygame.draw.rect(
                     screen,
                     (255, 255, 0),
-                    (self.x + offset, self.y + offset, self.width, self.height),
+                    (x + offset, y + offset, self.width, self.height),
                     2,
-                )
+                ))
+        return drawn[0].unionall(drawn[1:])
         
-    def move(self, keys):
+    def move(self, keys, step_scale=1):
         if not self.alive:
             return
-        current_speed = self.speed
+        current_speed = self.speed * step_scale
         
         if keys[self.controls["left"]] and self.x > 0:
             self.x -= current_speed
@@ -89,29 +104,32 @@ class Player:
         if keys[self.controls["down"]] and self.y < self.screen_height - self.height:
             self.y += current_speed
 
-    def shoot(self):
-        """Consume ammo to spawn a projectile travelling upward."""
+    def shoot(self, pool=None):
+        """Consume ammo to spawn a projectile travelling upward (from pool if given)."""
         if not self.alive or self.ammo <= 0:
             return None
         self.ammo -= 1
         spawn_x = self.x + self.width // 2 - 5
         spawn_y = self.y - 10
-        return Projectile(spawn_x, spawn_y, owner=self)
+        make = pool.acquire if pool is not None else Projectile
+        return make(spawn_x, spawn_y, owner=self)
     
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        # toujours le même objet : valable jusqu'au prochain déplacement
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
     
-    def update_power_ups(self):
+    def update_power_ups(self, dt=1 / 60):
         if not self.alive:
             return
         if self.speed_boost_time > 0:
-            self.speed_boost_time -= 1 / 60
+            self.speed_boost_time -= dt
             if self.speed_boost_time <= 0:
                 self.speed = self.base_speed
                 self.speed_boost_time = 0
                 
         if self.shield_time > 0:
-            self.shield_time -= 1 / 60
+            self.shield_time -= dt
             if self.shield_time <= 0:
                 self.shield_time = 0
     
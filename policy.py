@@ -0,0 +1,318 @@
+import math
+
+import numpy as np
+
+from ai import SimpleAI
+
+ACTIONS = (None, "left", "right")
+FEATURES = (
+    "centre",  # écart au centre de l'écran, -1 (bord gauche) à 1 (bord droit)
+    "left_room",  # place à gauche, 0 au bord à 1 pour tout l'écran
+    "right_room",
+    "danger_far_left",  # urgence 1 / (1 + secondes avant impact) par bande de look_ahead px
+    "danger_left",
+    "danger_here",
+    "danger_right",
+    "danger_far_right",
+    "power_up_value",  # meilleure valeur calculate_power_up_value, / 10
+    "power_up_dx",  # écart horizontal vers ce power-up, en largeurs d'écran
+    "power_up_dy",
+    "shield",  # 1 si bouclier actif
+    "speed_boost",
+)
+
+_LOADED = {}  # chemin .npz -> Policy, partagée par tous les contrôleurs
+
+
+class Policy:
+    """Politique linéaire ou petit MLP : observations (n x FEATURES) -> scores des ACTIONS.
+
+    layers est une liste de (poids, biais) ; tanh entre deux couches, rien
+    après la dernière. Le fichier .npz contient w0, b0, w1, b1, ...
+    """
+
+    def __init__(self, layers):
+        self.layers = [(np.asarray(w, dtype=np.float64), np.asarray(b, dtype=np.float64)) for w, b in layers]
+        if self.layers[-1][0].shape[1] != len(ACTIONS):
+            raise ValueError(
+                f"la politique doit aller de {len(FEATURES)} observations à {len(ACTIONS)} actions"
+            )
+        for i, (w, b) in enumerate(self.layers):
+            inputs = self.layers[i - 1][0].shape[1] if i else len(FEATURES)
+            if w.shape[0] != inputs or b.shape != (w.shape[1],):
+                raise ValueError(f"couche {i} : dimensions incohérentes {w.shape} / {b.shape}")
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            count = sum(1 for name in data.files if name.startswith("w"))
+            return cls([(data[f"w{i}"], data[f"b{i}"]) for i in range(count)])
+
+    def save(self, path):
+        arrays = {}
+        for i, (w, b) in enumerate(self.layers):
+            arrays[f"w{i}"], arrays[f"b{i}"] = w, b
+        np.savez(path, **arrays)
+
+    @classmethod
+    def random(cls, hidden=(), seed=0):
+        """Poids aléatoires (benchmarks, point de départ d'un entraînement)."""
+        rng = np.random.default_rng(seed)
+        sizes = (len(FEATURES), *hidden, len(ACTIONS))
+        return cls(
+            [(rng.normal(0, 1 / math.sqrt(n), (n, m)), np.zeros(m)) for n, m in zip(sizes, sizes[1:])]
+        )
+
+    @classmethod
+    def default(cls):
+        """Politique linéaire réglée à la main : fuit la bande la plus menacée, revient au centre."""
+        index = {name: i for i, name in enumerate(FEATURES)}
+        w = np.zeros((len(FEATURES), len(ACTIONS)))
+        # colonnes : rester, gauche, droite
+        w[index["danger_here"]] = (-4.0, 2.0, 2.0)
+        w[index["danger_left"]] = (0.0, -3.0, 0.0)
+        w[index["danger_far_left"]] = (0.0, -1.0, 0.0)
+        w[index["danger_right"]] = (0.0, 0.0, -3.0)
+        w[index["danger_far_right"]] = (0.0, 0.0, -1.0)
+        w[index["centre"]] = (0.0, 1.0, -1.0)
+        w[index["left_room"]] = (0.0, 0.5, -0.5)
+        w[index["right_room"]] = (0.0, -0.5, 0.5)
+        w[index["power_up_dx"]] = (0.0, -3.0, 3.0)
+        return cls([(w, np.array([0.3, 0.0, 0.0]))])
+
+    def scores(self, observations):
+        x = observations
+        for i, (w, b) in enumerate(self.layers):
+            x = x @ w + b
+            if i < len(self.layers) - 1:
+                x = np.tanh(x)
+        return x
+
+    def act(self, observations):
+        """Indice dans ACTIONS de la meilleure action, pour chaque ligne."""
+        return self.scores(observations).argmax(axis=1)
+
+
+def load_policy(path=None):
+    """Politique du fichier .npz (None : Policy.default()), chargée une fois par chemin."""
+    policy = _LOADED.get(path)
+    if policy is None:
+        policy = _LOADED[path] = Policy.load(path) if path is not None else Policy.default()
+    return policy
+
+
+class PolicyAI(SimpleAI):
+    """IA pilotée par une Policy sur les observations calculées comme SimpleAI.
+
+    decide_batch() fait décider d'un coup une liste de contrôleurs, même de
+    parties différentes : une ligne d'observations par joueur, une
+    multiplication matricielle par politique. Les actions sont gardées en
+    attente et rendues par le decide() suivant de chaque contrôleur ; sans
+    lot préparé, decide() évalue le joueur seul. weights : fichier .npz
+    (voir Policy), la politique par défaut sinon.
+    """
+
+    _UNSET = object()
+    # en dessous, observe() par joueur (carte incrémentale) coûte moins que observe_batch
+    # (benchmarks/bench_policy.py : autant de décisions par seconde vers 4 joueurs)
+    VECTOR_MIN_ROWS = 4
+
+    def __init__(self, *args, weights=None, policy=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # une seule Policy par fichier : les contrôleurs qui la partagent décident en un lot
+        self.policy = policy if policy is not None else load_policy(weights)
+        self._prepared = self._UNSET
+
+    def reset(self, rng=None):
+        super().reset(rng)
+        self._prepared = self._UNSET
+
+    @property
+    def prepared(self):
+        """Une action attend déjà le prochain decide() (AIScheduler ne la reporte pas)."""
+        return self._prepared is not self._UNSET
+
+    def _choose(self):
+        self.debug_line = None
+        if self._prepared is not self._UNSET:
+            self.action, self._prepared = self._prepared, self._UNSET
+            return
+        observations = np.empty((1, len(FEATURES)))
+        self.observe(observations[0])
+        self.action = ACTIONS[self.policy.act(observations)[0]]
+
+    @classmethod
+    def decide_batch(cls, controllers, worlds):
+        """Prépare l'action de chaque contrôleur, worlds[i] étant l'instantané de sa partie."""
+        pending = [i for i, controller in enumerate(controllers) if controller._prepared is cls._UNSET]
+        if not pending:
+            return
+        batch = [controllers[i] for i in pending]
+        observations = np.empty((len(pending), len(FEATURES)))
+        if len(batch) >= cls.VECTOR_MIN_ROWS:
+            for controller in batch:
+                controller.state = controller.player
+            cls.observe_batch(batch, [worlds[i] for i in pending], observations)
+        else:
+            for row, i in enumerate(pending):
+                controller = controllers[i]
+                controller._pinned, controller.state = worlds[i], controller.player
+                try:
+                    controller.observe(observations[row])
+                finally:
+                    controller._pinned = None
+        groups = {}
+        for row, controller in enumerate(batch):
+            groups.setdefault(id(controller.policy), []).append(row)
+        for rows in groups.values():
+            policy = batch[rows[0]].policy
+            rows = np.array(rows)
+            for row, action in zip(rows.tolist(), policy.act(observations[rows]).tolist()):
+                batch[row]._prepared = ACTIONS[action]
+
+    @staticmethod
+    def observe_batch(controllers, worlds, out):
+        """Remplit out (une ligne de FEATURES par contrôleur), worlds[i] étant l'instantané du i-ème.
+
+        Les colonnes d'obstacles des instantanés sont complétées à la taille
+        du plus grand et indexées par ligne : les cinq bandes de danger de
+        tous les joueurs se calculent en quelques opérations NumPy, quel que
+        soit le nombre de joueurs. Même calcul que DangerMap.earliest (un
+        obstacle compte s'il n'a pas dépassé le bas du joueur, y tronqué, et
+        couvre la bande), aux arrondis près : observe(), pour un joueur
+        seul, garde la carte incrémentale, moins chère qu'une ligne NumPy.
+        """
+        n = len(controllers)
+        states = [controller.state for controller in controllers]
+        rects = [state.get_rect() for state in states]
+        x = np.array([state.x for state in states], dtype=np.float64)
+        width = np.array([state.width for state in states], dtype=np.float64)
+        top = np.array([rect.y for rect in rects], dtype=np.float64)
+        bottom = np.array([rect.bottom for rect in rects], dtype=np.float64)
+        screen = np.array([controller.screen_width for controller in controllers], dtype=np.float64)
+        reach = np.array([controller.look_ahead for controller in controllers], dtype=np.float64)
+
+        centre = x + width / 2
+        right_limit = screen - width
+        out[:, 0] = (centre - screen / 2) / (screen / 2)
+        out[:, 1] = 0.0
+        np.divide(x, right_limit, out=out[:, 1], where=right_limit > 0)
+        out[:, 2] = 1.0 - out[:, 1]
+
+        # bornes des cinq bandes : [x0 - 2r, x0 - r, x0, x1, x1 + r, x1 + 2r]
+        x1 = x + width
+        edges = np.stack((x - 2 * reach, x - reach, x, x1, x1 + reach, x1 + 2 * reach), axis=1)
+        low, high = edges[:, :-1, np.newaxis], edges[:, 1:, np.newaxis]
+
+        # un instantané par partie, partagé par ses joueurs : colonnes complétées à la même taille
+        distinct = {id(world): world for world in worlds}
+        size = max(len(world) for world in distinct.values())
+        if size:
+            if len(distinct) == 1:
+                # une seule partie : ses colonnes servent telles quelles à toutes les lignes
+                world = worlds[0]
+                valid = True
+                values = (world.x, world.width, world.top, world.height, world.speed, world.y)
+                ox, owidth, otop, oheight, ospeed, oy = (value[np.newaxis] for value in values)
+            else:
+                slots = {key: slot for slot, key in enumerate(distinct)}
+                rows = np.array([slots[id(world)] for world in worlds])
+                columns = np.zeros((6, len(slots), size))
+                columns[4] = 1.0  # vitesse des slots vides : pas de division par zéro
+                valid = np.zeros((len(slots), size), dtype=bool)
+                for slot, world in enumerate(distinct.values()):
+                    count = len(world)
+                    values = (world.x, world.width, world.top, world.height, world.speed, world.y)
+                    for column, value in zip(columns, values):
+                        column[slot, :count] = value
+                    valid[slot, :count] = True
+                ox, owidth, otop, oheight, ospeed, oy = columns[:, rows]
+                valid = valid[rows]
+            # obstacles pas encore passés sous le joueur, et leur temps avant d'entrer dans sa rangée
+            near = valid & (otop < bottom[:, np.newaxis])
+            frames = np.maximum(0.0, (top[:, np.newaxis] - oheight + 1 - oy) / ospeed)
+            covers = (ox[:, np.newaxis] < high) & (ox[:, np.newaxis] + owidth[:, np.newaxis] > low)
+            covers &= near[:, np.newaxis]
+            earliest = np.where(covers, frames[:, np.newaxis], np.inf).min(axis=2)
+        else:
+            earliest = np.full((n, 5), np.inf)
+        out[:, 3:8] = 1.0 / (1.0 + earliest / 60)
+
+        out[:, 8:11] = 0.0
+        for row, (controller, world) in enumerate(zip(controllers, worlds)):
+            best, best_value = None, 0.0
+            for power_up in world.power_ups:
+                value = controller.calculate_power_up_value(power_up)
+                if value > best_value:
+                    best, best_value = power_up, value
+            if best is not None:
+                out[row, 8] = best_value / 10
+                out[row, 9] = (best.x + best.width / 2 - centre[row]) / controller.screen_width
+                out[row, 10] = (states[row].y - best.y) / controller.screen_height
+        out[:, 11] = [1.0 if state.shield_time > 0 else 0.0 for state in states]
+        out[:, 12] = [1.0 if state.speed_boost_time > 0 else 0.0 for state in states]
+
+    def observe(self, out):
+        """Remplit out (vecteur de FEATURES) pour l'état et l'instantané courants."""
+        state = self.state
+        width = self.screen_width
+        centre = state.x + state.width / 2
+        right_limit = width - state.width
+        out[0] = (centre - width / 2) / (width / 2)
+        out[1] = state.x / right_limit if right_limit > 0 else 0.0
+        out[2] = 1.0 - out[1]
+
+        x0, x1, reach = state.x, state.x + state.width, self.look_ahead
+        edges = (x0 - 2 * reach, x0 - reach, x0, x1, x1 + reach, x1 + 2 * reach)
+        danger = self._danger_map()
+        rect = state.get_rect() if danger is None else None
+        for slot, (low, high) in enumerate(zip(edges, edges[1:]), start=3):
+            frames = danger.earliest(low, high) if danger is not None else self._earliest(rect, low, high)
+            out[slot] = 1.0 / (1.0 + frames / 60)
+
+        best, best_value = None, 0.0
+        for power_up in self._world().power_ups:
+            value = self.calculate_power_up_value(power_up)
+            if value > best_value:
+                best, best_value = power_up, value
+        if best is None:
+            out[8:11] = 0.0
+        else:
+            out[8] = best_value / 10
+            out[9] = (best.x + best.width / 2 - centre) / width
+            out[10] = (state.y - best.y) / self.screen_height
+        out[11] = 1.0 if state.shield_time > 0 else 0.0
+        out[12] = 1.0 if state.speed_boost_time > 0 else 0.0
+
+    def _earliest(self, rect, low, high):
+        # même calcul que DangerMap.earliest, pour un instantané copié sans carte
+        world = self._world()
+        mask = (world.x < high) & (world.x + world.width > low) & (world.top < rect.bottom)
+        if not mask.any():
+            return math.inf
+        distance = rect.y - world.height[mask] + 1 - world.y[mask]
+        return max(0.0, (distance / world.speed[mask]).min().item())
+
+
+def step_games(games, keys=None):
+    """Avance d'un tick plusieurs parties ; les PolicyAI de toutes les parties décident en un lot."""
+    controllers, worlds = [], []
+    for game in games:
+        if game.in_menu or game.paused or game.game_over or game.in_options:
+            continue
+        tick = game.frame_count + 1  # le tick que update() va jouer
+        world = None
+        for player in game.players:
+            controller = game.ai_controllers[player]
+            if not (player.alive and player.ai_enabled and isinstance(controller, PolicyAI)):
+                continue
+            if not game.ai_scheduler.is_due(controller, tick):
+                continue
+            if world is None:
+                world = game._capture_world(False)
+            controllers.append(controller)
+            worlds.append(world)
+    if controllers:
+        PolicyAI.decide_batch(controllers, worlds)
+    for game in games:
+        game.step(keys)
@@ -4,46 +4,69 @@ import random
 
 class PowerUp:
     TYPES = ["speed", "shield", "points", "slow", "zap", "ammo"]
+    STYLES = {
+        "speed": ((255, 255, 0), "SPD"),
+        "shield": ((0, 200, 255), "SHD"),
+        "points": ((0, 255, 0), "+50"),
+        "slow": ((180, 130, 255), "SLOW"),
+        "zap": ((255, 80, 80), "ZAP"),
+        "ammo": ((255, 200, 120), "AMMO"),
+    }
 
-    def __init__(self):
+    # un sprite par type, construit au premier affichage puis partagé
+    _sprites = {}
+    _font = None
+
+    __slots__ = ("width", "height", "x", "y", "prev_y", "speed", "type", "color", "symbol", "rect")
+
+    def __init__(self, rng=random):
+        self.rect = pygame.Rect(0, 0, 0, 0)  # mis à jour sur place par get_rect()
+        self.reset(rng)
+
+    def reset(self, rng=random):
         self.width = 30
         self.height = 30
-        self.x = random.randint(50, 750 - self.width)
+        self.x = rng.randint(50, 750 - self.width)
         self.y = -self.height
+        self.prev_y = self.y
         self.speed = 3
-        self.type = random.choice(self.TYPES)
+        self.type = rng.choice(self.TYPES)
+        self.color, self.symbol = self.STYLES[self.type]
 
-        if self.type == "speed":
-            self.color = (255, 255, 0)
-            self.symbol = "SPD"
-        elif self.type == "shield":
-            self.color = (0, 200, 255)
-            self.symbol = "SHD"
-        elif self.type == "points":
-            self.color = (0, 255, 0)
-            self.symbol = "+50"
-        elif self.type == "slow":
-            self.color = (180, 130, 255)
-            self.symbol = "SLOW"
-        elif self.type == "zap":
-            self.color = (255, 80, 80)
-            self.symbol = "ZAP"
-        else:  # ammo
-            self.color = (255, 200, 120)
-            self.symbol = "AMMO"
-
-    def update(self):
-        self.y += self.speed
+    @classmethod
+    def sprite(cls, kind):
+        sprite = cls._sprites.get(kind)
+        if sprite is None:
+            sprite = cls._build_sprite(kind)
+            cls._sprites[kind] = sprite
+        return sprite
+
+    @classmethod
+    def _build_sprite(cls, kind):
+        if cls._font is None:
+            cls._font = pygame.font.Font(None, 20)
+        color, symbol = cls.STYLES[kind]
+        text = cls._font.render(symbol, True, (0, 0, 0))
+        # le texte peut déborder du carré (SLOW, AMMO) : le sprite l'inclut
+        size = (max(30, 2 + text.get_width()), max(30, 6 + text.get_height()))
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        sprite.fill(color, (0, 0, 30, 30))
+        sprite.blit(text, (2, 6))
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+
+    def update(self, step_scale=1):
+        self.y += self.speed * step_scale
         return self.y > 600
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        font = pygame.font.Font(None, 20)
-        text = font.render(self.symbol, True, (0, 0, 0))
-        screen.blit(text, (self.x + 2, self.y + 6))
+    def draw(self, screen, alpha=1.0):
+        y = self.y if alpha >= 1 else self.prev_y + (self.y - self.prev_y) * alpha
+        return screen.blit(self.sprite(self.type), (self.x, y))
 
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
 
     def apply_effect(self, player, game):
         if self.type == "speed":
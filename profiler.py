@@ -0,0 +1,134 @@
+import time
+
+import numpy as np
+import pygame
+
+
+class FrameProfiler:
+    """Temps par sous-système sur les dernières frames, affichés en overlay (F3).
+
+    Les phases de la boucle appellent lap(section) : le temps écoulé depuis
+    le lap précédent est attribué à cette section. Désactivé, lap est une
+    méthode vide et begin_frame ne fait qu'un test : le coût reste
+    négligeable. Les frames sont gardées dans un tampon circulaire NumPy
+    (une ligne par frame, une colonne par section plus la durée totale).
+    """
+
+    SECTIONS = ("events", "ai", "entities", "collisions", "particles", "draw", "flip")
+    LABELS = {
+        "events": "évènements",
+        "ai": "IA",
+        "entities": "entités",
+        "collisions": "collisions",
+        "particles": "particules",
+        "draw": "draw",
+        "flip": "flip",
+    }
+
+    def __init__(self, size=600, refresh=15):
+        self.size = size
+        self.refresh = refresh  # frames entre deux mises à jour du texte affiché
+        self.enabled = False
+        self.samples = np.zeros((size, len(self.SECTIONS) + 1))  # ms, dernière colonne : frame
+        self.index = 0
+        self.filled = 0
+        self._columns = {name: i for i, name in enumerate(self.SECTIONS)}
+        self._current = np.zeros(len(self.SECTIONS) + 1)
+        self._last = 0.0
+        self._frame_start = None
+        self._font = None
+        self._lines = []
+        self.lap = self._skip
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.lap = self._lap if self.enabled else self._skip
+        self._frame_start = None
+
+    def _skip(self, section):
+        pass
+
+    def _lap(self, section):
+        now = time.perf_counter()
+        self._current[self._columns[section]] += now - self._last
+        self._last = now
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            # durée totale de la frame précédente, attente du clock.tick comprise
+            self._current[-1] = now - self._frame_start
+            self._store()
+        self._frame_start = now
+        self._last = now
+        self._current[:] = 0.0
+
+    def _store(self):
+        self.samples[self.index] = self._current * 1000
+        self.index = (self.index + 1) % self.size
+        self.filled = min(self.filled + 1, self.size)
+
+    def history(self):
+        """Frames du tampon dans l'ordre chronologique."""
+        if self.filled < self.size:
+            return self.samples[: self.filled]
+        return np.roll(self.samples, -self.index, axis=0)
+
+    def percentiles(self, column=-1):
+        if not self.filled:
+            return 0.0, 0.0, 0.0
+        return tuple(np.percentile(self.samples[: self.filled, column], (50, 95, 99)).tolist())
+
+    def dump_csv(self, path=None):
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        header = "frame," + ",".join(f"{name}_ms" for name in self.SECTIONS) + ",frame_ms"
+        rows = self.history()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(header + "\n")
+            for number, row in enumerate(rows):
+                f.write(f"{number}," + ",".join(f"{value:.4f}" for value in row) + "\n")
+        return path
+
+    def draw(self, screen):
+        """Panneau en haut à droite ; renvoie sa zone (None si désactivé)."""
+        if not self.enabled:
+            return None
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        if not self._lines or self.index % self.refresh == 0:
+            self._lines = self._render_lines()
+
+        width, line_height, graph_height = 230, 16, 60
+        height = 8 + line_height * len(self._lines) + graph_height + 8
+        rect = pygame.Rect(screen.get_width() - width - 10, 40, width, height)
+        screen.fill((0, 0, 0), rect)
+        y = rect.y + 4
+        for surface in self._lines:
+            screen.blit(surface, (rect.x + 6, y))
+            y += line_height
+
+        # courbe des durées de frame, repère à 16,7 ms (60 fps)
+        frames = self.history()[-(width - 12):, -1]
+        graph = pygame.Rect(rect.x + 6, y + 4, width - 12, graph_height)
+        scale = graph_height / 33.3
+        target_y = graph.bottom - int(16.7 * scale)
+        pygame.draw.line(screen, (80, 80, 80), (graph.x, target_y), (graph.right, target_y))
+        if len(frames) > 1:
+            points = [
+                (graph.x + i, graph.bottom - min(graph_height, int(ms * scale)))
+                for i, ms in enumerate(frames.tolist())
+            ]
+            pygame.draw.lines(screen, (0, 255, 120), False, points)
+        return rect
+
+    def _render_lines(self):
+        recent = self.history()[-60:]
+        means = recent.mean(axis=0) if len(recent) else np.zeros(len(self.SECTIONS) + 1)
+        p50, p95, p99 = self.percentiles()
+        texts = [f"frame p50 {p50:.1f} p95 {p95:.1f} p99 {p99:.1f} ms"]
+        texts += [f"{self.LABELS[name]:<12} {means[i]:6.2f} ms" for i, name in enumerate(self.SECTIONS)]
+        texts.append("F3 masquer | F4 export CSV")
+        return [self._font.render(text, True, (230, 230, 230)) for text in texts]
@@ -2,21 +2,30 @@ import pygame
 
 
 class Projectile:
+    __slots__ = ("x", "y", "prev_y", "width", "height", "speed", "color", "owner", "rect")
+
     def __init__(self, x, y, owner=None, speed=12):
+        self.rect = pygame.Rect(0, 0, 0, 0)  # mis à jour sur place par get_rect()
+        self.reset(x, y, owner, speed)
+
+    def reset(self, x, y, owner=None, speed=12):
         self.x = x
         self.y = y
+        self.prev_y = y
         self.width = 10
         self.height = 18
         self.speed = speed
         self.color = (255, 255, 200)
         self.owner = owner
 
-    def update(self):
-        self.y -= self.speed
+    def update(self, step_scale=1):
+        self.y -= self.speed * step_scale
         return self.y + self.height < 0
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def draw(self, screen, alpha=1.0):
+        y = self.y if alpha >= 1 else self.prev_y + (self.y - self.prev_y) * alpha
+        return pygame.draw.rect(screen, self.color, (self.x, y, self.width, self.height))
 
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
@@ -0,0 +1,152 @@
+import json
+import zlib
+
+from batch_game import ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT, ACTION_UP
+from game import Game, InputState
+
+MAGIC = b"JMIREPLAY1\n"
+
+# Un octet par joueur et par tick : déplacements, nombre de tirs, état de l'IA
+MOVES = ((ACTION_LEFT, "left"), (ACTION_RIGHT, "right"), (ACTION_UP, "up"), (ACTION_DOWN, "down"))
+SHOTS_SHIFT = 4  # bits 4-5 : tirs du tick (au plus 3, la réserve de munitions)
+AI_ENABLED = 64
+AI_EXTRA_HIT = 128
+
+
+class ReplayRecorder:
+    """Enregistre les actions d'une session, tick par tick, dans un fichier compact.
+
+    Game appelle start() à chaque nouvelle partie, note_shot() à chaque tir
+    et record() au début de chaque tick simulé. Le fichier contient, pour
+    chaque partie, l'état du générateur aléatoire au départ puis un octet
+    par joueur et par tick, le tout compressé avec zlib.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.games = []  # (en-tête, octets des ticks)
+        self._shots = []
+
+    def start(self, game):
+        version, internal, gauss_next = game.rng.getstate()
+        header = {
+            "seed": game.seed,
+            "rng_state": [version, list(internal), gauss_next],
+            "tick_rate": game.tick_rate,
+            "ai_rate": game.ai_rate,  # cadence des décisions IA : change les parties jouées
+            "active_players": game.active_players,
+            "ai_all_default": game.ai_all_default,
+            "players": len(game.players),
+        }
+        self.games.append((header, bytearray()))
+        self._shots = [0] * len(game.players)
+
+    def note_shot(self, index):
+        if self._shots:
+            self._shots[index] = min(3, self._shots[index] + 1)
+
+    def record(self, game, keys):
+        if not self.games:
+            return
+        frames = self.games[-1][1]
+        for index, player in enumerate(game.players):
+            code = self._shots[index] << SHOTS_SHIFT
+            if player.ai_enabled:
+                code |= AI_ENABLED
+            elif player.alive:
+                for bit, name in MOVES:
+                    if keys[player.controls[name]]:
+                        code |= bit
+            if player.ai_extra_hits > 0:
+                code |= AI_EXTRA_HIT
+            frames.append(code)
+            self._shots[index] = 0
+
+    def save(self):
+        headers = [dict(header, frames=len(frames) // header["players"]) for header, frames in self.games]
+        payload = json.dumps(headers).encode("utf-8") + b"\n"
+        payload += b"".join(bytes(frames) for _, frames in self.games)
+        with open(self.path, "wb") as f:
+            f.write(MAGIC)
+            f.write(zlib.compress(payload, 9))
+
+
+def load_replay(path):
+    """Renvoie la liste des parties enregistrées : (en-tête, octets des ticks)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} n'est pas un replay")
+    payload = zlib.decompress(data[len(MAGIC):])
+    header_line, _, frames = payload.partition(b"\n")
+    games = []
+    offset = 0
+    for header in json.loads(header_line):
+        size = header["frames"] * header["players"]
+        games.append((header, frames[offset : offset + size]))
+        offset += size
+    return games
+
+
+class ReplayPlayer:
+    """Rejoue une partie enregistrée dans le moteur headless, sans limite de fps.
+
+    seek(frame) avance jusqu'au tick demandé ; revenir en arrière relance la
+    partie depuis le début (la simulation est déterministe, rejouer coûte
+    moins cher que de garder des instantanés).
+    """
+
+    def __init__(self, path, game_index=0):
+        self.header, self.frames = load_replay(path)[game_index]
+        self.players = self.header["players"]
+        self.length = self.header["frames"]
+        self.restart()
+
+    def restart(self):
+        header = self.header
+        game = Game(
+            headless=True,
+            seed=header["seed"],
+            tick_rate=header["tick_rate"],
+            ai_rate=header.get("ai_rate"),  # absent des replays plus anciens
+        )
+        game.active_players = header["active_players"]
+        game.ai_all_default = header["ai_all_default"]
+        game.start_game()
+        version, internal, gauss_next = header["rng_state"]
+        game.rng.setstate((version, tuple(internal), gauss_next))
+        self.game = game
+        self.frame = 0
+
+    def step(self):
+        """Rejoue un tick ; renvoie False à la fin de l'enregistrement."""
+        if self.frame >= self.length:
+            return False
+        game = self.game
+        keys = InputState()
+        start = self.frame * self.players
+        for player, code in zip(game.players, self.frames[start : start + self.players]):
+            player.ai_enabled = bool(code & AI_ENABLED)
+            player.ai_extra_hits = 1 if code & AI_EXTRA_HIT else 0
+            for bit, name in MOVES:
+                if code & bit:
+                    keys[player.controls[name]] = True
+            for _ in range((code >> SHOTS_SHIFT) & 3):
+                game.player_shoot(player)
+        game.update(keys)
+        self.frame += 1
+        return True
+
+    def seek(self, frame):
+        frame = max(0, min(frame, self.length))
+        if frame < self.frame:
+            self.restart()
+        while self.frame < frame:
+            self.step()
+
+    def run(self):
+        """Rejoue jusqu'à la fin ; renvoie le nombre de ticks rejoués."""
+        start = self.frame
+        while self.step():
+            pass
+        return self.frame - start
@@ -0,0 +1,141 @@
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+from broadphase import rects_overlap
+from obstacle import ObstacleRef
+
+
+class PlayerState:
+    """Copie figée d'un joueur, lue par une IA qui décide hors du thread principal."""
+
+    __slots__ = ("x", "y", "width", "height", "speed", "shield_time", "speed_boost_time", "rect")
+
+    def __init__(self, x, y, width, height, speed, shield_time, speed_boost_time):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.shield_time = shield_time
+        self.speed_boost_time = speed_boost_time
+        self.rect = None  # construit au premier get_rect(), puis mis à jour sur place
+
+    @classmethod
+    def of(cls, player):
+        return cls(
+            player.x, player.y, player.width, player.height,
+            player.speed, player.shield_time, player.speed_boost_time,
+        )
+
+    def get_rect(self):
+        if self.rect is None:
+            self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        else:
+            self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
+
+
+PowerUpState = namedtuple("PowerUpState", "x y width height type")
+
+
+class WorldSnapshot:
+    """État des obstacles vivants figé pour un tick, partagé par toutes les IA.
+
+    Game.update le construit une fois par tick : positions, tailles,
+    vitesses et centres en colonnes NumPy. Par défaut ce sont des vues sur
+    l'ObstacleField, valables jusqu'au prochain advance()/compact() ;
+    copy=True en fait des copies qui survivent aux ticks suivants. Les
+    temps avant impact ne dépendent que du bas du joueur : ils sont mis en
+    cache par hauteur et donc partagés entre joueurs alignés. power_ups est
+    la liste du jeu telle quelle, ou des PowerUpState figés avec copy=True ;
+    slow_timer est le ralenti restant (secondes) au moment de l'instantané.
+    """
+
+    COLUMNS = ("x", "y", "width", "height", "speed")
+
+    def __init__(self, obstacles, power_ups=(), copy=False, slow_timer=0.0):
+        self.source = obstacles
+        self.slow_timer = slow_timer
+        if copy:
+            power_ups = tuple(
+                PowerUpState(p.x, p.y, p.width, p.height, p.type) for p in power_ups
+            )
+        self.power_ups = power_ups
+        self.version = obstacles.version
+        if obstacles.dead:
+            # indexation avancée : ce sont déjà des copies
+            live = obstacles.live_indices()
+            self.index = live
+            for name in self.COLUMNS:
+                setattr(self, name, getattr(obstacles, name)[live])
+        else:
+            n = obstacles.count
+            self.index = obstacles.index[:n].copy() if copy else obstacles.index[:n]
+            for name in self.COLUMNS:
+                column = getattr(obstacles, name)[:n]
+                setattr(self, name, column.copy() if copy else column)
+        # cartes des dangers par rangée : celles du champ, figées avec copy=True
+        self._danger_maps = (
+            {key: danger_map.frozen() for key, danger_map in obstacles.danger_maps.items()}
+            if copy
+            else None
+        )
+        self.center_x = self.x + self.width / 2
+        self._top = None
+        self._times = {}
+        self._trajectories = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def is_current(self, obstacles):
+        return self.source is obstacles and self.version == obstacles.version
+
+    def obstacle(self, position):
+        # vue paresseuse sur les colonnes de l'instantané, comme ObstacleRef sur le champ
+        return ObstacleRef(self, position)
+
+    def danger(self, top, bottom):
+        """DangerMap de la rangée [top, bottom) (None si un instantané copié ne l'a pas)."""
+        if self._danger_maps is None:
+            return self.source.danger_map(top, bottom)
+        return self._danger_maps.get((top, bottom))
+
+    def times_to_impact(self, bottom):
+        """Temps (en frames) avant que chaque obstacle atteigne la hauteur bottom."""
+        times = self._times.get(bottom)
+        if times is None:
+            times = np.full(len(self.y), np.inf)
+            np.divide(self.y - bottom, self.speed, out=times, where=self.speed > 0)
+            self._times[bottom] = times
+        return times
+
+    def trajectories(self, key, offsets):
+        """y de chaque obstacle aux ticks à venir : y + vitesse * offsets[t].
+
+        offsets est le profil de chute cumulé (ralenti compris) ; le
+        résultat (ticks x obstacles) est gardé par clé pour tout le tick.
+        """
+        positions = self._trajectories.get(key)
+        if positions is None:
+            positions = self.y + np.multiply.outer(offsets, self.speed)
+            self._trajectories[key] = positions
+        return positions
+
+    @property
+    def top(self):
+        # y tronqué comme pygame.Rect, calculé au premier test de rectangle
+        if self._top is None:
+            self._top = self.y.astype(np.int64)
+        return self._top
+
+    def overlapping(self, rect):
+        """Masque des obstacles qui touchent rect (même test que colliderect)."""
+        return rects_overlap(
+            self.x, self.top, self.width, self.height, rect.x, rect.y, rect.width, rect.height
+        )
+
+    def collides(self, rect):
+        return bool(self.overlapping(rect).any())
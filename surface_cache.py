@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfaceCache:
+    """Cache LRU des surfaces unies (overlays, bandeaux), clé (taille, couleur, alpha).
+
+    Chaque surface est créée, convertie au format de l'écran et remplie une
+    seule fois, puis réutilisée à chaque frame. resize() vide le cache quand
+    la taille de l'écran change.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self.screen_size = None
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def resize(self, screen_size):
+        if screen_size != self.screen_size:
+            self.screen_size = screen_size
+            self._surfaces.clear()
+
+    def filled(self, size, color, alpha=None):
+        """Surface de taille size remplie de color, transparence globale alpha."""
+        key = (size, tuple(color), alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
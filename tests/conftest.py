@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# pygame sans fenêtre ni carte son
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    # highscore.json et autres fichiers écrits par le jeu restent hors du dépôt
+    monkeypatch.chdir(tmp_path)
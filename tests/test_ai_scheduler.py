@@ -0,0 +1,59 @@
+import time
+from types import SimpleNamespace
+
+from ai_scheduler import AIScheduler
+
+
+class SlowController:
+    decision_rate = None
+
+    def __init__(self, name, seconds):
+        self.name = name
+        self.seconds = seconds
+        self.applied = []
+        self.finished = 0
+        self.player = SimpleNamespace(x=0, y=0, width=50, height=50, speed=5, shield_time=0, speed_boost_time=0)
+
+    def decide(self, world, state=None):
+        time.sleep(self.seconds)
+        self.finished += 1
+        return self.name
+
+    def apply(self, action):
+        self.applied.append(action)
+
+
+def test_frame_budget_defers_remaining_controllers():
+    scheduler = AIScheduler(budget_ms=2.0)
+    controllers = [SlowController(name, 0.003) for name in "abc"]
+    for tick in range(1, 4):
+        scheduler.step(controllers, tick, 60, lambda copy: None)
+        # une décision de 3 ms épuise le budget : les deux autres sont reportées
+        assert scheduler.decisions == tick
+        assert scheduler.deferred == 2 * tick
+        assert sum(c.finished for c in controllers) == tick
+    # les reportés passent en premier : chacun décide à son tour
+    assert [c.applied for c in controllers] == [["a", "a", "a"], [None, "b", "b"], [None, None, "c"]]
+    assert scheduler.deferred == 6
+
+
+def test_without_budget_every_controller_decides():
+    scheduler = AIScheduler()
+    controllers = [SlowController(name, 0.003) for name in "abc"]
+    scheduler.step(controllers, 1, 60, lambda copy: None)
+    assert [c.applied for c in controllers] == [["a"], ["b"], ["c"]]
+    assert scheduler.deferred == 0
+
+
+def test_reset_waits_for_running_decisions():
+    scheduler = AIScheduler(workers=1, budget_ms=1.0)
+    controller = SlowController("a", 0.05)
+    try:
+        scheduler.step([controller], 1, 60, lambda copy: None)
+        assert scheduler.pending(controller)
+        scheduler.reset()
+        # decide() a fini avant que reset_game ne réinitialise le contrôleur
+        assert controller.finished == 1
+        assert not scheduler.pending(controller)
+    finally:
+        scheduler.close()
@@ -0,0 +1,157 @@
+import itertools
+import json
+import os
+import struct
+import time
+import wave
+
+import pygame
+import pytest
+
+from audio_cache import AudioCache
+
+NAMES = ("hit", "zap", "click")
+
+
+@pytest.fixture
+def mixer():
+    pygame.mixer.init(frequency=44100)
+    yield
+    pygame.mixer.quit()
+
+
+@pytest.fixture
+def sfx(tmp_path):
+    directory = tmp_path / "sfx"
+    directory.mkdir()
+    return directory
+
+
+def write_wav(path, amplitude, frames=2205):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(22050)
+        f.writeframes(struct.pack(f"<{frames}h", *[amplitude * (i % 50 - 25) for i in range(frames)]))
+
+
+_ages = itertools.count(1)
+
+
+def settle(*paths):
+    # dates dans le passé, toutes différentes : le cache peut s'y fier (hors de RACY_NS)
+    for path in paths:
+        stamp = time.time() - 3600 + next(_ages)
+        os.utime(path, (stamp, stamp))
+
+
+def load(sfx):
+    cache = AudioCache(sfx_dir=str(sfx))
+    sounds = dict(cache.load(NAMES))
+    return cache, sounds
+
+
+def manifest(sfx):
+    with open(sfx.parent / ".cache" / "manifest.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pcm_files(sfx):
+    return sorted(name for name in os.listdir(sfx.parent / ".cache") if name.endswith(".pcm"))
+
+
+def test_cache_reuses_and_invalidates(mixer, sfx):
+    write_wav(sfx / "hit.wav", 100)
+    write_wav(sfx / "zap.wav", 200)
+    settle(sfx / "hit.wav", sfx / "zap.wav", sfx)
+
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (0, 2)
+    assert sorted(sounds) == ["hit", "zap"]
+    assert manifest(sfx)["missing"] == ["click"]
+    raw = {name: sound.get_raw() for name, sound in sounds.items()}
+
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (2, 0)
+    assert {name: sound.get_raw() for name, sound in sounds.items()} == raw
+
+    settle(sfx / "zap.wav")  # nouvelle date, même contenu
+    cache, _ = load(sfx)
+    assert (cache.hits, cache.decoded) == (2, 0)
+
+    write_wav(sfx / "zap.wav", 300)
+    settle(sfx / "zap.wav")
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (1, 1)
+    assert sounds["zap"].get_raw() != raw["zap"]
+    assert len(pcm_files(sfx)) == 2  # l'ancien PCM de zap est supprimé
+
+    write_wav(sfx / "click.wav", 50)
+    settle(sfx / "click.wav", sfx)
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (2, 1)
+    assert "click" in sounds and manifest(sfx)["missing"] == []
+
+    os.remove(sfx / "click.wav")
+    settle(sfx)
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (2, 0)
+    assert "click" not in sounds and manifest(sfx)["missing"] == ["click"]
+    assert len(pcm_files(sfx)) == 2
+
+
+def test_recent_change_with_same_size_and_date_is_detected(mixer, sfx):
+    write_wav(sfx / "hit.wav", 100)
+    load(sfx)
+    stat = os.stat(sfx / "hit.wav")
+    write_wav(sfx / "hit.wav", 101)  # même taille
+    os.utime(sfx / "hit.wav", ns=(stat.st_atime_ns, stat.st_mtime_ns))  # même date, dans la graduation
+    cache, _ = load(sfx)
+    assert (cache.hits, cache.decoded) == (0, 1)
+
+
+def test_mixer_format_change_redecodes(sfx):
+    write_wav(sfx / "hit.wav", 100)
+    settle(sfx / "hit.wav", sfx)
+    pygame.mixer.init(frequency=44100)
+    try:
+        load(sfx)
+    finally:
+        pygame.mixer.quit()
+    pygame.mixer.init(frequency=22050)
+    try:
+        cache, _ = load(sfx)
+        assert (cache.hits, cache.decoded) == (0, 1)
+        assert manifest(sfx)["format"][0] == 22050
+        assert pcm_files(sfx) == [name for name in pcm_files(sfx) if "-22050-" in name]
+        cache, _ = load(sfx)
+        assert (cache.hits, cache.decoded) == (1, 0)
+    finally:
+        pygame.mixer.quit()
+
+
+def test_corrupt_manifest_rebuilds_cache(mixer, sfx):
+    write_wav(sfx / "hit.wav", 100)
+    settle(sfx / "hit.wav", sfx)
+    load(sfx)
+    (sfx.parent / ".cache" / "manifest.json").write_text("{pas du json", encoding="utf-8")
+    cache, sounds = load(sfx)
+    assert (cache.hits, cache.decoded) == (0, 1)
+    assert "hit" in sounds
+    cache, _ = load(sfx)
+    assert (cache.hits, cache.decoded) == (1, 0)
+
+
+def test_unwritable_cache_still_serves_sounds(mixer, sfx, tmp_path):
+    write_wav(sfx / "hit.wav", 100)
+    write_wav(sfx / "zap.wav", 200)
+    settle(sfx / "hit.wav", sfx / "zap.wav", sfx)
+    blocker = tmp_path / "blocker"
+    blocker.write_bytes(b"")  # un fichier : aucun dossier ne peut être créé dessous
+
+    for _ in range(2):
+        cache = AudioCache(sfx_dir=str(sfx), cache_dir=str(blocker / ".cache"))
+        sounds = dict(cache.load(NAMES))
+        assert sorted(sounds) == ["hit", "zap"]
+        assert (cache.hits, cache.decoded) == (0, 2)
+    assert blocker.read_bytes() == b""
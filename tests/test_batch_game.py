@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+
+from batch_game import ACTION_DOWN, ACTION_LEFT, ACTION_RIGHT, ACTION_SHOOT, ACTION_UP, BatchGame
+from game import Game, InputState
+
+MOVES = ((ACTION_LEFT, "left"), (ACTION_RIGHT, "right"), (ACTION_UP, "up"), (ACTION_DOWN, "down"))
+
+
+def scalar_games(seeds):
+    games = []
+    for seed in seeds:
+        game = Game(headless=True, rng=random.Random(seed))
+        game.start_game()
+        for player in game.players:
+            player.ai_extra_hits = 0
+        games.append(game)
+    return games
+
+
+def apply(game, actions):
+    # ACTION_SHOOT est un tir du tick, comme l'évènement KEYDOWN : tiré avant update(), à la façon de ReplayPlayer
+    keys = InputState()
+    for player, action in zip(game.players, actions):
+        for bit, name in MOVES:
+            if action & bit:
+                keys[player.controls[name]] = True
+        if action & ACTION_SHOOT:
+            game.player_shoot(player)
+    game.update(keys)
+
+
+def test_batch_matches_scalar_games_every_tick():
+    seeds = list(range(100, 108))
+    batch = BatchGame(len(seeds), seeds=seeds)
+    games = scalar_games(seeds)
+    actions_rng = np.random.default_rng(0)
+    for tick in range(1500):
+        actions = actions_rng.integers(0, 32, size=(len(seeds), batch.n_players))
+        batch.step(actions)
+        for index, game in enumerate(games):
+            apply(game, actions[index])
+            where = f"partie {index}, tick {tick}"
+            assert batch.px[index].tolist() == [player.x for player in game.players], where
+            assert batch.score[index].tolist() == [player.score for player in game.players], where
+            assert batch.alive[index].tolist() == [player.alive for player in game.players], where
+            assert batch.game_over[index] == game.game_over, where
+            count = batch.obstacle_count[index]
+            assert count == len(game.obstacles), where
+            assert batch.obstacles["x"][index, :count].tolist() == [obstacle.x for obstacle in game.obstacles], where
+            assert batch.obstacles["y"][index, :count].tolist() == [obstacle.y for obstacle in game.obstacles], where
+    assert batch.game_over.any()  # les parties vont jusqu'aux collisions, pas seulement au début
@@ -0,0 +1,90 @@
+import random
+
+import pygame
+
+from game import Game, InputState
+from obstacle import Obstacle, ObstacleField
+from powerup import PowerUp
+from projectile import Projectile
+from snapshot import PlayerState
+
+
+def expected(entity):
+    return pygame.Rect(entity.x, entity.y, entity.width, entity.height)
+
+
+def test_get_rect_reuses_one_rect_that_follows_the_entity():
+    rng = random.Random(0)
+    entities = [Obstacle(rng), PowerUp(rng), Projectile(400, 500)]
+    rects = [entity.get_rect() for entity in entities]
+    for _ in range(20):
+        for entity in entities:
+            entity.y += 3.7  # y flottant : tronqué comme pygame.Rect
+            entity.x += 1
+        for entity, rect in zip(entities, rects):
+            assert entity.get_rect() is rect
+            assert rect == expected(entity)
+
+
+def test_views_reuse_their_rect():
+    field = ObstacleField()
+    field.add(100, 10.5, 40, 30, 4, (255, 0, 0))
+    view = field[0]
+    state = PlayerState(300, 500.7, 50, 50, 5, 0, 0)
+    for entity in (view, state):
+        rect = entity.get_rect()
+        assert entity.get_rect() is rect
+        assert rect == expected(entity)
+    field.advance()
+    assert view.get_rect() == expected(view)
+
+
+def test_player_rect_follows_moves_in_game():
+    game = Game(headless=True, seed=0)
+    game.start_game()
+    player = game.players[0]
+    rect = player.get_rect()
+    keys = InputState({player.controls["left"]: True, player.controls["up"]: True})
+    start = (player.x, player.y)
+    for _ in range(30):
+        game.step(keys)
+        assert player.get_rect() is rect
+        assert rect == expected(player)
+    assert (player.x, player.y) != start
+
+
+def test_dense_frames_build_almost_no_rects(monkeypatch):
+    # même champ que benchmarks/bench_rect_alloc.py : 40 obstacles, 6 power-ups, tirs réguliers
+    game = Game(headless=True, seed=0)
+    game.ai_all_default = True
+    game.start_game()
+    game.run_headless(max_frames=120)
+    built = []
+    original = pygame.Rect
+
+    class CountingRect(original):
+        def __init__(self, *args):
+            built.append(args)
+            super().__init__(*args)
+
+    monkeypatch.setattr(pygame, "Rect", CountingRect)
+    frames = 200
+    for tick in range(frames):
+        if game.game_over:
+            game.reset_game(start_immediately=True)
+        while len(game.obstacles) < 40:
+            obstacle = game.obstacle_pool.acquire(game.rng)
+            obstacle.y = game.rng.uniform(-obstacle.height, game.screen_height / 2)
+            game.obstacles.append(obstacle)
+            game.obstacle_pool.release(obstacle)
+        while len(game.power_ups) < 6:
+            game.power_ups.append(game.power_up_pool.acquire(game.rng))
+        if tick % 5 == 0:
+            for player in game.players:
+                player.ammo = player.max_ammo
+                game.player_shoot(player)
+        game.step()
+    game.close()
+    # seules les entités neuves des pools en construisent un (8,5 par frame avant réutilisation)
+    assert game.ai_scheduler.decisions > 0
+    assert len(built) < frames * 0.2
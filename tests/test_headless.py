@@ -0,0 +1,23 @@
+import pytest
+
+from game import Game, InputState
+
+
+def test_run_headless_in_menu_needs_a_frame_limit():
+    game = Game(headless=True, seed=1)
+    with pytest.raises(RuntimeError):
+        game.run_headless()
+    assert game.run_headless(max_frames=5)["frames"] == 5
+
+
+def test_held_shoot_key_fires_once():
+    game = Game(headless=True, seed=1)
+    game.start_game()
+    player = game.players[0]
+    shoot = InputState({player.controls["shoot"]: True})
+    for _ in range(10):
+        game.step(shoot)
+    assert player.ammo == player.max_ammo - 1
+    game.step()
+    game.step(shoot)
+    assert player.ammo == player.max_ammo - 2
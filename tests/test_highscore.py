@@ -0,0 +1,49 @@
+import json
+import time
+
+import highscore
+from highscore import HighScoreStore
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "le thread d'écriture n'a pas écrit"
+        time.sleep(0.001)
+
+
+def test_session_writes_once_per_interval_plus_game_over(tmp_path):
+    path = tmp_path / "highscore.json"
+    store = HighScoreStore(str(path), min_interval=60.0)
+    store.set(1)
+    wait_for(lambda: store.writes == 1)  # premier record : écrit tout de suite
+    for score in range(2, 600):  # dix secondes de records à 60 fps, dans le même intervalle
+        store.set(score)
+    assert store.writes == 1
+    store.flush()  # fin de partie
+    store.close()
+    assert store.writes == 2
+    assert json.loads(path.read_text(encoding="utf-8")) == {"high_score": 599}
+    assert HighScoreStore(str(path)).value == 599
+
+
+def test_interrupted_replace_keeps_previous_record(tmp_path, monkeypatch):
+    path = tmp_path / "highscore.json"
+    store = HighScoreStore(str(path))
+    store.set(42)
+    store.close()  # thread arrêté : les écritures suivantes passent par flush()
+
+    def interrupted(src, dst):
+        raise OSError("coupure pendant os.replace")
+
+    monkeypatch.setattr(highscore.os, "replace", interrupted)
+    store.set(99)
+    store.flush()
+    assert store.writes == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == {"high_score": 42}
+    assert not (tmp_path / "highscore.json.tmp").exists()
+    monkeypatch.undo()
+    assert HighScoreStore(str(path)).value == 42
+    store.close()  # la valeur ratée est restée en attente : réécrite ici
+    assert store.writes == 2
+    assert HighScoreStore(str(path)).value == 99
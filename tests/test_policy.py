@@ -0,0 +1,35 @@
+import numpy as np
+
+from game import Game
+from policy import FEATURES, PolicyAI
+
+
+def test_observe_batch_matches_observe_per_player():
+    games = []
+    for seed in range(4):
+        game = Game(headless=True, seed=seed, ai_kind="policy")
+        game.ai_all_default = True
+        game.start_game()
+        games.append(game)
+    for tick in range(900):
+        for game in games:
+            game.step()
+        if tick % 10:
+            continue
+        controllers, worlds = [], []
+        for game in games:
+            world = game._capture_world(False)
+            for player in game.players:
+                if player.alive:
+                    controllers.append(game.ai_controllers[player])
+                    worlds.append(world)
+        for controller in controllers:
+            controller.state = controller.player
+        batch = np.empty((len(controllers), len(FEATURES)))
+        PolicyAI.observe_batch(controllers, worlds, batch)
+        single = np.empty_like(batch)
+        for row, (controller, world) in enumerate(zip(controllers, worlds)):
+            controller._pinned = world
+            controller.observe(single[row])
+            controller._pinned = None
+        np.testing.assert_allclose(batch, single, rtol=0, atol=1e-9)
@@ -0,0 +1,21 @@
+import pytest
+
+from game import Game
+from replay import ReplayPlayer, ReplayRecorder
+
+
+@pytest.mark.parametrize("ai_rate", [None, 7])
+def test_replay_reproduces_recorded_game(tmp_path, ai_rate):
+    path = str(tmp_path / "partie.replay")
+    game = Game(headless=True, seed=3, ai_rate=ai_rate)
+    game.recorder = ReplayRecorder(path)
+    game.ai_all_default = True
+    game.start_game()
+    game.run_headless(max_frames=20000)
+    assert game.game_over  # le replay est écrit à la fin de la partie
+
+    replay = ReplayPlayer(path)
+    replay.run()
+    assert replay.game.game_over
+    assert [p.score for p in replay.game.players] == [p.score for p in game.players]
+    assert [(p.x, p.y) for p in replay.game.players] == [(p.x, p.y) for p in game.players]
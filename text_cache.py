@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Cache LRU des surfaces de texte, clé (police, texte, couleur, antialias).
+
+    Les libellés fixes ne sont rendus qu'une fois ; les libellés dynamiques
+    seulement quand leur valeur change. hits/misses mesurent l'efficacité.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias, color):
+        """Même signature que font.render, précédée de la police."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
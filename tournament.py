@@ -0,0 +1,268 @@
+"""Tournoi d'IA et balayage de paramètres sur plusieurs cœurs.
+
+Chaque variante (contrôleur + jeu de paramètres de SimpleAI.PARAMETERS)
+joue les mêmes parties headless à graine fixe, réparties sur un
+ProcessPoolExecutor. Chaque partie ajoute une ligne par joueur au CSV
+dès qu'elle se termine : ticks de survie, score, ticks joués, décisions
+et temps CPU moyen par décision. Relancé avec le même --output, le
+tournoi reprend là où il s'était arrêté : les parties déjà présentes
+dans le fichier ne sont pas rejouées.
+
+Usage :
+    python tournament.py --games 20 --param near_window=2 --param near_window=3 --param near_window=4
+    python tournament.py --ai simple planner --planner-budget-us 500 1000 --output tournoi.csv
+    python tournament.py --param 'power_up_values={"shield": 8, "speed": 3, "points": 1}'
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import signal
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from ai import SimpleAI  # noqa: E402
+from game import AI_KINDS, Game  # noqa: E402
+
+FIELDS = (
+    "ai", "params", "seed", "player", "survival_frames", "score",
+    "frames", "decisions", "decide_cpu_us", "wall_seconds",
+)
+
+
+def timed(decide, totals):
+    def wrapper(*args, **kwargs):
+        start = time.process_time()
+        try:
+            return decide(*args, **kwargs)
+        finally:
+            totals[0] += time.process_time() - start
+            totals[1] += 1
+
+    return wrapper
+
+
+def timed_batches(prepare, totals):
+    """AIScheduler._prepare chronométré : le coût d'un lot (PolicyAI) est réparti entre les joueurs servis."""
+    def wrapper(due, world):
+        start = time.process_time()
+        try:
+            return prepare(due, world)
+        finally:
+            served = [controller for controller in due if getattr(controller, "prepared", False)]
+            if served:
+                share = (time.process_time() - start) / len(served)
+                for controller in served:
+                    totals[controller.player][0] += share
+
+    return wrapper
+
+
+def play(task):
+    """Joue une partie (exécuté dans un processus du pool) ; renvoie ses lignes de résultats."""
+    params = json.loads(task["params"])
+    game = Game(
+        headless=True,
+        seed=task["seed"],
+        ai_kind=task["kind"],
+        ai_options={**task["options"], "params": params},
+    )
+    game.ai_all_default = True
+    game.start_game()
+    totals = {}
+    for player, controller in game.ai_controllers.items():
+        totals[player] = [0.0, 0]
+        controller.decide = timed(controller.decide, totals[player])
+    game.ai_scheduler._prepare = timed_batches(game.ai_scheduler._prepare, totals)
+    survival = {}
+    start = time.perf_counter()
+    while not game.game_over and game.frame_count < task["frames"]:
+        game.step()
+        for player in game.players:
+            if not player.alive:
+                survival.setdefault(player, game.frame_count)
+    wall = time.perf_counter() - start
+    game.ai_scheduler.close()
+
+    rows = []
+    for player in game.players:
+        seconds, decisions = totals.get(player, (0.0, 0))
+        rows.append({
+            "ai": task["ai"],
+            "params": task["params"],
+            "seed": task["seed"],
+            "player": player.name,
+            "survival_frames": survival.get(player, game.frame_count),
+            "score": player.score,
+            "frames": game.frame_count,
+            "decisions": decisions,
+            "decide_cpu_us": round(seconds * 1e6 / decisions, 2) if decisions else 0.0,
+            "wall_seconds": round(wall, 3),
+        })
+    return rows
+
+
+def parse_params(specs):
+    """--param nom=valeur (JSON), répétable : chaque nom donne un axe de la grille."""
+    axes = {}
+    for spec in specs:
+        name, sep, raw = spec.partition("=")
+        if not sep:
+            raise ValueError(f"--param attend nom=valeur : {spec!r}")
+        if name not in SimpleAI.PARAMETERS:
+            raise ValueError(f"paramètre inconnu : {name} (connus : {', '.join(SimpleAI.PARAMETERS)})")
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"valeur JSON invalide pour {name} : {raw!r}") from exc
+        axes.setdefault(name, []).append(value)
+    names = sorted(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[name] for name in names))]
+
+
+def variants(args):
+    """(étiquette, contrôleur, options du contrôleur) de chaque IA demandée."""
+    result = []
+    for kind in args.ai:
+        if kind == "planner":
+            result += [(f"planner/{budget}us", kind, {"budget_us": budget}) for budget in args.planner_budget_us]
+        else:
+            result.append((kind, kind, {}))
+    return result
+
+
+def load_done(path, players):
+    """Relit un CSV existant et renvoie les parties complètes (ai, params, seed).
+
+    Une dernière ligne tronquée (arrêt brutal) et les lignes des parties
+    incomplètes sont retirées du fichier, pour être rejouées proprement.
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="", encoding="utf-8") as f:
+        text = f.read()
+    if not text.endswith("\n"):
+        text = text[: text.rfind("\n") + 1]
+    rows = list(csv.DictReader(text.splitlines()))
+    counts = {}
+    for row in rows:
+        key = (row["ai"], row["params"], int(row["seed"]))
+        counts[key] = counts.get(key, 0) + 1
+    done = {key for key, count in counts.items() if count >= players}
+    kept = [row for row in rows if (row["ai"], row["params"], int(row["seed"])) in done]
+    if len(kept) != len(rows) or not text.endswith("\n") or not rows:
+        temp = f"{path}.tmp"
+        with open(temp, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(kept)
+        os.replace(temp, path)
+    return done
+
+
+def summarize(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    groups = {}
+    for row in rows:
+        groups.setdefault((row["ai"], row["params"]), []).append(row)
+    print(f"{'IA':>16} | {'survie moy.':>11} | {'survie min':>10} | {'score moy.':>10} | {'decide':>9} | paramètres")
+    for (ai, params), group in sorted(groups.items()):
+        survivals = [int(row["survival_frames"]) for row in group]
+        decisions = sum(int(row["decisions"]) for row in group)
+        cpu = sum(float(row["decide_cpu_us"]) * int(row["decisions"]) for row in group)
+        print(
+            f"{ai:>16} | {statistics.mean(survivals) / 60:9.1f} s | {min(survivals) / 60:8.1f} s"
+            f" | {statistics.mean(int(row['score']) for row in group):10.1f}"
+            f" | {cpu / decisions if decisions else 0.0:6.1f} µs | {params}"
+        )
+
+
+def ignore_interrupt():
+    # Ctrl-C est géré par le processus principal : les parties en cours se terminent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ai", nargs="+", choices=sorted(AI_KINDS), default=["simple"])
+    parser.add_argument("--param", action="append", default=[], metavar="NOM=VALEUR")
+    parser.add_argument(
+        "--planner-budget-us", type=int, nargs="+", default=[1000], help="budgets du planificateur (µs)"
+    )
+    parser.add_argument("--games", type=int, default=10, help="parties par variante")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--frames", type=int, default=36000, help="ticks max par partie (60 par seconde)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processus de jeu")
+    parser.add_argument("--output", default="tournament.csv", help="CSV des résultats (repris s'il existe)")
+    args = parser.parse_args()
+    try:
+        grid = parse_params(args.param)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    players = 2  # ai_all_default : les deux joueurs sont des IA
+    done = load_done(args.output, players)
+    tasks = [
+        {
+            "ai": label,
+            "kind": kind,
+            "options": options,
+            "params": json.dumps(params, sort_keys=True),
+            "seed": args.seed + index,
+            "frames": args.frames,
+        }
+        for label, kind, options in variants(args)
+        for params in grid
+        for index in range(args.games)
+    ]
+    todo = [task for task in tasks if (task["ai"], task["params"], task["seed"]) not in done]
+    print(f"{len(tasks)} parties, {len(tasks) - len(todo)} déjà jouées, {args.workers} processus")
+
+    new_file = not os.path.exists(args.output)
+    with open(args.output, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, FIELDS)
+        if new_file:
+            writer.writeheader()
+        pool = ProcessPoolExecutor(args.workers, initializer=ignore_interrupt)
+        futures = [pool.submit(play, task) for task in todo]
+        finished = 0
+        interrupted = False
+        while futures:
+            try:
+                for future in as_completed(futures):
+                    futures.remove(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        rows = future.result()
+                    except Exception as exc:  # une partie qui plante ne doit pas arrêter le tournoi
+                        print(f"\nPartie en échec : {exc!r}")
+                        continue
+                    writer.writerows(rows)
+                    f.flush()
+                    finished += 1
+                    print(f"\r{finished}/{len(todo)} parties", end="", flush=True)
+            except KeyboardInterrupt:
+                if interrupted:
+                    raise
+                # les parties en cours sont terminées et enregistrées, les autres annulées
+                interrupted = True
+                print("\nInterruption : fin des parties en cours (Ctrl-C à nouveau pour abandonner).")
+                for future in futures:
+                    future.cancel()
+        pool.shutdown()
+    print()
+    if interrupted:
+        print("Relancer la même commande pour reprendre le tournoi.")
+        return
+    print()
+    summarize(args.output)
+
+
+if __name__ == "__main__":
+    main()